@@ -9,6 +9,7 @@ have both electronic and image-based pages.
 
 import logging
 import pdfplumber
+from contextlib import nullcontext
 from pathlib import Path
 from typing import Literal, Tuple
 
@@ -17,7 +18,8 @@ logger = logging.getLogger(__name__)
 DocumentType = Literal["electronic", "scanned", "hybrid", "unknown"]
 
 
-def classify_document(pdf_path: str | Path, sample_pages: int = 5, min_chars_per_page: int = 100) -> Tuple[DocumentType, dict]:
+def classify_document(pdf_path: str | Path, sample_pages: int = 5, min_chars_per_page: int = 100,
+                      pdf=None) -> Tuple[DocumentType, dict]:
     """
     Classify a PDF document as electronic, scanned, or hybrid.
 
@@ -25,6 +27,8 @@ def classify_document(pdf_path: str | Path, sample_pages: int = 5, min_chars_per
         pdf_path: Path to the PDF file
         sample_pages: Number of pages to sample for classification
         min_chars_per_page: Minimum average characters per page to be considered electronic
+        pdf: Already-open pdfplumber PDF of pdf_path to read instead of
+            opening the file again (left open)
 
     Returns:
         Tuple of (document_type, metadata_dict)
@@ -38,7 +42,7 @@ def classify_document(pdf_path: str | Path, sample_pages: int = 5, min_chars_per
         raise FileNotFoundError(f"PDF not found: {pdf_path}")
 
     try:
-        with pdfplumber.open(pdf_path) as pdf:
+        with nullcontext(pdf) if pdf is not None else pdfplumber.open(pdf_path) as pdf:
             page_count = len(pdf.pages)
 
             # Analyze ALL pages to detect hybrid documents
@@ -7,6 +7,7 @@ content_validator.py, and quality.py.
 """
 
 import re
+import string
 from typing import Optional
 
 
@@ -157,6 +158,14 @@ def deduplicate_activities(activities: list, use_prefix: bool = False) -> list:
     return unique
 
 
+# Characters that never count as special in calculate_special_char_ratio
+_ORDINARY_CHARS = ' .,;:!?()-\'\"'
+
+# Deletes the ASCII letters, digits and ordinary characters, so that only
+# ASCII specials and non-ASCII characters are left to classify
+_DROP_ORDINARY_ASCII = str.maketrans('', '', string.ascii_letters + string.digits + _ORDINARY_CHARS)
+
+
 def calculate_special_char_ratio(text: str) -> float:
     """
     Calculate ratio of special characters in text.
@@ -170,7 +179,11 @@ def calculate_special_char_ratio(text: str) -> float:
     if not text:
         return 0.0
 
-    special = sum(1 for c in text if not c.isalnum() and c not in ' .,;:!?()-\'\"')
+    rest = text.translate(_DROP_ORDINARY_ASCII)
+    if rest.isascii():
+        special = len(rest)
+    else:
+        special = sum(1 for c in rest if not c.isalnum() and c not in _ORDINARY_CHARS)
     return special / len(text)
 
 
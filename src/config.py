@@ -26,6 +26,8 @@ class OCRConfig:
         r"C:\Program Files\poppler-24.07.0\Library\bin",
         r"C:\Program Files\poppler\Library\bin",
     ])
+    # Cache OCR results on disk, keyed by page image hash (see PathConfig.ocr_cache_dir)
+    cache_enabled: bool = True
 
 
 @dataclass
@@ -43,6 +45,7 @@ class PathConfig:
     project_dir: Path = field(default_factory=lambda: Path(__file__).parent.parent)
     data_dir: Optional[Path] = None
     output_dir: Optional[Path] = None
+    ocr_cache_dir: Optional[Path] = None
 
     def __post_init__(self):
         # Allow environment variable overrides
@@ -56,6 +59,11 @@ class PathConfig:
         elif self.output_dir is None:
             self.output_dir = self.data_dir / "output"
 
+        if os.environ.get("CIC_OCR_CACHE_DIR"):
+            self.ocr_cache_dir = Path(os.environ["CIC_OCR_CACHE_DIR"])
+        elif self.ocr_cache_dir is None:
+            self.ocr_cache_dir = self.data_dir / "ocr_cache"
+
 
 @dataclass
 class Config:
@@ -7,6 +7,7 @@ filed CIC incorporation documents using pdfplumber.
 
 import logging
 import pdfplumber
+from contextlib import nullcontext
 from pathlib import Path
 from typing import Optional
 import re
@@ -22,7 +23,7 @@ logger = logging.getLogger(__name__)
 
 
 def extract_section_b_table(pdf_path: str | Path, section_b_page: int,
-                            search_nearby_pages: bool = True) -> dict:
+                            search_nearby_pages: bool = True, pdf=None) -> dict:
     """
     Extract the Section B Activities & Benefits table from an electronic PDF.
 
@@ -30,6 +31,8 @@ def extract_section_b_table(pdf_path: str | Path, section_b_page: int,
         pdf_path: Path to the PDF file
         section_b_page: 1-indexed page number where Section B starts
         search_nearby_pages: If True, also search adjacent pages for table content
+        pdf: Already-open pdfplumber PDF of pdf_path to read instead of
+            opening the file again (left open)
 
     Returns:
         Dictionary with:
@@ -54,7 +57,7 @@ def extract_section_b_table(pdf_path: str | Path, section_b_page: int,
         return result
 
     try:
-        with pdfplumber.open(pdf_path) as pdf:
+        with nullcontext(pdf) if pdf is not None else pdfplumber.open(pdf_path) as pdf:
             page_count = len(pdf.pages)
 
             # Determine pages to search
@@ -96,12 +99,13 @@ def extract_section_b_table(pdf_path: str | Path, section_b_page: int,
 
             # Extract surplus_use and company_differs from page text
             # These appear after the activities table, not in the table itself
-            full_text = ""
+            page_texts = []
             for page_num in pages_to_search:
                 if 1 <= page_num <= page_count:
                     page = pdf.pages[page_num - 1]
                     page_text = page.extract_text() or ""
-                    full_text += page_text + "\n"
+                    page_texts.append(page_text + "\n")
+            full_text = "".join(page_texts)
 
             surplus_use = _extract_surplus_use_from_text(full_text)
             company_differs = _extract_company_differs_from_text(full_text)
@@ -113,13 +117,14 @@ def extract_section_b_table(pdf_path: str | Path, section_b_page: int,
 
             # Extract beneficiaries from Section A (typically on pages before Section B)
             # Section A is usually 1-2 pages before Section B
-            section_a_text = ""
             section_a_pages = [section_b_page - 2, section_b_page - 1, section_b_page]
             section_a_pages = [p for p in section_a_pages if 1 <= p <= page_count]
+            page_texts = []
             for page_num in section_a_pages:
                 page = pdf.pages[page_num - 1]
                 page_text = page.extract_text() or ""
-                section_a_text += page_text + "\n"
+                page_texts.append(page_text + "\n")
+            section_a_text = "".join(page_texts)
 
             beneficiaries = _extract_beneficiaries_from_text(section_a_text)
             if beneficiaries:
@@ -221,10 +226,16 @@ def _parse_activities_table(table_data: list, page_num: int) -> list:
     return activities
 
 
-def extract_text_fallback(pdf_path: str | Path, page_numbers: list) -> dict:
+def extract_text_fallback(pdf_path: str | Path, page_numbers: list, pdf=None) -> dict:
     """
     Fallback extraction using raw text when table extraction fails.
     Attempts to parse Section B content from page text.
+
+    Args:
+        pdf_path: Path to the PDF file
+        page_numbers: List of 1-indexed page numbers to read
+        pdf: Already-open pdfplumber PDF of pdf_path to read instead of
+            opening the file again (left open)
     """
     pdf_path = Path(pdf_path)
 
@@ -236,7 +247,7 @@ def extract_text_fallback(pdf_path: str | Path, page_numbers: list) -> dict:
     }
 
     try:
-        with pdfplumber.open(pdf_path) as pdf:
+        with nullcontext(pdf) if pdf is not None else pdfplumber.open(pdf_path) as pdf:
             text_parts = []
             for page_num in page_numbers:
                 if 1 <= page_num <= len(pdf.pages):
@@ -278,11 +289,12 @@ def _parse_text_for_activities(text: str) -> list:
         content = section_b_match.group(1)
         lines = content.strip().split('\n')
 
-        current_activity = ""
+        activity_lines = []
         for line in lines:
             line = line.strip()
             if line and not is_header_or_instruction(line):
-                current_activity += " " + line
+                activity_lines.append(line)
+        current_activity = " ".join(activity_lines)
 
         if current_activity.strip():
             activities.append({
@@ -10,14 +10,22 @@ OCR Strategies:
 2. Linear OCR: Uses pytesseract.image_to_string() for simpler pages or as fallback.
 """
 
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import Optional
+import hashlib
+import json
 import re
 import logging
+import tempfile
 
 import os
 import platform
 
+from config import get_config
+
 logger = logging.getLogger(__name__)
 
 # Check for optional OpenCV support (Phase 2 image preprocessing)
@@ -28,8 +36,24 @@ try:
 except ImportError:
     CV2_AVAILABLE = False
 
+# Check for optional tesserocr support (persistent Tesseract API, no
+# subprocess per call)
+try:
+    from tesserocr import PyTessBaseAPI, PSM, RIL, iterate_level
+    TESSEROCR_AVAILABLE = True
+except ImportError:
+    TESSEROCR_AVAILABLE = False
+
+# Check for optional PyMuPDF support (in-process page rasterization)
+try:
+    import fitz
+    FITZ_AVAILABLE = True
+except ImportError:
+    FITZ_AVAILABLE = False
+
 try:
     from pdf2image import convert_from_path
+    from PIL import Image
     import pytesseract
 
     # Configure Tesseract and Poppler paths for Windows if not in PATH
@@ -136,6 +160,80 @@ def check_ocr_available() -> dict:
 # CIC 36 Form Detection
 # =============================================================================
 
+# Common OCR digit-for-letter confusion in form headers ("SECT1ON B"),
+# folded out of layout OCR words when looking for section headings
+_OCR_FOLD_TABLE_UPPER = str.maketrans('1', 'I')
+
+# Characters re.IGNORECASE treats as ASCII letters but str.lower() leaves
+# alone (or, for U+0130, expands to two characters)
+_MATCH_CASE_TABLE = str.maketrans({'\u0130': 'i', '\u0131': 'i', '\u017f': 's', '\u212a': 'k'})
+
+
+# Runs of whitespace, collapsed to one space by the text cleaners
+_WHITESPACE_RUN_RE = re.compile(r'\s+')
+# Leading dots and trailing punctuation left around extracted statements
+_LEADING_DOTS_RE = re.compile(r'^\s*\.{1,3}\s*')
+_TRAILING_PUNCT_RE = re.compile(r'[\s.,:;]+$')
+
+
+def _lower_for_match(text: str) -> str:
+    """
+    Lowercase text for matching against lowercase patterns without re.IGNORECASE.
+
+    The result has the same length as the input, so match spans found in it
+    can be used to slice the original text.
+    """
+    return text.translate(_MATCH_CASE_TABLE).lower()
+
+
+def _remove_spans(text: str, spans: list) -> str:
+    """Return text with the given sorted, non-overlapping (start, end) spans removed."""
+    pieces = []
+    prev = 0
+    for start, end in spans:
+        pieces.append(text[prev:start])
+        prev = end
+    pieces.append(text[prev:])
+    return ''.join(pieces)
+
+
+# Page-marker patterns, lowercase, one alternation per confidence tier so
+# each page costs a single search() call
+_CIC36_HIGH_CONFIDENCE_RE = re.compile(
+    # "Declarations on Formation" is unique to CIC 36 form and should never
+    # appear in Articles of Association
+    r'declarations?\s+on\s+formation\s+of\s+a\s+community\s+interest\s+company'
+    r'|declaration\s+on\s+formation.*community\s+interest'
+    r'|form\s+cic\s*36'
+)
+_CIC36_MEDIUM_CONFIDENCE_RE = re.compile(
+    # CIC 36 at start of line or after newline (form title position)
+    r'(?:^|\n)\s*cic\s*36\b'
+    # CIC 36 followed by newline (standalone title)
+    r'|\bcic\s*36\s*(?:\n|$)',
+    re.MULTILINE,
+)
+_ARTICLES_MARKER_RE = re.compile(
+    r'\[\s*section\s+[a-z]\s+cic'  # Reference like [ Section A CIC36 ]
+    r'|articles\s+of\s+association'
+    r'|memorandum\s+of\s+association'
+)
+_SECTION_A_HEADER_RE = re.compile(
+    # Modern form: "SECTION A: COMMUNITY INTEREST STATEMENT - beneficiaries"
+    # Legacy form: "SECTION A: DECLARATIONS ON FORMATION"
+    r'sect[i1]on\s*a[:\s]+(?:community|declarations)'
+    # Standalone beneficiaries header
+    r'|community\s+interest\s+statement\s*[-–—]?\s*beneficiaries'
+)
+
+
+def _is_cic36_title_page(text: str) -> bool:
+    """Medium-confidence CIC 36 title check that rejects Articles pages."""
+    if _ARTICLES_MARKER_RE.search(text):
+        return False
+    return _CIC36_MEDIUM_CONFIDENCE_RE.search(text) is not None
+
+
 def _find_cic36_start_page(all_text: dict) -> int | None:
     """
     Find the page where CIC 36 form begins.
@@ -153,56 +251,29 @@ def _find_cic36_start_page(all_text: dict) -> int | None:
     Returns:
         Page number where CIC 36 form starts, or None if not found
     """
-    # HIGH CONFIDENCE: "Declarations on Formation" is unique to CIC 36 form
-    # This pattern should never appear in Articles of Association
-    high_confidence_patterns = [
-        r'Declarations?\s+on\s+Formation\s+of\s+a\s+Community\s+Interest\s+Company',
-        r'Declaration\s+on\s+Formation.*Community\s+Interest',
-        r'Form\s+CIC\s*36',
-    ]
-
-    # MEDIUM CONFIDENCE: "CIC 36" alone - but must verify it's a form title
-    # NOT a reference like "[ Section A CIC36 ]" in Articles
-    # The actual form has "CIC 36" on its own line or near "Declarations"
-    medium_confidence_patterns = [
-        # CIC 36 at start of line or after newline (form title position)
-        r'(?:^|\n)\s*CIC\s*36\b',
-        # CIC 36 followed by newline (standalone title)
-        r'\bCIC\s*36\s*(?:\n|$)',
-    ]
+    # Lowercase each page once for both passes
+    lowered_pages = {
+        page_num: _lower_for_match(text)
+        for page_num, text in all_text.items()
+        if isinstance(text, str)
+    }
+
+    page_order = sorted(lowered_pages)
 
     # First pass: Look for high confidence patterns
-    for page_num in sorted(all_text.keys()):
-        text = all_text.get(page_num, "")
-        if not isinstance(text, str):
-            continue
-        for pattern in high_confidence_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                logger.debug(f"CIC 36 form found on page {page_num} (high confidence)")
-                return page_num
+    page_num = next((page_num for page_num in page_order
+                     if _CIC36_HIGH_CONFIDENCE_RE.search(lowered_pages[page_num])), None)
+    if page_num is not None:
+        logger.debug(f"CIC 36 form found on page {page_num} (high confidence)")
+        return page_num
 
     # Second pass: Look for medium confidence patterns
     # But exclude pages that look like Articles of Association
-    articles_markers = [
-        r'\[\s*Section\s+[A-Z]\s+CIC',  # Reference like [ Section A CIC36 ]
-        r'Articles\s+of\s+Association',
-        r'Memorandum\s+of\s+Association',
-    ]
-
-    for page_num in sorted(all_text.keys()):
-        text = all_text.get(page_num, "")
-        if not isinstance(text, str):
-            continue
-
-        # Skip if page looks like Articles
-        is_articles = any(re.search(p, text, re.IGNORECASE) for p in articles_markers)
-        if is_articles:
-            continue
-
-        for pattern in medium_confidence_patterns:
-            if re.search(pattern, text, re.IGNORECASE | re.MULTILINE):
-                logger.debug(f"CIC 36 form found on page {page_num} (medium confidence)")
-                return page_num
+    page_num = next((page_num for page_num in page_order
+                     if _is_cic36_title_page(lowered_pages[page_num])), None)
+    if page_num is not None:
+        logger.debug(f"CIC 36 form found on page {page_num} (medium confidence)")
+        return page_num
 
     return None
 
@@ -220,31 +291,34 @@ def _find_section_a_page(all_text: dict) -> int | None:
     Returns:
         Page number containing Section A header, or None if not found
     """
-    # Section A header patterns
-    section_a_patterns = [
-        # Modern form: "SECTION A: COMMUNITY INTEREST STATEMENT - beneficiaries"
-        r'SECTION\s*A[:\s]+COMMUNITY\s+INTEREST\s+STATEMENT',
-        r'Section\s*A[:\s]+Community\s+Interest\s+Statement',
-        # Legacy form: "SECTION A: DECLARATIONS ON FORMATION"
-        r'SECTION\s*A[:\s]+DECLARATIONS\s+ON\s+FORMATION',
-        # Standalone beneficiaries header
-        r'COMMUNITY\s+INTEREST\s+STATEMENT\s*[-–—]?\s*beneficiaries',
-        # OCR variations with I/1 confusion
-        r'SECT[I1]ON\s*A[:\s]+(?:COMMUNITY|DECLARATIONS)',
-    ]
-    
-    for page_num in sorted(all_text.keys()):
-        text = all_text.get(page_num, "")
-        if not isinstance(text, str):
-            continue
-        for pattern in section_a_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                logger.debug(f"Section A found on page {page_num}")
-                return page_num
-    
-    return None
+    # Section A headers are matched against lowercased text
+    lowered_pages = {
+        page_num: _lower_for_match(text)
+        for page_num, text in all_text.items()
+        if isinstance(text, str)
+    }
+    page_num = next((page_num for page_num in sorted(lowered_pages)
+                     if _SECTION_A_HEADER_RE.search(lowered_pages[page_num])), None)
+    if page_num is not None:
+        logger.debug(f"Section A found on page {page_num}")
+    return page_num
 
 
+# IN01 (company registration) phrases that should never appear in CIC 36
+# Section B content; lowercase, matched against lowercased text
+_IN01_CONTENT_RE = re.compile(
+    r'application\s+to\s+register\s+a\s+company'
+    r'|proposed\s+officers'
+    r'|appointment\s+of\s+a\s+secretary'
+    r'|for\s+a\s+secretary\s+who\s+is\s+an\s+individual'
+    r'|go\s+to\s+section\s+[bc]\d'
+    r'|private\s+companies\s+must\s+appoint'
+    r'|public\s+companies\s+are\s+required'
+)
+
+# Expected CIC 36 content markers (at least one should be present)
+_CIC36_CONTENT_MARKER_RE = re.compile(r'community|benefit|activit|surplus|differs?\s+from')
+
 
 def _validate_cic36_content(activities: list, text: str) -> dict:
     """
@@ -257,43 +331,162 @@ def _validate_cic36_content(activities: list, text: str) -> dict:
     Returns:
         Dictionary with 'valid' boolean and 'reason' if invalid
     """
-    # Check for IN01 patterns in extracted content
-    in01_patterns = [
-        r'Application\s+to\s+register\s+a\s+company',
-        r'Proposed\s+officers',
-        r'appointment\s+of\s+a\s+secretary',
-        r'For\s+a\s+secretary\s+who\s+is\s+an\s+individual',
-        r'go\s+to\s+Section\s+[BC]\d',
-        r'Private\s+companies\s+must\s+appoint',
-        r'Public\s+companies\s+are\s+required',
-    ]
-
-    combined_text = text or ""
+    # IN01 content in the page text alone fails validation without
+    # building the combined text from the activities
+    if _IN01_CONTENT_RE.search(_lower_for_match(text or "")):
+        return {"valid": False, "reason": "IN01 form content detected"}
+
+    combined_parts = [text or ""]
     for act in activities:
-        combined_text += " " + str(act.get("activity", ""))
-        combined_text += " " + str(act.get("benefit", "") or act.get("description", ""))
+        combined_parts.append(str(act.get("activity", "")))
+        combined_parts.append(str(act.get("benefit", "") or act.get("description", "")))
+    combined_text = " ".join(combined_parts)
+    combined_lower = _lower_for_match(combined_text)
 
-    for pattern in in01_patterns:
-        if re.search(pattern, combined_text, re.IGNORECASE):
-            return {"valid": False, "reason": "IN01 form content detected"}
+    if activities and _IN01_CONTENT_RE.search(combined_lower):
+        return {"valid": False, "reason": "IN01 form content detected"}
 
     # Check for expected CIC 36 content markers (at least one should be present)
-    cic36_markers = [
-        r'community',
-        r'benefit',
-        r'activit',
-        r'surplus',
-        r'differs?\s+from',
-    ]
-    markers_found = sum(1 for p in cic36_markers
-                        if re.search(p, combined_text, re.IGNORECASE))
-
-    if markers_found < 1 and len(combined_text) > 100:
+    if not _CIC36_CONTENT_MARKER_RE.search(combined_lower) and len(combined_text) > 100:
         return {"valid": False, "reason": "Content doesn't look like CIC 36 Section B"}
 
     return {"valid": True}
 
 
+# Section B boilerplate, removed by _strip_section_b_boilerplate.
+# Patterns are written lowercase and matched against _lower_for_match(text)
+# instead of using re.IGNORECASE, so the engine does no per-character case
+# folding. They are applied in order.
+
+# Main Section B instruction paragraph (various OCR variations)
+# This is the paragraph that appears above the table
+# NOTE: Patterns are applied in order - put more specific patterns FIRST
+_BOILERPLATE_INSTRUCTION_PATTERNS = [
+    # LEGACY FORM (circa 2006) instruction patterns - MUST come first
+    # These are more specific and should match before the general patterns
+    # "Please indicate how it is proposed...to enable the Regulator to make a properly informed decision"
+    r'please\s+indicate\s+how\s+i[tf]\s+is\s+proposed\s+that\s+the\s+company.{0,30}activities\s+will\s+benefit\s+the\s+community.*?(?:community\s+interest\s+company|see\s+note\s+\d)[^)]*\)?\.?',
+    r'please\s+provide\s+as\s+much\s+detail\s+as\s+possible\s+to\s+enable\s+the\s+regulator.*?(?:community\s+interest\s+company|see\s+note)[^)]*\)?\.?',
+    r'to\s+enable\s+the\s+regulator\s+to\s+make\s+a\s+properly\s+informed\s+decision.*?(?:community\s+interest\s+company|see\s+note)[^)]*\)?\.?',
+    # Fragments from legacy form
+    r'\(or\s+a\s+section\s+of\s+the\s+community\)',
+    r'\(see\s+note\s+\d+\)\.?',
+
+    # MODERN FORM - Full paragraph match - most comprehensive
+    r'please\s+indicate\s+how\s+i[tf]\s+is\s+proposed\s+that\s+the\s+company.{0,30}activities\s+will\s+benefit\s+the\s+community.*?(?:individual|personal)\s*,?\s*gain\.?',
+
+    # Partial matches for OCR variations - these need to be CAREFUL not to over-match
+    # Only match "commercial company" when it's in the specific boilerplate phrase context
+    r'please\s+indicate\s+how\s+i[tf]\s+is\s+proposed.*?different\s+from\s+a\s+commercial\s+company\s+providing\s+similar[^.]*\.?',
+    r'we\s+would\s+find\s+i[tf]\s+useful\s+if\s+you.*?for\s+(?:individual|personal)\s*,?\s*gain\.?',
+    r'please\s+provide\s+as\s+much\s+detail\s+as\s+possible.*?(?:set\s+up\s+to\s+do|being\s+set\s+up)[^.]*\.?',
+    r'to\s+enable\s+the\s+cic\s+regulator\s+to\s+make\s+an\s+informed\s+decision.*?(?:community\s+interest|eligible)[^.]*\.?',
+
+    # Catch fragments that may appear due to OCR splitting
+    r'(?:a\s+)?section\s+of\s+the\s+community\.\s*please\s+provide\s+as\s+much\s+detail',
+    r'eligible\s+to\s+become\s+a\s+community\s+interest\s+company[^.]*\.?',
+    r'different\s+from\s+a\s+commercial\s+company\s+providing\s+similar\s+services[^.]*\.?',
+
+    # OCR-MANGLED instruction fragments (words get jumbled/substituted)
+    # These catch boilerplate that OCR has corrupted
+    r'i[tf]\s+would\s+(?:be\s+)?(?:useful|think)\s+if\s+you[^.]*\.?',
+    r'your\s+company\s+will\s+be\s+different\s+from\s+a[^.]*(?:products?|services?)[^.]*\.?',
+    r'commercial\s+company\s+providing\s+similar[^.]*\.?',
+    r'for\s+individual\s*,?\s*(?:or\s+)?personal\s+gain\.?',
+    r'\.?\s*i[tf]\s+would\s+think\s+your\s+company[^.]*\.?',
+    r'would\s+be\s+different\s+from\s+a\s+(?:commercial\s+)?company[^.]*\.?',
+    # Leading boilerplate fragments at start of extracted text
+    r'^\.?\s*i[tf]\s+would\s+(?:be\s+)?(?:useful|think)[^.]{0,50}',
+    r'^\.?\s*would\s+(?:be\s+)?(?:useful|think)[^.]{0,50}',
+]
+
+# Column headers - these appear as table headers
+_BOILERPLATE_COLUMN_HEADER_PATTERNS = [
+    # Modern form - Activities column header
+    r'activities\s*\(?\s*please\s+provide\s+the\s+day\s+to\s+day\s+activities[^)]*\)?',
+    r'\(please\s+provide\s+the\s+day\s+to\s+day\s+activities[^)]*\)',
+    r'tell\s+us\s+here\s+what\s+the\s+company.*?is\s+being\s+set\s+up\s+to\s+do[^)]*\)?',
+    # Modern form - Benefit column header
+    r'how\s+will\s+the\s+activity\s+benefit\s+the\s+community\s*\??\s*\(?\s*the\s+community\s+will\s+benefit\s+by[^)]*\)?',
+    r'\(the\s+community\s+will\s+benefit\s+by[^)]*\)',
+    r'the\s+community\s+will\s+benefit\s+by\s*\.{0,3}\s*\)',
+
+    # LEGACY FORM column headers
+    r'activities\s+how\s+each\s+activity\s+benefits\s+the\s+community',
+    r'activities\s+how\s+each\s+activity\s+benefits[^a-z]*',
+    r'^how\s+each\s+activity\s+benefits\s+the\s+community\s*$',
+    r'^\s*the\s+community\s*$',  # Orphaned fragment after partial header match
+    # Alternative legacy column headers
+    r'activities\s+how\s+will\s+the\s+activity\s+benefit\s+the\s+community\s*\??',
+    r'\(tell\s+us\s+here\s+what\s+the\s+company\s*\(?the\s+community\s+will\s+benefit\s+by[^)]*\)?\s*\)?',
+    r'\(tell\s+us\s+here\s+what\s+the\s+company',
+    r'is\s+being\s+set\s+up\s+to\s+do\)',
+    r'\(the\s+community\s+will\s+benefit\s+by\.\.\.\)',
+    # OCR-mangled column headers (words jumbled mid-text)
+    r'activities\s+how\s+will\b',
+    r'how\s+will\s+the\s+activity\s+benefit\b',
+    r'^\s*activities\s*$',  # Orphaned "Activities" on its own line
+    r'^\s*how\s+will\s*$',  # Orphaned "How will"
+]
+
+# Surplus instruction boilerplate
+_BOILERPLATE_SURPLUS_INSTRUCTION_PATTERNS = [
+    r'\(if\s+donating\s+to\s+a\s+non-nominated\s+asset\s+locked\s+body[^)]*\)',
+    r'if\s+donating\s+to\s+a\s+non-nominated.*?(?:rejected|regulator)[^.]*\.?',
+    r"you\s+will\s+need\s+to\s+include\s+the\s+wording\s*['\"]?with\s+the\s+consent[^.]*\.?",
+]
+
+# LEGACY FORM "company differs" boilerplate
+# This is the row label that appears below the table in legacy forms
+_BOILERPLATE_COMPANY_DIFFERS_PATTERNS = [
+    r'our\s+company\s+differs\s+from\s+a\s+general\s+commercial\s+company\s+because[:\s]*\.{0,3}',
+    r'our\s+company\s+differs\s+from\s+a\s+(?:general\s+)?commercial\s+company\s+because',
+]
+
+# Section headers (should be removed, keeping only content)
+_BOILERPLATE_SECTION_HEADER_PATTERNS = [
+    # Legacy form section header
+    r'section\s+b\s*:\s*company\s+activities\s*',
+    # Modern form section header (if it appears)
+    r'section\s+b\s*:\s*community\s+interest\s+statement\s*[-–—]?\s*activities\s*(?:&|and)?\s*related\s+benefit\s*',
+    r'community\s+interest\s+statement\s*[-–—]?\s*activities\s*(?:&|and)?\s*related\s+benefit\s*',
+]
+
+# Other form boilerplate
+_BOILERPLATE_OTHER_PATTERNS = [
+    r'please\s+continue\s+on\s+separate\s+sheet\s+if\s+necessary',
+    r'company\s+name\s+.*?community\s+interest\s+company\s*\]?',
+    r'company\s+name\s+[^\n]+\s*\n?',  # Company name line at start of page
+    r'the\s+company\s+name\s+will\s+need\s+to\s+be\s+consistent\s+throughout',
+    # Form title headers
+    r'declarations?\s+on\s+formation\s+of\s+a\s*\n?\s*community\s+interest\s+company',
+    r'^\s*\]\s*$',  # Orphaned bracket from company name match
+    # Full instruction paragraph that may not match other patterns
+    r'please\s+indicate\s+how\s+i[tf]\s+[1i]s\s+proposed\s+that\s+the\s+company.{0,30}activities\s+will\s+benefit[^.]*\.',
+    r'please\s+provide\s+as\s+much\s+detail\s+as\s+possible[^.]*\.',
+    r'a\s+section\s+of\s+the\s+community\s*\.\s*',
+]
+
+_SECTION_B_BOILERPLATE_RES = tuple(
+    re.compile(pattern, re.DOTALL)
+    for pattern in (_BOILERPLATE_INSTRUCTION_PATTERNS +
+                    _BOILERPLATE_COLUMN_HEADER_PATTERNS +
+                    _BOILERPLATE_SURPLUS_INSTRUCTION_PATTERNS +
+                    _BOILERPLATE_COMPANY_DIFFERS_PATTERNS +
+                    _BOILERPLATE_SECTION_HEADER_PATTERNS +
+                    _BOILERPLATE_OTHER_PATTERNS)
+)
+
+# Literals that every boilerplate pattern above requires at least one of.
+# Text containing none of them can skip the regex cascade.
+_BOILERPLATE_LITERALS = (
+    'please', 'regulator', 'section', 'note', 'would', 'eligible', 'commercial',
+    'different', 'individual', 'activit', 'benefit', 'tell', 'being', 'how',
+    'community', 'donating', 'consent', 'differs', 'company', 'declaration', ']',
+)
+
+
+@lru_cache(maxsize=256)
 def _strip_section_b_boilerplate(text: str) -> str:
     """
     Remove Section B boilerplate instructions from OCR text.
@@ -308,143 +501,271 @@ def _strip_section_b_boilerplate(text: str) -> str:
     - Surplus instruction "(If donating to a non-nominated Asset Locked Body...)"
     - Legacy form (circa 2006): "SECTION B: COMPANY ACTIVITIES" header and instructions
     - Legacy form: "Our company differs from a general commercial company because..."
+
+    Cached: the layout and fallback parsers strip the same column and
+    linear text more than once.
     """
     if not text:
         return ""
 
-    # Main Section B instruction paragraph (various OCR variations)
-    # This is the paragraph that appears above the table
-    # NOTE: Patterns are applied in order - put more specific patterns FIRST
-    instruction_patterns = [
-        # LEGACY FORM (circa 2006) instruction patterns - MUST come first
-        # These are more specific and should match before the general patterns
-        # "Please indicate how it is proposed...to enable the Regulator to make a properly informed decision"
-        r'Please\s+indicate\s+how\s+i[tf]\s+is\s+proposed\s+that\s+the\s+company.{0,30}activities\s+will\s+benefit\s+the\s+community.*?(?:community\s+interest\s+company|See\s+note\s+\d)[^)]*\)?\.?',
-        r'Please\s+provide\s+as\s+much\s+detail\s+as\s+possible\s+to\s+enable\s+the\s+Regulator.*?(?:community\s+interest\s+company|See\s+note)[^)]*\)?\.?',
-        r'to\s+enable\s+the\s+Regulator\s+to\s+make\s+a\s+properly\s+informed\s+decision.*?(?:community\s+interest\s+company|See\s+note)[^)]*\)?\.?',
-        # Fragments from legacy form
-        r'\(or\s+a\s+section\s+of\s+the\s+community\)',
-        r'\(See\s+note\s+\d+\)\.?',
-
-        # MODERN FORM - Full paragraph match - most comprehensive
-        r'Please\s+indicate\s+how\s+i[tf]\s+is\s+proposed\s+that\s+the\s+company.{0,30}activities\s+will\s+benefit\s+the\s+community.*?(?:individual|personal)\s*,?\s*gain\.?',
-
-        # Partial matches for OCR variations - these need to be CAREFUL not to over-match
-        # Only match "commercial company" when it's in the specific boilerplate phrase context
-        r'Please\s+indicate\s+how\s+i[tf]\s+is\s+proposed.*?different\s+from\s+a\s+commercial\s+company\s+providing\s+similar[^.]*\.?',
-        r'We\s+would\s+find\s+i[tf]\s+useful\s+if\s+you.*?for\s+(?:individual|personal)\s*,?\s*gain\.?',
-        r'Please\s+provide\s+as\s+much\s+detail\s+as\s+possible.*?(?:set\s+up\s+to\s+do|being\s+set\s+up)[^.]*\.?',
-        r'to\s+enable\s+the\s+CIC\s+Regulator\s+to\s+make\s+an\s+informed\s+decision.*?(?:community\s+interest|eligible)[^.]*\.?',
-
-        # Catch fragments that may appear due to OCR splitting
-        r'(?:a\s+)?section\s+of\s+the\s+community\.\s*Please\s+provide\s+as\s+much\s+detail',
-        r'eligible\s+to\s+become\s+a\s+community\s+interest\s+company[^.]*\.?',
-        r'different\s+from\s+a\s+commercial\s+company\s+providing\s+similar\s+services[^.]*\.?',
-
-        # OCR-MANGLED instruction fragments (words get jumbled/substituted)
-        # These catch boilerplate that OCR has corrupted
-        r'i[tf]\s+would\s+(?:be\s+)?(?:useful|think)\s+if\s+you[^.]*\.?',
-        r'your\s+company\s+will\s+be\s+different\s+from\s+a[^.]*(?:products?|services?)[^.]*\.?',
-        r'commercial\s+company\s+providing\s+similar[^.]*\.?',
-        r'for\s+individual\s*,?\s*(?:or\s+)?personal\s+gain\.?',
-        r'\.?\s*I[tf]\s+would\s+think\s+your\s+company[^.]*\.?',
-        r'would\s+be\s+different\s+from\s+a\s+(?:commercial\s+)?company[^.]*\.?',
-        # Leading boilerplate fragments at start of extracted text
-        r'^\.?\s*I[tf]\s+would\s+(?:be\s+)?(?:useful|think)[^.]{0,50}',
-        r'^\.?\s*would\s+(?:be\s+)?(?:useful|think)[^.]{0,50}',
-    ]
-
-    # Column headers - these appear as table headers
-    column_header_patterns = [
-        # Modern form - Activities column header
-        r'Activities\s*\(?\s*Please\s+provide\s+the\s+day\s+to\s+day\s+activities[^)]*\)?',
-        r'\(Please\s+provide\s+the\s+day\s+to\s+day\s+activities[^)]*\)',
-        r'Tell\s+us\s+here\s+what\s+the\s+company.*?is\s+being\s+set\s+up\s+to\s+do[^)]*\)?',
-        # Modern form - Benefit column header
-        r'How\s+will\s+the\s+activity\s+benefit\s+the\s+community\s*\??\s*\(?\s*The\s+community\s+will\s+benefit\s+by[^)]*\)?',
-        r'\(The\s+community\s+will\s+benefit\s+by[^)]*\)',
-        r'The\s+community\s+will\s+benefit\s+by\s*\.{0,3}\s*\)',
-
-        # LEGACY FORM column headers
-        r'Activities\s+How\s+each\s+activity\s+benefits\s+the\s+community',
-        r'Activities\s+How\s+each\s+activity\s+benefits[^a-zA-Z]*',
-        r'^How\s+each\s+activity\s+benefits\s+the\s+community\s*$',
-        r'^\s*the\s+community\s*$',  # Orphaned fragment after partial header match
-        # Alternative legacy column headers
-        r'Activities\s+How\s+will\s+the\s+activity\s+benefit\s+the\s+community\s*\??',
-        r'\(Tell\s+us\s+here\s+what\s+the\s+company\s*\(?The\s+community\s+will\s+benefit\s+by[^)]*\)?\s*\)?',
-        r'\(Tell\s+us\s+here\s+what\s+the\s+company',
-        r'is\s+being\s+set\s+up\s+to\s+do\)',
-        r'\(The\s+community\s+will\s+benefit\s+by\.\.\.\)',
-        # OCR-mangled column headers (words jumbled mid-text)
-        r'Activities\s+How\s+will\b',
-        r'How\s+will\s+the\s+activity\s+benefit\b',
-        r'^\s*Activities\s*$',  # Orphaned "Activities" on its own line
-        r'^\s*How\s+will\s*$',  # Orphaned "How will"
-    ]
-
-    # Surplus instruction boilerplate
-    surplus_instruction_patterns = [
-        r'\(If\s+donating\s+to\s+a\s+non-nominated\s+Asset\s+Locked\s+Body[^)]*\)',
-        r'If\s+donating\s+to\s+a\s+non-nominated.*?(?:rejected|Regulator)[^.]*\.?',
-        r"you\s+will\s+need\s+to\s+include\s+the\s+wording\s*['\"]?with\s+the\s+consent[^.]*\.?",
-    ]
-
-    # LEGACY FORM "company differs" boilerplate
-    # This is the row label that appears below the table in legacy forms
-    company_differs_boilerplate = [
-        r'Our\s+company\s+differs\s+from\s+a\s+general\s+commercial\s+company\s+because[:\s]*\.{0,3}',
-        r'Our\s+company\s+differs\s+from\s+a\s+(?:general\s+)?commercial\s+company\s+because',
-    ]
-
-    # Section headers (should be removed, keeping only content)
-    section_header_patterns = [
-        # Legacy form section header
-        r'SECTION\s+B\s*:\s*COMPANY\s+ACTIVITIES\s*',
-        # Modern form section header (if it appears)
-        r'SECTION\s+B\s*:\s*Community\s+Interest\s+Statement\s*[-–—]?\s*Activities\s*(?:&|and)?\s*Related\s+Benefit\s*',
-        r'Community\s+Interest\s+Statement\s*[-–—]?\s*Activities\s*(?:&|and)?\s*Related\s+Benefit\s*',
-    ]
-
-    # Other form boilerplate
-    other_boilerplate = [
-        r'Please\s+continue\s+on\s+separate\s+sheet\s+if\s+necessary',
-        r'COMPANY\s+NAME\s+.*?Community\s+Interest\s+Company\s*\]?',
-        r'COMPANY\s+NAME\s+[^\n]+\s*\n?',  # Company name line at start of page
-        r'The\s+company\s+name\s+will\s+need\s+to\s+be\s+consistent\s+throughout',
-        # Form title headers
-        r'Declarations?\s+on\s+Formation\s+of\s+a\s*\n?\s*Community\s+[Ii]nterest\s+Company',
-        r'^\s*\]\s*$',  # Orphaned bracket from company name match
-        # Full instruction paragraph that may not match other patterns
-        r'Please\s+indicate\s+how\s+i[tf]\s+[1i]s\s+proposed\s+that\s+the\s+company.{0,30}activities\s+will\s+benefit[^.]*\.',
-        r'Please\s+provide\s+as\s+much\s+detail\s+as\s+possible[^.]*\.',
-        r'a\s+section\s+of\s+the\s+community\s*\.\s*',
-    ]
-
-    # Apply all patterns
-    all_patterns = (instruction_patterns + column_header_patterns +
-                    surplus_instruction_patterns + company_differs_boilerplate +
-                    section_header_patterns + other_boilerplate)
-    for pattern in all_patterns:
-        text = re.sub(pattern, '', text, flags=re.IGNORECASE | re.DOTALL)
-
-    # Clean up extra whitespace left behind
-    text = re.sub(r'\n\s*\n\s*\n+', '\n\n', text)
-    text = re.sub(r'  +', ' ', text)
-    text = re.sub(r'^\s+', '', text, flags=re.MULTILINE)
-
-    # Clean up orphaned punctuation from pattern removal
-    text = re.sub(r'^\s*[(\[\])\s]+\s*$', '', text, flags=re.MULTILINE)
-    text = re.sub(r'^\s*\(\s*$', '', text, flags=re.MULTILINE)
+    # Body-only text has none of the boilerplate cues - skip the ~40 patterns
+    lowered = _lower_for_match(text)
+    if not any(lit in lowered for lit in _BOILERPLATE_LITERALS):
+        return _tidy_stripped_text(text)
+
+    # Find matches on the lowercased copy and cut the same spans from both
+    # strings, keeping them aligned for the next pattern
+    for rx in _SECTION_B_BOILERPLATE_RES:
+        spans = [m.span() for m in rx.finditer(lowered)]
+        if spans:
+            text = _remove_spans(text, spans)
+            lowered = _remove_spans(lowered, spans)
+
+    return _tidy_stripped_text(text)
+
+
+# Orphaned punctuation left on its own line when a pattern is cut out of
+# "(See note 2)" or "[ ... ]" style text
+_ORPHAN_PUNCT_TABLE = str.maketrans('', '', '()[]')
+
+
+def _tidy_stripped_text(text: str) -> str:
+    """Tidy whitespace and orphaned punctuation left behind by boilerplate removal."""
+    # Single pass over lines: drop blank lines, strip leading whitespace,
+    # collapse runs of spaces, and replace each run of punctuation-only
+    # lines with one blank line
+    kept = []
+    in_orphan_run = False
+    for line in text.split('\n'):
+        line = line.lstrip()
+        if not line:
+            continue
+        if not line.translate(_ORPHAN_PUNCT_TABLE).strip():
+            if not in_orphan_run:
+                kept.append('')
+                in_orphan_run = True
+            continue
+        in_orphan_run = False
+        while '  ' in line:
+            line = line.replace('  ', ' ')
+        kept.append(line)
 
-    return text.strip()
+    return '\n'.join(kept).strip()
 
 
 # =============================================================================
 # Layout-Aware OCR Functions (Phase 1)
 # =============================================================================
 
-def _extract_with_layout_ocr(image) -> dict:
+# Resolution the layout probe downscales pages to. Column detection is as
+# reliable at 150 DPI, and pages that turn out to be single-column never
+# need the full-resolution image_to_data pass.
+_LAYOUT_PROBE_DPI = 150
+
+# Page segmentation mode for layout OCR - PSM 6 (single uniform block)
+# often works better for forms
+_LAYOUT_PSM = 6
+
+
+# Image formats pytesseract can hand to tesseract without compression
+_RAW_FORMAT_MODES = {"1", "L", "RGB"}
+
+
+def _tesseract_input(image):
+    """
+    The cheapest form of an image to pass to pytesseract.
+
+    pytesseract writes every PIL image to a temporary file for the
+    tesseract subprocess, PNG-encoding it unless the image has a format
+    of its own. Pages pdf2image rendered to disk are passed by path
+    instead (no re-encode), and other images are tagged as PPM so they
+    are written uncompressed.
+    """
+    filename = getattr(image, "filename", "")
+    if filename and os.path.exists(filename):
+        return filename
+    if getattr(image, "format", None) is None and getattr(image, "mode", None) in _RAW_FORMAT_MODES:
+        image.format = "PPM"
+    return image
+
+
+def _set_api_image(api, image) -> None:
+    """Give tesserocr the raw pixel buffer rather than an encoded copy."""
+    bytes_per_pixel = {"L": 1, "RGB": 3, "RGBA": 4}.get(image.mode)
+    if bytes_per_pixel is None:
+        api.SetImage(image)
+        return
+    width, height = image.size
+    api.SetImageBytes(image.tobytes(), width, height, bytes_per_pixel, width * bytes_per_pixel)
+
+
+def _image_to_string(image, api=None) -> str:
+    """
+    Run standard (automatic page segmentation) OCR on an image.
+
+    Args:
+        image: PIL Image object
+        api: Open tesserocr PyTessBaseAPI to reuse, or None for pytesseract
+
+    Returns:
+        Recognized text
+    """
+    if api is None:
+        return pytesseract.image_to_string(_tesseract_input(image))
+    api.SetPageSegMode(PSM.AUTO)
+    _set_api_image(api, image)
+    return api.GetUTF8Text()
+
+
+def _ocr_words_tesserocr(image, api) -> list:
+    """Word boxes from a tesserocr API, in pytesseract.image_to_data() DICT layout."""
+    api.SetPageSegMode(_LAYOUT_PSM)
+    _set_api_image(api, image)
+    api.Recognize()
+
+    data = {key: [] for key in ('text', 'conf', 'left', 'top', 'width', 'height',
+                                'line_num', 'block_num')}
+    block_num = 0
+    line_num = 0
+    iterator = api.GetIterator()
+    if iterator is None:
+        return data
+    for word in iterate_level(iterator, RIL.WORD):
+        if word.IsAtBeginningOf(RIL.BLOCK):
+            block_num += 1
+            line_num = 0
+        if word.IsAtBeginningOf(RIL.TEXTLINE):
+            line_num += 1
+        box = word.BoundingBox(RIL.WORD)
+        if box is None:
+            continue
+        x1, y1, x2, y2 = box
+        data['text'].append(word.GetUTF8Text(RIL.WORD) or '')
+        data['conf'].append(word.Confidence(RIL.WORD))
+        data['left'].append(x1)
+        data['top'].append(y1)
+        data['width'].append(x2 - x1)
+        data['height'].append(y2 - y1)
+        data['line_num'].append(line_num)
+        data['block_num'].append(block_num)
+    return data
+
+
+def _ocr_words(image, api=None) -> list:
+    """
+    Run layout OCR and return the confident words.
+
+    Uses pytesseract.image_to_data(), or the given tesserocr API.
+
+    Args:
+        image: PIL Image object
+        api: Open tesserocr PyTessBaseAPI to reuse, or None for pytesseract
+
+    Returns:
+        List of word dicts (text, left, top, width, height, conf, line_num,
+        block_num), skipping empty and low confidence (<20) words
+    """
+    if api is None:
+        data = pytesseract.image_to_data(_tesseract_input(image), config=f'--psm {_LAYOUT_PSM}',
+                                         output_type=pytesseract.Output.DICT)
+    else:
+        data = _ocr_words_tesserocr(image, api)
+
+    words = []
+    for i in range(len(data['text'])):
+        text = data['text'][i].strip()
+        conf = int(data['conf'][i]) if data['conf'][i] != '-1' else 0
+
+        # Skip empty text and very low confidence words
+        if not text or conf < 20:
+            continue
+
+        words.append({
+            'text': text,
+            'left': data['left'][i],
+            'top': data['top'][i],
+            'width': data['width'][i],
+            'height': data['height'][i],
+            'conf': conf,
+            'line_num': data['line_num'][i],
+            'block_num': data['block_num'][i],
+        })
+    return words
+
+
+def _split_words_at(words: list, boundary: float) -> tuple:
+    """
+    Split words into left/right lists by word center, preserving order.
+
+    Returns:
+        Tuple of (left_words, right_words, is_two_column), where
+        is_two_column means both sides hold >15% of the text
+    """
+    left_words = []
+    right_words = []
+
+    for word in words:
+        word_center = word['left'] + word['width'] / 2
+
+        if word_center < boundary:
+            left_words.append(word)
+        else:
+            right_words.append(word)
+
+    # Check if we have a valid two-column layout
+    # Both columns should have substantial content
+    left_text_len = sum(len(w['text']) for w in left_words)
+    right_text_len = sum(len(w['text']) for w in right_words)
+
+    # Heuristic: two-column if both sides have >15% of content
+    total_len = left_text_len + right_text_len
+    is_two_column = (total_len > 0 and
+                     left_text_len / total_len > 0.15 and
+                     right_text_len / total_len > 0.15)
+    return left_words, right_words, is_two_column
+
+
+def _section_b_word_bounds(words: list) -> tuple:
+    """
+    Find the vertical band of a page that belongs to Section B.
+
+    Looks for a "SECTION B" (or "SCHEDULE 2") heading and a following
+    "SECTION C" heading among positioned OCR words.
+
+    Args:
+        words: Word dicts sorted in reading order (top, left)
+
+    Returns:
+        Tuple of (top, bottom) y-coordinates; top is 0 when no Section B
+        heading is found and bottom is None when no Section C heading follows
+    """
+    top = 0
+    bottom = None
+    found_b = False
+    for i in range(len(words) - 1):
+        label = words[i]['text'].upper().translate(_OCR_FOLD_TABLE_UPPER).strip(':.-')
+        following = words[i + 1]['text'].upper()
+        if label == 'SECTION':
+            if not found_b and following[:1] in ('B', '8'):
+                top = words[i]['top']
+                found_b = True
+            elif following.rstrip(':.-') == 'C' and words[i]['top'] > top:
+                bottom = words[i]['top']
+                break
+        elif label == 'SCHEDULE' and not found_b and following.startswith('2'):
+            top = words[i]['top']
+            found_b = True
+    return top, bottom
+
+
+def _words_in_band(words: list, top: float, bottom: float | None) -> list:
+    """Words whose top edge lies in [top, bottom)."""
+    return [w for w in words
+            if w['top'] >= top and (bottom is None or w['top'] < bottom)]
+
+
+def _extract_with_layout_ocr(image, api=None, crop_to_section_b: bool = False,
+                             dpi: int | None = None) -> dict:
     """
     Extract text from an image using layout-aware OCR.
 
@@ -452,8 +773,22 @@ def _extract_with_layout_ocr(image) -> dict:
     separates text into left and right columns based on x-coordinates.
     This is much more reliable for two-column tables than linear OCR.
 
+    Pages rendered above _LAYOUT_PROBE_DPI are first OCR'd at that
+    resolution to detect the layout; the full-resolution pass only runs
+    when that probe finds two columns.
+
+    With crop_to_section_b, text above a "SECTION B" heading and from a
+    "SECTION C" heading down is dropped. When the page is probed, the band
+    is found on the probe's words and the image is cropped to it before the
+    full-resolution pass, so that pass only OCRs Section B. This keeps
+    Section A/C text out of the columns and cuts OCR work on the pages
+    where sections meet.
+
     Args:
         image: PIL Image object
+        api: Open tesserocr PyTessBaseAPI to reuse, or None for pytesseract
+        crop_to_section_b: Restrict the result to the Section B band
+        dpi: Resolution the image was rendered at, or None to skip the probe
 
     Returns:
         Dictionary with:
@@ -475,99 +810,113 @@ def _extract_with_layout_ocr(image) -> dict:
         return result
 
     try:
+        # Layout probe on a downscaled copy
+        probe_words = []
+        if dpi is not None and dpi > _LAYOUT_PROBE_DPI:
+            scale = _LAYOUT_PROBE_DPI / dpi
+            small = image.resize((max(1, round(image.width * scale)),
+                                  max(1, round(image.height * scale))), Image.LANCZOS)
+            probe_words = _ocr_words(small, api)
+            probe_words.sort(key=lambda w: (w['top'], w['left']))
+
+        if crop_to_section_b and probe_words:
+            # Crop the full-resolution image to the probe's Section B band,
+            # with a line's worth of margin around it
+            top, bottom = _section_b_word_bounds(probe_words)
+            probe_words = _words_in_band(probe_words, top, bottom)
+            if top or bottom is not None:
+                margin = 20 * scale
+                box_top = max(0, int((top - margin) / scale))
+                box_bottom = image.height if bottom is None else min(
+                    image.height, int((bottom + margin) / scale))
+                if box_bottom > box_top:
+                    image = image.crop((0, box_top, image.width, box_bottom))
+
+        if probe_words:
+            # Single-column pages are answered from the probe directly
+            _, _, probe_two_columns = _split_words_at(probe_words, small.width / 2)
+            if not probe_two_columns:
+                result["linear_text"] = ' '.join(w['text'] for w in probe_words)
+                result["left_column"] = result["linear_text"]
+                return result
+
         # Get OCR data with bounding boxes
-        # PSM 6 (single uniform block) often works better for forms
-        custom_config = '--psm 6'
-        data = pytesseract.image_to_data(image, config=custom_config, output_type=pytesseract.Output.DICT)
-
-        # Convert to structured format
-        words = []
-        for i in range(len(data['text'])):
-            text = data['text'][i].strip()
-            conf = int(data['conf'][i]) if data['conf'][i] != '-1' else 0
-
-            # Skip empty text and very low confidence words
-            if not text or conf < 20:
-                continue
+        words = _ocr_words(image, api)
 
-            words.append({
-                'text': text,
-                'left': data['left'][i],
-                'top': data['top'][i],
-                'width': data['width'][i],
-                'height': data['height'][i],
-                'conf': conf,
-                'line_num': data['line_num'][i],
-                'block_num': data['block_num'][i],
-            })
+        if crop_to_section_b and words:
+            # Trim the margin (or, without a probe, the whole page) to the band
+            words.sort(key=lambda w: (w['top'], w['left']))
+            words = _words_in_band(words, *_section_b_word_bounds(words))
 
         if not words:
             # Fallback to linear OCR
-            result["linear_text"] = pytesseract.image_to_string(image)
+            result["linear_text"] = _image_to_string(image, api)
             return result
 
-        # Calculate page dimensions and potential column boundary
-        page_width = image.width
-        midpoint = page_width / 2
-
-        # Analyze x-positions to detect two-column layout
-        # For two-column tables, words should cluster around two x-positions
-        left_words = []
-        right_words = []
-
-        for word in words:
-            word_center = word['left'] + word['width'] / 2
-
-            # Use midpoint as initial boundary
-            if word_center < midpoint:
-                left_words.append(word)
-            else:
-                right_words.append(word)
-
-        # Check if we have a valid two-column layout
-        # Both columns should have substantial content
-        left_text_len = sum(len(w['text']) for w in left_words)
-        right_text_len = sum(len(w['text']) for w in right_words)
-
-        # Heuristic: two-column if both sides have >15% of content
-        total_len = left_text_len + right_text_len
-        if total_len > 0:
-            left_ratio = left_text_len / total_len
-            right_ratio = right_text_len / total_len
-
-            if left_ratio > 0.15 and right_ratio > 0.15:
-                result["has_two_columns"] = True
-                result["column_boundary"] = midpoint
-
-        # Build linear text (for Section B header detection)
-        sorted_words = sorted(words, key=lambda w: (w['top'], w['left']))
-        result["linear_text"] = ' '.join(w['text'] for w in sorted_words)
-
-        # Build column texts if two-column layout detected
-        if result["has_two_columns"]:
-            # Sort each column by vertical position, then horizontal
-            left_sorted = sorted(left_words, key=lambda w: (w['top'], w['left']))
-            right_sorted = sorted(right_words, key=lambda w: (w['top'], w['left']))
-
-            # Group words into lines based on vertical position
-            result["left_column"] = _reconstruct_text_from_words(left_sorted)
-            result["right_column"] = _reconstruct_text_from_words(right_sorted)
-        else:
-            # Single column - use linear text for both
-            result["left_column"] = result["linear_text"]
-            result["right_column"] = ""
+        result.update(_layout_from_words(words, image.width))
 
     except Exception as e:
         logger.debug(f"Layout OCR failed, falling back to linear: {e}")
         try:
-            result["linear_text"] = pytesseract.image_to_string(image)
+            result["linear_text"] = _image_to_string(image, api)
         except Exception as e2:
             logger.error(f"Both layout and linear OCR failed: {e2}")
 
     return result
 
 
-def _reconstruct_text_from_words(words: list, line_threshold: int = 15) -> str:
+def _layout_from_words(words: list, page_width: float) -> dict:
+    """
+    Build the layout result (linear text and columns) from positioned words.
+
+    Args:
+        words: Non-empty list of word dicts with text, left, top and width
+        page_width: Page width in the same units as the word coordinates
+
+    Returns:
+        Dictionary with the same keys as _extract_with_layout_ocr()
+    """
+    result = {
+        "linear_text": "",
+        "left_column": "",
+        "right_column": "",
+        "has_two_columns": False,
+        "column_boundary": 0
+    }
+
+    # Sort once in reading order - the column splits below preserve it,
+    # so neither the linear text nor the column rebuilds need to re-sort
+    words.sort(key=lambda w: (w['top'], w['left']))
+
+    # Calculate potential column boundary
+    midpoint = page_width / 2
+
+    # Analyze x-positions to detect two-column layout, using the
+    # midpoint as initial boundary
+    # For two-column tables, words should cluster around two x-positions
+    left_words, right_words, is_two_column = _split_words_at(words, midpoint)
+    if is_two_column:
+        result["has_two_columns"] = True
+        result["column_boundary"] = midpoint
+
+    # Build linear text (for Section B header detection)
+    result["linear_text"] = ' '.join(w['text'] for w in words)
+
+    # Build column texts if two-column layout detected
+    if result["has_two_columns"]:
+        # Group words into lines based on vertical position
+        result["left_column"] = _reconstruct_text_from_words(left_words, presorted=True)
+        result["right_column"] = _reconstruct_text_from_words(right_words, presorted=True)
+    else:
+        # Single column - use linear text for both
+        result["left_column"] = result["linear_text"]
+        result["right_column"] = ""
+
+    return result
+
+
+def _reconstruct_text_from_words(words: list, line_threshold: int = 15,
+                                 presorted: bool = False) -> str:
     """
     Reconstruct readable text from a list of word dictionaries.
 
@@ -576,6 +925,7 @@ def _reconstruct_text_from_words(words: list, line_threshold: int = 15) -> str:
     Args:
         words: List of word dictionaries with 'text', 'top', 'left' keys
         line_threshold: Pixel difference to consider words on same line
+        presorted: True if words are already sorted by (top, left)
 
     Returns:
         Reconstructed text with line breaks
@@ -584,7 +934,7 @@ def _reconstruct_text_from_words(words: list, line_threshold: int = 15) -> str:
         return ""
 
     # Sort by vertical position first
-    sorted_words = sorted(words, key=lambda w: (w['top'], w['left']))
+    sorted_words = words if presorted else sorted(words, key=lambda w: (w['top'], w['left']))
 
     lines = []
     current_line = []
@@ -632,17 +982,9 @@ def _preprocess_image_for_ocr(image):
         return image
 
     try:
-        import numpy as np
-        from PIL import Image
-
-        # Convert PIL to OpenCV format
-        img_array = np.array(image)
-
-        # Convert to grayscale if needed
-        if len(img_array.shape) == 3:
-            gray = cv2.cvtColor(img_array, cv2.COLOR_RGB2GRAY)
-        else:
-            gray = img_array
+        # Convert to grayscale in PIL and wrap the result without copying,
+        # rather than copying the RGB image into numpy and converting there
+        gray = np.asarray(image.convert("L"))
 
         # Apply adaptive thresholding
         # This helps with uneven lighting and faded scans
@@ -669,8 +1011,558 @@ def _preprocess_image_for_ocr(image):
 # Main Extraction Functions
 # =============================================================================
 
+def _render_pages(pdf_path: Path, page_numbers: list, dpi: int, output_folder: str) -> dict:
+    """
+    Rasterize pages with as few pdftoppm runs as possible.
+
+    Each run of consecutive page numbers is converted in one
+    convert_from_path() call, letting Poppler render the run on several
+    threads (thread_count only takes effect with an output_folder).
+    Pages whose run fails are left out, so callers fall back to
+    converting them one at a time.
+
+    Args:
+        pdf_path: Path to the PDF file
+        page_numbers: List of 1-indexed page numbers
+        dpi: DPI for image conversion
+        output_folder: Directory for the rendered page files; must exist
+            for as long as the returned images are used
+
+    Returns:
+        Dictionary of page_num -> PIL Image
+    """
+    pages = sorted(set(page_numbers))
+    runs = []
+    for page_num in pages:
+        if runs and page_num == runs[-1][-1] + 1:
+            runs[-1].append(page_num)
+        else:
+            runs.append([page_num])
+
+    rendered = {}
+    for run in runs:
+        try:
+            images = convert_from_path(
+                str(pdf_path),
+                first_page=run[0],
+                last_page=run[-1],
+                dpi=dpi,
+                output_folder=output_folder,
+                thread_count=min(len(run), os.cpu_count() or 1),
+            )
+        except Exception as e:
+            logger.debug(f"Batch conversion of pages {run[0]}-{run[-1]} failed: {e}")
+            continue
+        if len(images) == len(run):
+            rendered.update(zip(run, images))
+
+    return rendered
+
+
+def _render_page(pdf_path: Path, page_num: int, dpi: int, fitz_doc=None):
+    """
+    Rasterize a single page.
+
+    Renders in-process with PyMuPDF when an open document is given,
+    otherwise runs pdf2image (pdftoppm) for the page.
+
+    Args:
+        pdf_path: Path to the PDF file
+        page_num: 1-indexed page number
+        dpi: DPI for image conversion
+        fitz_doc: Open PyMuPDF document, or None
+
+    Returns:
+        PIL Image, or None if the page could not be rendered
+    """
+    if fitz_doc is not None:
+        pix = fitz_doc[page_num - 1].get_pixmap(dpi=dpi)
+        return Image.frombytes("RGB", (pix.width, pix.height), pix.samples)
+
+    # pdf2image uses 1-indexed pages
+    images = convert_from_path(
+        str(pdf_path),
+        first_page=page_num,
+        last_page=page_num,
+        dpi=dpi
+    )
+    return images[0] if images else None
+
+
+def _read_text_layer(pdf_path: Path, page_numbers: list, dpi: int) -> dict:
+    """
+    Read pages that carry a usable embedded text layer, so they can skip OCR.
+
+    Uses PyMuPDF when available, otherwise pdfplumber. A page qualifies
+    when its text has more than 50 characters and does not rate
+    'very_low' in _check_ocr_quality() (scanners sometimes embed junk OCR).
+    Word coordinates are scaled from PDF points to pixels at dpi, so the
+    layout result matches what layout OCR would produce for the page.
+
+    Args:
+        pdf_path: Path to the PDF file
+        page_numbers: List of 1-indexed page numbers
+        dpi: DPI the pages would be rasterized at
+
+    Returns:
+        Dictionary of page_num -> (text, layout_result)
+    """
+    scale = dpi / 72
+    native = {}
+
+    def add_page(page_num, text, words, page_width):
+        if len(text.strip()) <= 50 or _check_ocr_quality(text) == "very_low":
+            return
+        if words:
+            # Keep the same Section B band the layout OCR pass keeps
+            words.sort(key=lambda w: (w['top'], w['left']))
+            words = _words_in_band(words, *_section_b_word_bounds(words))
+        if words:
+            layout_result = _layout_from_words(words, page_width * scale)
+        else:
+            layout_result = {"linear_text": text, "left_column": text, "right_column": "",
+                             "has_two_columns": False, "column_boundary": 0}
+        native[page_num] = (text, layout_result)
+
+    try:
+        if FITZ_AVAILABLE:
+            with fitz.open(str(pdf_path)) as doc:
+                for page_num in page_numbers:
+                    if not 1 <= page_num <= doc.page_count:
+                        continue
+                    page = doc[page_num - 1]
+                    words = [{'text': w[4], 'left': w[0] * scale, 'top': w[1] * scale,
+                              'width': (w[2] - w[0]) * scale, 'height': (w[3] - w[1]) * scale}
+                             for w in page.get_text("words") if w[4].strip()]
+                    add_page(page_num, page.get_text("text"), words, page.rect.width)
+        else:
+            import pdfplumber
+            with pdfplumber.open(pdf_path) as pdf:
+                for page_num in page_numbers:
+                    if not 1 <= page_num <= len(pdf.pages):
+                        continue
+                    page = pdf.pages[page_num - 1]
+                    words = [{'text': w['text'], 'left': w['x0'] * scale, 'top': w['top'] * scale,
+                              'width': (w['x1'] - w['x0']) * scale,
+                              'height': (w['bottom'] - w['top']) * scale}
+                             for w in page.extract_words() if w['text'].strip()]
+                    add_page(page_num, page.extract_text() or "", words, page.width)
+    except Exception as e:
+        logger.debug(f"Could not read text layer of {pdf_path.name}: {e}")
+
+    return native
+
+
+def _open_fitz_doc(pdf_path: Path):
+    """Open the PDF with PyMuPDF if available, else return None (use pdf2image)."""
+    if not FITZ_AVAILABLE:
+        return None
+    try:
+        return fitz.open(str(pdf_path))
+    except Exception as e:
+        logger.debug(f"PyMuPDF could not open {pdf_path.name}, using pdf2image: {e}")
+        return None
+
+
+# =============================================================================
+# OCR Result Cache
+# =============================================================================
+
+# Bump when the OCR post-processing changes, to invalidate cached results
+_OCR_CACHE_VERSION = 4
+
+# In-memory layer over the on-disk cache, for reprocessing within one run
+_OCR_MEMORY_CACHE: OrderedDict = OrderedDict()
+_OCR_MEMORY_CACHE_SIZE = 512
+
+
+@lru_cache(maxsize=None)
+def _tesseract_version(backend: str) -> str:
+    """Tesseract version string for the given OCR backend (cached)."""
+    try:
+        if backend == "tesserocr":
+            import tesserocr
+            return tesserocr.tesseract_version()
+        return str(pytesseract.get_tesseract_version())
+    except Exception:
+        return "unknown"
+
+
+def _ocr_cache_key(image, dpi: int, tess_api=None) -> str | None:
+    """
+    Cache key for a rendered page: sha256 of the pixels plus everything else
+    that changes the OCR output (dpi, Tesseract version and backend, image
+    preprocessing, cache version). Returns None when caching is disabled.
+    """
+    if not get_config().ocr.cache_enabled:
+        return None
+    backend = "pytesseract" if tess_api is None else "tesserocr"
+    digest = hashlib.sha256(image.tobytes())
+    digest.update(f"|{image.mode}|{image.size}|{dpi}|{backend}|{_tesseract_version(backend)}"
+                  f"|{CV2_AVAILABLE}|{_OCR_CACHE_VERSION}".encode())
+    return digest.hexdigest()
+
+
+def _ocr_cache_get(key: str | None):
+    """Look up a cached OCR result in memory, then on disk. None on a miss."""
+    if key is None:
+        return None
+    if key in _OCR_MEMORY_CACHE:
+        _OCR_MEMORY_CACHE.move_to_end(key)
+        return _OCR_MEMORY_CACHE[key]
+
+    cache_file = get_config().paths.ocr_cache_dir / f"{key}.json"
+    try:
+        with open(cache_file, encoding="utf-8") as f:
+            value = json.load(f)
+    except (OSError, ValueError):
+        return None
+    _ocr_memory_cache_put(key, value)
+    return value
+
+
+def _ocr_cache_put(key: str | None, value) -> None:
+    """Store an OCR result in memory and on disk (written atomically)."""
+    if key is None:
+        return
+    _ocr_memory_cache_put(key, value)
+
+    cache_dir = get_config().paths.ocr_cache_dir
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(value, f)
+        os.replace(tmp_path, cache_dir / f"{key}.json")
+    except OSError as e:
+        logger.debug(f"Could not write OCR cache entry {key}: {e}")
+
+
+def _ocr_memory_cache_put(key: str, value) -> None:
+    _OCR_MEMORY_CACHE[key] = value
+    _OCR_MEMORY_CACHE.move_to_end(key)
+    while len(_OCR_MEMORY_CACHE) > _OCR_MEMORY_CACHE_SIZE:
+        _OCR_MEMORY_CACHE.popitem(last=False)
+
+
+# Ordering of _check_ocr_quality() ratings, worst first
+_OCR_QUALITY_RANK = {"very_low": 0, "low": 1, "medium": 2, "high": 3}
+
+
+def _page_has_images(fitz_doc, page_num: int) -> bool:
+    """
+    Whether a page has embedded raster images (i.e. scanned content).
+
+    Only PyMuPDF can tell cheaply; without it every page is assumed to.
+    """
+    if fitz_doc is None:
+        return True
+    try:
+        return bool(fitz_doc[page_num - 1].get_images())
+    except Exception:
+        return True
+
+
+def _ocr_page_text(pdf_path: Path, page_num: int, dpi: int, image=None,
+                   fitz_doc=None, tess_api=None) -> str | None:
+    """
+    Standard OCR of one page, with DPI fallback for pages that OCR poorly.
+
+    Args:
+        pdf_path: Path to the PDF file
+        page_num: 1-indexed page number
+        dpi: DPI for image conversion
+        image: Already rendered page image, or None to render it here
+        fitz_doc: Open PyMuPDF document, or None to use pdf2image
+        tess_api: Open tesserocr API, or None to use pytesseract
+
+    Returns:
+        OCR text, or None if the page could not be rendered
+    """
+    if image is None:
+        image = _render_page(pdf_path, page_num, dpi, fitz_doc)
+    if image is None:
+        return None
+
+    cache_key = _ocr_cache_key(image, dpi, tess_api)
+    cached = _ocr_cache_get(cache_key)
+    if cached is not None:
+        return cached["standard_text"]
+
+    # Use STANDARD OCR on ORIGINAL image for header detection
+    # Preserves reading order needed for surplus extraction
+    standard_text = _image_to_string(image, tess_api)
+
+    # DPI fallback: if OCR returns very short text, retry at different DPI
+    # Some pages OCR poorly at certain DPI values. Pages with no raster
+    # content (blank or vector-only) won't OCR better at another DPI.
+    if len(standard_text.strip()) < 50 and _page_has_images(fitz_doc, page_num):
+        best_rank = _OCR_QUALITY_RANK[_check_ocr_quality(standard_text)]
+        fallback_dpis = [150, 250, 300] if dpi == 200 else [200, 150, 250]
+        for fallback_dpi in fallback_dpis:
+            if fallback_dpi == dpi:
+                continue
+            try:
+                fallback_image = _render_page(pdf_path, page_num, fallback_dpi, fitz_doc)
+                if fallback_image is not None:
+                    fallback_text = _image_to_string(fallback_image, tess_api)
+                    # Prefer better quality; length only breaks ties, since a
+                    # longer garbled string is worse than a shorter clean one
+                    rank = _OCR_QUALITY_RANK[_check_ocr_quality(fallback_text)]
+                    rating_improved = rank > best_rank
+                    if (rank, len(fallback_text.strip())) > (best_rank, len(standard_text.strip())):
+                        standard_text = fallback_text
+                        best_rank = rank
+                        logger.debug(f"Page {page_num}: DPI fallback {fallback_dpi} improved OCR ({len(fallback_text)} chars)")
+                    # Only try another DPI while the rating keeps rising and is
+                    # still below medium - sparse pages (a signature, a blank
+                    # reverse) never reach medium and get a single retry
+                    if not rating_improved or best_rank >= _OCR_QUALITY_RANK["medium"]:
+                        break
+            except Exception as e:
+                logger.debug(f"Page {page_num}: DPI fallback {fallback_dpi} failed: {e}")
+
+    _ocr_cache_put(cache_key, {"standard_text": standard_text})
+    return standard_text
+
+
+def _ocr_page_layout(pdf_path: Path, page_num: int, dpi: int, image=None,
+                     fitz_doc=None, tess_api=None) -> dict | None:
+    """
+    Layout-aware OCR of one Section B page, cropped to the Section B band.
+
+    Args:
+        pdf_path: Path to the PDF file
+        page_num: 1-indexed page number
+        dpi: DPI for image conversion
+        image: Already rendered page image, or None to render it here
+        fitz_doc: Open PyMuPDF document, or None to use pdf2image
+        tess_api: Open tesserocr API, or None to use pytesseract
+
+    Returns:
+        Layout result from _extract_with_layout_ocr(), or None if the page
+        could not be rendered
+    """
+    if image is None:
+        image = _render_page(pdf_path, page_num, dpi, fitz_doc)
+    if image is None:
+        return None
+
+    # Layout results are cached separately from the standard text so
+    # changes to the layout pass don't invalidate it
+    cache_key = _ocr_cache_key(image, dpi, tess_api)
+    layout_key = f"{cache_key}_layout" if cache_key else None
+    layout_result = _ocr_cache_get(layout_key)
+    if layout_result is not None:
+        return layout_result
+
+    # Apply image preprocessing for layout OCR (Phase 2)
+    # Note: Don't use preprocessing for standard OCR as it can
+    # affect reading order and cause column interleaving
+    preprocessed_image = image
+    if CV2_AVAILABLE:
+        preprocessed_image = _preprocess_image_for_ocr(image)
+
+    # Use layout-aware OCR for table column separation
+    layout_result = _extract_with_layout_ocr(preprocessed_image, tess_api, crop_to_section_b=True,
+                                             dpi=dpi)
+    _ocr_cache_put(layout_key, layout_result)
+    return layout_result
+
+
+# Per-process state of a pool worker, set up once by _init_ocr_worker
+_WORKER_FITZ_DOC = None
+_WORKER_TESS_API = None
+
+
+def _init_ocr_worker(pdf_path: str) -> None:
+    """
+    Process pool initializer: open the PDF and load Tesseract once per worker.
+
+    Every page the worker handles then shares one PyMuPDF document and one
+    tesserocr API, so the language model is read and initialised once per
+    process rather than once per page. Both are released when the worker
+    process exits.
+    """
+    global _WORKER_FITZ_DOC, _WORKER_TESS_API
+    _WORKER_FITZ_DOC = _open_fitz_doc(Path(pdf_path))
+    if TESSEROCR_AVAILABLE:
+        try:
+            _WORKER_TESS_API = PyTessBaseAPI()
+        except Exception as e:
+            logger.debug(f"tesserocr unavailable, using pytesseract: {e}")
+
+
+def _ocr_page_worker(page_fn, pdf_path: str, page_num: int, dpi: int):
+    """Process pool entry point for a per-page OCR function."""
+    return page_fn(Path(pdf_path), page_num, dpi,
+                   fitz_doc=_WORKER_FITZ_DOC, tess_api=_WORKER_TESS_API)
+
+
+def _ocr_pool(pdf_path: Path, workers: int) -> ProcessPoolExecutor | None:
+    """
+    Process pool for OCRing one document's pages, or None for workers <= 1.
+
+    Each worker opens the PDF and loads Tesseract once (_init_ocr_worker),
+    so the pool should be shared by every _ocr_pages call on the document.
+    """
+    if workers <= 1:
+        return None
+    return ProcessPoolExecutor(max_workers=workers, initializer=_init_ocr_worker,
+                               initargs=(str(pdf_path),))
+
+
+def _ocr_pages(pdf_path: Path, page_numbers: list, dpi: int, page_fn,
+               executor: ProcessPoolExecutor | None = None) -> tuple:
+    """
+    Run a per-page OCR function (_ocr_page_text or _ocr_page_layout) over pages.
+
+    With an executor from _ocr_pool pages are spread over its worker
+    processes. Otherwise pages run in order sharing one PyMuPDF document and
+    one tesserocr API (when installed), with runs of consecutive pages
+    pre-rendered by pdf2image.
+
+    Args:
+        pdf_path: Path to the PDF file
+        page_numbers: List of 1-indexed page numbers
+        dpi: DPI for image conversion
+        page_fn: Callable (pdf_path, page_num, dpi, image, fitz_doc, tess_api)
+        executor: Process pool from _ocr_pool, or None to OCR in this process
+
+    Returns:
+        Tuple of (results, errors): page_num -> result, page_num -> exception
+    """
+    results = {}
+    errors = {}
+
+    if executor is not None:
+        # Pages are independent - OCR them on separate processes
+        futures = [(page_num, executor.submit(_ocr_page_worker, page_fn, str(pdf_path), page_num, dpi))
+                   for page_num in page_numbers]
+        for page_num, future in futures:
+            try:
+                results[page_num] = future.result()
+            except Exception as e:
+                errors[page_num] = e
+        return results, errors
+
+    # Prefer PyMuPDF: pages are rendered in-process on demand, with no
+    # pdftoppm subprocess or temporary image files
+    fitz_doc = _open_fitz_doc(pdf_path)
+
+    # One Tesseract instance for every page, fallback retry and layout
+    # pass, instead of a tesseract process per pytesseract call
+    tess_api = None
+    if TESSEROCR_AVAILABLE:
+        try:
+            tess_api = PyTessBaseAPI()
+        except Exception as e:
+            logger.debug(f"tesserocr unavailable, using pytesseract: {e}")
+
+    try:
+        # pdf2image pages are backed by files in a temporary directory, which
+        # has to outlive the OCR loop (cleanup errors are ignored because
+        # Windows refuses to delete files PIL still holds open)
+        with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as render_dir:
+            rendered_pages = {}
+            if fitz_doc is None:
+                rendered_pages = _render_pages(pdf_path, page_numbers, dpi, render_dir)
+
+            for page_num in page_numbers:
+                try:
+                    results[page_num] = page_fn(pdf_path, page_num, dpi,
+                                                rendered_pages.pop(page_num, None),
+                                                fitz_doc, tess_api)
+                except Exception as e:
+                    errors[page_num] = e
+    finally:
+        if fitz_doc is not None:
+            fitz_doc.close()
+        if tess_api is not None:
+            tess_api.End()
+
+    return results, errors
+
+
+# Standard OCR runs over the pages in batches of this many (or two per
+# worker), checking after each batch whether Section B is settled
+_OCR_BATCH_PAGES = 4
+
+
+def _section_b_settled(page_text: dict) -> bool:
+    """
+    Whether OCR of later pages can no longer change the Section B pages.
+
+    page_text must hold every page up to the last one OCR'd. Section B is
+    settled once a high-confidence CIC 36 title page has been seen, the
+    whole Section B search window after it has been read, and the
+    continuation pages stopped before the last page read (an end marker
+    was hit, rather than the pages running out). Medium-confidence title
+    matches can be overridden by a high-confidence page further on, so
+    they never settle.
+
+    Args:
+        page_text: Dictionary of page_num -> text for the pages read so far
+
+    Returns:
+        True if the remaining pages need not be OCR'd to find Section B
+    """
+    pages = sorted(p for p, text in page_text.items() if isinstance(text, str))
+    if not pages:
+        return False
+
+    cic36_start_page = next(
+        (p for p in pages if _CIC36_HIGH_CONFIDENCE_RE.search(_lower_for_match(page_text[p]))), None)
+    if cic36_start_page is None or pages[-1] < cic36_start_page + 6:
+        return False
+
+    section_b_pages = _find_section_b_pages(page_text, cic36_start_page)
+    return bool(section_b_pages) and section_b_pages[-1] < pages[-1]
+
+
+def _ocr_page_texts(pdf_path: Path, page_numbers: list, dpi: int, page_texts: dict,
+                    executor: ProcessPoolExecutor | None = None) -> None:
+    """Standard-OCR pages into page_texts, skipping pages that fail."""
+    texts, errors = _ocr_pages(pdf_path, page_numbers, dpi, _ocr_page_text, executor)
+    for page_num, e in errors.items():
+        logger.debug(f"OCR failed for page {page_num}: {e}")
+    page_texts.update((page_num, text) for page_num, text in texts.items() if text is not None)
+
+
+def _section_a_text(all_text: dict, page_num: int) -> str:
+    """Text of a Section A page and the page after it, where Section A may run on."""
+    next_page = page_num + 1
+    if next_page in all_text:
+        return all_text.get(page_num, "") + "\n" + all_text[next_page]
+    return all_text.get(page_num, "")
+
+
+def _merge_page_text(page_numbers: list, text_layer_pages: dict, page_texts: dict) -> dict:
+    """Page text in page_numbers order, from the text layer or OCR."""
+    all_text = {}
+    for page_num in page_numbers:
+        if page_num in text_layer_pages:
+            all_text[page_num] = text_layer_pages[page_num][0]
+        elif page_num in page_texts:
+            all_text[page_num] = page_texts[page_num]
+    return all_text
+
+
+def _clear_text_caches() -> None:
+    """Drop the per-text parsing caches so they don't grow across a batch."""
+    _strip_section_b_boilerplate.cache_clear()
+    _section_b_markers.cache_clear()
+    _extract_company_differs.cache_clear()
+    _extract_surplus_use.cache_clear()
+    _clean_activity_text.cache_clear()
+    _clean_benefit_text.cache_clear()
+    _clean_extracted_text.cache_clear()
+    _is_form_instruction_only.cache_clear()
+
+
 def extract_section_b_ocr(pdf_path: str | Path, page_numbers: list,
-                          dpi: int = 200) -> dict:
+                          dpi: int = 200, max_workers: int = 1,
+                          stop_early: bool = True) -> dict:
     """
     Extract Section B content from scanned PDF pages using OCR.
 
@@ -678,17 +1570,26 @@ def extract_section_b_ocr(pdf_path: str | Path, page_numbers: list,
         pdf_path: Path to the PDF file
         page_numbers: List of 1-indexed page numbers to process
         dpi: DPI for image conversion (default 200 - better reliability than 300)
+        max_workers: Processes to OCR pages on (default 1 - the batch
+            pipeline already runs one document per process)
+        stop_early: Stop OCRing pages once Section B and its end have been
+            found; the rest are only read if a later step needs them. Pass
+            False when page_numbers is already just the pages wanted.
 
     Returns:
         Dictionary with:
         - success: Boolean indicating extraction success
         - activities: List of {activity, benefit} dictionaries
         - raw_text: Raw OCR text for debugging
-        - extraction_method: 'ocr_pytesseract'
+        - extraction_method: 'ocr_pytesseract', or 'pdf_text_layer' when every
+          page had an embedded text layer (variants add a suffix)
         - pages_processed: List of page numbers processed
     """
     pdf_path = Path(pdf_path)
 
+    # Text-keyed caches only pay off within one document
+    _clear_text_caches()
+
     result = {
         "success": False,
         "activities": [],
@@ -705,69 +1606,48 @@ def extract_section_b_ocr(pdf_path: str | Path, page_numbers: list,
         result["error"] = f"PDF not found: {pdf_path}"
         return result
 
+    executor = None
     try:
-        # Convert specified pages to images and perform OCR
-        all_text = {}  # Standard OCR text for CIC 36/Section B header detection
-        all_layout_data = {}  # Layout-aware data for column separation (table parsing)
-
-        for page_num in page_numbers:
-            try:
-                # Convert single page (pdf2image uses 1-indexed pages)
-                images = convert_from_path(
-                    str(pdf_path),
-                    first_page=page_num,
-                    last_page=page_num,
-                    dpi=dpi
-                )
-
-                if images:
-                    image = images[0]
-                    original_image = image  # Keep original for standard OCR
-
-                    # Apply image preprocessing for layout OCR (Phase 2)
-                    # Note: Don't use preprocessing for standard OCR as it can
-                    # affect reading order and cause column interleaving
-                    preprocessed_image = image
-                    if CV2_AVAILABLE:
-                        preprocessed_image = _preprocess_image_for_ocr(image)
-
-                    # Use STANDARD OCR on ORIGINAL image for header detection
-                    # Preserves reading order needed for surplus extraction
-                    standard_text = pytesseract.image_to_string(original_image)
-
-                    # DPI fallback: if OCR returns very short text, retry at different DPI
-                    # Some pages OCR poorly at certain DPI values
-                    if len(standard_text.strip()) < 50:
-                        fallback_dpis = [150, 250, 300] if dpi == 200 else [200, 150, 250]
-                        for fallback_dpi in fallback_dpis:
-                            try:
-                                fallback_images = convert_from_path(
-                                    str(pdf_path),
-                                    first_page=page_num,
-                                    last_page=page_num,
-                                    dpi=fallback_dpi
-                                )
-                                if fallback_images:
-                                    fallback_text = pytesseract.image_to_string(fallback_images[0])
-                                    if len(fallback_text.strip()) > len(standard_text.strip()):
-                                        standard_text = fallback_text
-                                        image = fallback_images[0]
-                                        logger.debug(f"Page {page_num}: DPI fallback {fallback_dpi} improved OCR ({len(fallback_text)} chars)")
-                                        break
-                            except:
-                                pass
-
-                    all_text[page_num] = standard_text
-
-                    # Use layout-aware OCR for table column separation
-                    layout_result = _extract_with_layout_ocr(preprocessed_image)
-                    all_layout_data[page_num] = layout_result
+        # Pages with a real text layer don't need rasterizing or OCR
+        text_layer_pages = _read_text_layer(pdf_path, page_numbers, dpi)
+        ocr_pages = [p for p in page_numbers if p not in text_layer_pages]
+
+        # One process pool for every OCR pass over the document (standard
+        # batches, layout pages and late reads of the remaining pages)
+        executor = _ocr_pool(pdf_path, min(max_workers, len(ocr_pages)))
+
+        # Layout-aware data for column separation (table parsing)
+        all_layout_data = {page_num: layout_result
+                           for page_num, (_, layout_result) in text_layer_pages.items()}
+
+        # Standard OCR in page order, stopping once Section B is settled;
+        # layout OCR waits until the Section B pages are known, since only
+        # those pages use it
+        page_texts = {}
+        pending = sorted(ocr_pages)
+        batch_size = max(_OCR_BATCH_PAGES, 2 * max_workers)
+        while pending:
+            batch, pending = pending[:batch_size], pending[batch_size:]
+            _ocr_page_texts(pdf_path, batch, dpi, page_texts, executor)
+            if stop_early and pending:
+                read_so_far = _merge_page_text(
+                    [p for p in page_numbers if p <= batch[-1]], text_layer_pages, page_texts)
+                if _section_b_settled(read_so_far):
+                    logger.debug(f"Section B settled after page {batch[-1]}, "
+                                 f"skipping {len(pending)} remaining pages")
+                    break
 
-                    result["pages_processed"].append(page_num)
+        # Standard OCR text for CIC 36/Section B header detection
+        all_text = _merge_page_text(page_numbers, text_layer_pages, page_texts)
+        result["pages_processed"] = list(all_text)
 
-            except Exception as e:
-                logger.debug(f"OCR failed for page {page_num}: {e}")
-                result["raw_text"][f"page_{page_num}_error"] = str(e)
+        # Method names keep their OCR variants but say where the text came from
+        method_prefix = "ocr_pytesseract"
+        if text_layer_pages and not ocr_pages:
+            method_prefix = "pdf_text_layer"
+            result["extraction_method"] = method_prefix
+        elif text_layer_pages:
+            result["text_layer_pages"] = sorted(text_layer_pages)
 
         result["raw_text"] = all_text
 
@@ -780,23 +1660,21 @@ def extract_section_b_ocr(pdf_path: str | Path, page_numbers: list,
         # First try CIC 36 start page, then fallback to searching all pages
         beneficiaries = ""
         if cic36_start_page and cic36_start_page in all_text:
-            section_a_text = all_text.get(cic36_start_page, "")
-            next_page = cic36_start_page + 1
-            if next_page in all_text:
-                section_a_text += "\n" + all_text.get(next_page, "")
-            beneficiaries = _extract_beneficiaries(section_a_text)
+            beneficiaries = _extract_beneficiaries(_section_a_text(all_text, cic36_start_page))
             if beneficiaries:
                 logger.debug(f"Extracted beneficiaries from CIC 36 page {cic36_start_page}")
 
         # Fallback: Search ALL pages for Section A header directly
         if not beneficiaries:
+            if pending:
+                _ocr_page_texts(pdf_path, pending, dpi, page_texts, executor)
+                pending = []
+                all_text = _merge_page_text(page_numbers, text_layer_pages, page_texts)
+                result["raw_text"] = all_text
+                result["pages_processed"] = list(all_text)
             section_a_page = _find_section_a_page(all_text)
             if section_a_page:
-                section_a_text = all_text.get(section_a_page, "")
-                next_page = section_a_page + 1
-                if next_page in all_text:
-                    section_a_text += "\n" + all_text.get(next_page, "")
-                beneficiaries = _extract_beneficiaries(section_a_text)
+                beneficiaries = _extract_beneficiaries(_section_a_text(all_text, section_a_page))
                 if beneficiaries:
                     logger.debug(f"Extracted beneficiaries from Section A page {section_a_page}")
 
@@ -818,13 +1696,23 @@ def extract_section_b_ocr(pdf_path: str | Path, page_numbers: list,
             section_b_text = _strip_section_b_boilerplate(section_b_text_raw)
             result["section_b_pages"] = section_b_pages
 
+            # Layout-aware OCR of the Section B pages only
+            layout_pages = [p for p in section_b_pages if p not in all_layout_data]
+            page_layouts, layout_errors = _ocr_pages(pdf_path, layout_pages, dpi,
+                                                     _ocr_page_layout, executor)
+            for page_num, e in layout_errors.items():
+                logger.debug(f"Layout OCR failed for page {page_num}: {e}")
+            for page_num, layout_result in page_layouts.items():
+                if layout_result is not None:
+                    all_layout_data[page_num] = layout_result
+
             # Check if any Section B pages have two-column layout
             has_layout_data = any(
                 all_layout_data.get(p, {}).get("has_two_columns", False)
                 for p in section_b_pages
             )
             if has_layout_data:
-                result["extraction_method"] = "ocr_pytesseract_layout"
+                result["extraction_method"] = f"{method_prefix}_layout"
                 # Store column data for parsing
                 result["layout_data"] = {
                     p: all_layout_data[p]
@@ -883,11 +1771,17 @@ def extract_section_b_ocr(pdf_path: str | Path, page_numbers: list,
             # Check if the extracted content is just referential ("Please see attached")
             if _is_referential_content(activities):
                 # Search for standalone Section B content in remaining pages
+                if pending:
+                    _ocr_page_texts(pdf_path, pending, dpi, page_texts, executor)
+                    pending = []
+                    all_text = _merge_page_text(page_numbers, text_layer_pages, page_texts)
+                    result["raw_text"] = all_text
+                    result["pages_processed"] = list(all_text)
                 standalone_activities = _find_standalone_section_b(all_text, section_b_pages)
                 if standalone_activities:
                     result["activities"] = standalone_activities
                     result["success"] = True
-                    result["extraction_method"] = "ocr_pytesseract_standalone"
+                    result["extraction_method"] = f"{method_prefix}_standalone"
                     result["note"] = "Content found via 'see attached' reference"
                 else:
                     # Keep original but mark as potentially incomplete
@@ -903,14 +1797,52 @@ def extract_section_b_ocr(pdf_path: str | Path, page_numbers: list,
             if activities:
                 result["activities"] = activities
                 result["success"] = True
-                result["extraction_method"] = "ocr_pytesseract_alternative"
+                result["extraction_method"] = f"{method_prefix}_alternative"
 
     except Exception as e:
         result["error"] = str(e)
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
 
     return result
 
 
+# Common words expected in readable CIC form text. Each word is a whole-word
+# alternative, so the distinct strings findall() returns are exactly the
+# words present.
+_COMMON_WORDS = ['the', 'and', 'for', 'will', 'community', 'be', 'to', 'of',
+                 'is', 'in', 'that', 'with', 'by', 'as', 'are', 'from']
+_COMMON_WORD_RE = re.compile(r'\b(?:' + '|'.join(_COMMON_WORDS) + r')\b')
+_CIC_COMMON_WORD_RE = re.compile(
+    r'\b(?:' + '|'.join(_COMMON_WORDS + ['company', 'benefit', 'activity', 'activities', 'section']) + r')\b')
+
+# Characteristic handwriting OCR errors; the alternatives use disjoint
+# character sets, so one findall() counts the same runs as three
+_UNUSUAL_SEQUENCE_RE = re.compile(
+    r'[bcdfghjklmnpqrstvwxyz]{5,}'  # Long consonant runs
+    r'|[aeiou]{4,}'  # Long vowel runs
+    r'|\|{2,}'  # Multiple pipe characters (common OCR error for handwriting)
+)
+# Consonant runs long enough to mark text as garbled
+_LONG_CONSONANT_RUN_RE = re.compile(r'[bcdfghjklmnpqrstvwxyz]{6,}')
+
+
+def _build_char_class_table() -> bytes:
+    """Byte translation table mapping vowels to V, consonants to C, OCR junk symbols to S."""
+    table = bytearray(b'_' * 256)
+    for c in b'aeiou':
+        table[c] = ord('V')
+    for c in b'bcdfghjklmnpqrstvwxyz':
+        table[c] = ord('C')
+    for c in b'{}[]|\\<>~`^@#$%&*+=':
+        table[c] = ord('S')
+    return bytes(table)
+
+
+_CHAR_CLASS_TABLE = _build_char_class_table()
+
+
 def _check_ocr_quality(text: str) -> str:
     """
     Assess OCR quality based on text characteristics.
@@ -924,10 +1856,13 @@ def _check_ocr_quality(text: str) -> str:
     if not text or len(text.strip()) < 50:
         return "very_low"
 
-    # Count vowels and consonants
+    # Count vowels, consonants and special characters: classify every
+    # character with one translate() and count the classes. Only ASCII
+    # characters are counted, so the rest are dropped by the encode.
     text_lower = text.lower()
-    vowels = sum(1 for c in text_lower if c in 'aeiou')
-    consonants = sum(1 for c in text_lower if c in 'bcdfghjklmnpqrstvwxyz')
+    char_classes = text_lower.encode('ascii', 'ignore').translate(_CHAR_CLASS_TABLE)
+    vowels = char_classes.count(b'V')
+    consonants = char_classes.count(b'C')
     letters = vowels + consonants
 
     if letters == 0:
@@ -937,15 +1872,15 @@ def _check_ocr_quality(text: str) -> str:
     vowel_ratio = vowels / letters if letters > 0 else 0
 
     # Check for common English words
-    common_words = ['the', 'and', 'for', 'will', 'community', 'be', 'to', 'of', 'is', 'in', 'that', 'with', 'by', 'as', 'are', 'from']
-    words_found = sum(1 for word in common_words if re.search(r'\b' + word + r'\b', text_lower))
+    words_found = len(set(_COMMON_WORD_RE.findall(text_lower)))
 
     # Check for excessive special characters (excluding normal punctuation)
-    special_chars = sum(1 for c in text if c in '{}[]|\\<>~`^@#$%&*+=')
+    # (lowercasing leaves these unchanged, so they are counted from text_lower)
+    special_chars = char_classes.count(b'S')
     special_ratio = special_chars / len(text) if len(text) > 0 else 0
 
     # Check for consecutive consonants (garbled text often has long consonant runs)
-    long_consonant_runs = len(re.findall(r'[bcdfghjklmnpqrstvwxyz]{6,}', text_lower))
+    long_consonant_runs = len(_LONG_CONSONANT_RUN_RE.findall(text_lower))
 
     # Determine quality
     if (vowel_ratio < 0.15 or vowel_ratio > 0.65 or
@@ -991,11 +1926,8 @@ def _is_likely_handwritten(text: str) -> bool:
     short_ratio = short_words / len(words)
 
     # Check for common English words that should appear in CIC forms
-    common_words = ['the', 'and', 'for', 'will', 'community', 'be', 'to', 'of',
-                    'is', 'in', 'that', 'with', 'by', 'as', 'are', 'from',
-                    'company', 'benefit', 'activity', 'activities', 'section']
     text_lower = text.lower()
-    words_found = sum(1 for word in common_words if re.search(r'\b' + word + r'\b', text_lower))
+    words_found = len(set(_CIC_COMMON_WORD_RE.findall(text_lower)))
 
     # Expected common words based on text length (~1 per 100 chars for printed text)
     expected_common_words = len(text) / 100
@@ -1011,18 +1943,27 @@ def _is_likely_handwritten(text: str) -> bool:
 
     # 3. Check for characteristic handwriting OCR errors
     # Handwriting often produces unusual character combinations
-    unusual_patterns = [
-        r'[bcdfghjklmnpqrstvwxyz]{5,}',  # Long consonant runs
-        r'[aeiou]{4,}',  # Long vowel runs
-        r'\|{2,}',  # Multiple pipe characters (common OCR error for handwriting)
-    ]
-    unusual_count = sum(len(re.findall(p, text_lower)) for p in unusual_patterns)
+    unusual_count = len(_UNUSUAL_SEQUENCE_RE.findall(text_lower))
     if unusual_count > 5:
         return True
 
     return False
 
 
+# Patterns that indicate IN01 form (company registration) content
+_WRONG_SECTION_RE = re.compile(
+    r'Application\s+to\s+register\s+a\s+company'
+    r'|Proposed\s+officers'
+    r'|appointment\s+of\s+a\s+secretary'
+    r'|For\s+a\s+secretary\s+who\s+is\s+an\s+individual'
+    r'|Private\s+companies\s+must\s+appoint'
+    r'|Public\s+companies\s+are\s+required'
+    r'|For\s+a\s+corporate\s+secretary'
+    r'|go\s+to\s+Section\s+[BC]\d',  # "go to Section B1", "go to Section C2"
+    re.IGNORECASE,
+)
+
+
 def _is_wrong_section_content(activities: list) -> bool:
     """
     Check if extracted content is from the wrong form section.
@@ -1033,31 +1974,28 @@ def _is_wrong_section_content(activities: list) -> bool:
     if not activities:
         return False
 
-    # Patterns that indicate IN01 form (company registration) content
-    wrong_section_patterns = [
-        r'Application\s+to\s+register\s+a\s+company',
-        r'Proposed\s+officers',
-        r'appointment\s+of\s+a\s+secretary',
-        r'For\s+a\s+secretary\s+who\s+is\s+an\s+individual',
-        r'Private\s+companies\s+must\s+appoint',
-        r'Public\s+companies\s+are\s+required',
-        r'For\s+a\s+corporate\s+secretary',
-        r'go\s+to\s+Section\s+[BC]\d',  # "go to Section B1", "go to Section C2"
-    ]
-
     # Check all activities
     for act in activities:
         activity_text = str(act.get("activity", ""))
         benefit_text = str(act.get("description", "") or act.get("benefit", ""))
         combined = activity_text + " " + benefit_text
 
-        for pattern in wrong_section_patterns:
-            if re.search(pattern, combined, re.IGNORECASE):
-                return True
+        if _WRONG_SECTION_RE.search(combined):
+            return True
 
     return False
 
 
+# "Please see attached" style references (matched against lowercased text)
+_REFERENTIAL_RE = re.compile(
+    r'please\s+see\s+attached'
+    r'|see\s+attached'
+    r'|refer\s+to\s+attached'
+    r'|as\s+per\s+attached'
+    r'|attached\s+(?:appendix|schedule|document)'
+)
+
+
 def _is_referential_content(activities: list) -> bool:
     """
     Check if extracted activities are just referential ("Please see attached").
@@ -1068,29 +2006,39 @@ def _is_referential_content(activities: list) -> bool:
     if not activities:
         return False
 
-    referential_patterns = [
-        r'please\s+see\s+attached',
-        r'see\s+attached',
-        r'refer\s+to\s+attached',
-        r'as\s+per\s+attached',
-        r'attached\s+(?:appendix|schedule|document)',
-    ]
-
     # Check all activities
     for act in activities:
         activity_text = str(act.get("activity", "")).lower()
         benefit_text = str(act.get("benefit", "")).lower()
         combined = activity_text + " " + benefit_text
 
-        for pattern in referential_patterns:
-            if re.search(pattern, combined):
-                # If found and content is short, it's likely just a reference
-                if len(combined.strip()) < 300:
-                    return True
+        # If found and content is short, it's likely just a reference
+        if _REFERENTIAL_RE.search(combined) and len(combined.strip()) < 300:
+            return True
 
     return False
 
 
+# Patterns for standalone Section B heading, tried in order (the first
+# pattern that matches decides where the content starts)
+_STANDALONE_HEADING_RES = tuple(re.compile(p, re.IGNORECASE) for p in [
+    r'Section\s*B\s*[:\-]?\s*(?:Community\s+Interest|Activities)',
+    r'Community\s+Interest\s+Statement\s*[-–—]?\s*Activities',
+    r'SECTION\s*B\b',
+])
+# Any of the above - one search rules out a page with no heading at all
+_STANDALONE_HEADING_ANY_RE = re.compile(
+    '|'.join(f'(?:{heading_re.pattern})' for heading_re in _STANDALONE_HEADING_RES), re.IGNORECASE)
+
+# End markers for standalone content, tried in order
+_STANDALONE_END_RES = tuple(re.compile(p, re.IGNORECASE) for p in [
+    r'Section\s*C',
+    r'Declaration',
+    r'Signature',
+    r'CHECKLIST',
+])
+
+
 def _find_standalone_section_b(all_text: dict, exclude_pages: list) -> list:
     """
     Search for standalone Section B content in pages not already processed.
@@ -1100,40 +2048,27 @@ def _find_standalone_section_b(all_text: dict, exclude_pages: list) -> list:
     """
     activities = []
     found_pages = set()
-
-    # Patterns for standalone Section B heading
-    standalone_patterns = [
-        r'Section\s*B\s*[:\-]?\s*(?:Community\s+Interest|Activities)',
-        r'Community\s+Interest\s+Statement\s*[-–—]?\s*Activities',
-        r'SECTION\s*B\b',
-    ]
+    exclude_pages = set(exclude_pages)
 
     # Search pages not in the exclude list
     for page_num, text in all_text.items():
         if page_num in exclude_pages:
             continue
 
-        if not isinstance(text, str):
+        if not isinstance(text, str) or not _STANDALONE_HEADING_ANY_RE.search(text):
             continue
 
         # Check for standalone Section B heading
-        for pattern in standalone_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for heading_re in _STANDALONE_HEADING_RES:
+            match = heading_re.search(text)
             if match:
                 # Found a Section B heading - extract content after it
                 content_start = match.end()
                 content = text[content_start:]
 
                 # Look for end markers
-                end_patterns = [
-                    r'Section\s*C',
-                    r'Declaration',
-                    r'Signature',
-                    r'CHECKLIST',
-                ]
-
-                for end_pattern in end_patterns:
-                    end_match = re.search(end_pattern, content, re.IGNORECASE)
+                for end_re in _STANDALONE_END_RES:
+                    end_match = end_re.search(content)
                     if end_match:
                         content = content[:end_match.start()]
                         break
@@ -1168,22 +2103,123 @@ def _deduplicate_activities(activities: list) -> list:
     unique = []
 
     for act in activities:
-        # Create a normalized key from activity text
-        activity_text = str(act.get("activity", "")).lower().strip()
-        # Use first 100 chars as key to handle minor OCR variations
-        key = activity_text[:100] if activity_text else ""
-
-        if key and key not in seen:
-            seen.add(key)
-            unique.append(act)
-        elif not key:
+        activity_text = act.get("activity", "")
+        if not isinstance(activity_text, str):
+            activity_text = str(activity_text)
+        # Use first 100 chars of the normalized text as key to handle
+        # minor OCR variations
+        key = activity_text.lower().strip()[:100]
+
+        if not key:
             # Keep activities with empty activity but non-empty benefit
             if act.get("benefit", "").strip():
                 unique.append(act)
+        elif key not in seen:
+            seen.add(key)
+            unique.append(act)
 
     return unique
 
 
+# Section B page detection patterns: lowercase, matched against lowercased
+# page text. Each list is compiled into a single alternation so
+# a page costs one search() per confidence tier.
+
+# HIGH CONFIDENCE: Exact CIC 36 Section B header boilerplate
+# Modern forms: "SECTION B: Community Interest Statement - Activities & Related Benefit"
+# Some documents use "SCHEDULE 2" instead of "SECTION B"
+# Legacy forms (circa 2006): "SECTION B: COMPANY ACTIVITIES" at beginning of document
+# Allow for OCR variations in spacing, punctuation (including periods), and & vs "and"
+# Also handle common OCR errors: I→1, B→8
+_SECTION_B_PRIMARY_HEADER_PATTERNS = [
+    # Modern form pattern
+    (
+        r'(?:sect[i1]on\s*[b8]|schedule\s*2)\s*[:\-\.]?\s*'
+        r'community\s+interest\s+statement\s*'
+        r'[-–—]?\s*'
+        r'(?:activities\s*(?:&|and)\s*related\s*benefit)?'
+    ),
+    # Legacy form pattern (circa 2006)
+    r'sect[i1]on\s*[b8]\s*[:\-\.]?\s*company\s+activities',
+    r'sect[i1]on\s*[b8][:\s\-\.]+company\s+activities',
+    # OCR-friendly patterns for "SECTION B"
+    r'sect[i1]on\s*[b8]\s*[:\-\.]',
+]
+
+# MEDIUM CONFIDENCE: Fallback patterns if exact header not found
+_SECTION_B_FALLBACK_HEADER_PATTERNS = [
+    # Section B with "Community Interest Statement" nearby
+    r'section\s*[b8][:\s\-]+\s*community\s+interest',
+    # The specific table column headers from Section B
+    r'activities\s+how\s+will\s+the\s+activity\s+benefit',
+    # Table instruction text unique to Section B
+    r'tell\s+us\s+here\s+what\s+the\s+company.*is\s+being\s+set\s+up\s+to\s+do',
+    r'\(the\s+community\s+will\s+benefit\s+by',
+    # Alternative: Just look for "Community Interest Statement"
+    r'community\s+interest\s+statement\s*[-–—]?\s*activities',
+]
+
+# LOW CONFIDENCE: Jumbled patterns for cross-column OCR reading
+_SECTION_B_JUMBLED_HEADER_PATTERNS = [
+    r'section.*community\s+interest.*b',
+    r'community\s+interest.*section.*b',
+    r'activity\s+benefit.*community',
+    r'benefit.*community.*activity',
+    r'company.*set\s+up\s+to\s+do',
+    r'set\s+up\s+to\s+do.*company',
+]
+
+# End markers that indicate Section B has ended (Section C is checked separately)
+_SECTION_B_END_MARKER_PATTERNS = [
+    r'signatories',
+    r'declaration\s+of\s+compliance',
+    r'checklist',
+]
+
+_SECTION_B_HEADER_TIERS = (
+    (re.compile('|'.join(f'(?:{p})' for p in _SECTION_B_PRIMARY_HEADER_PATTERNS)), "primary"),
+    (re.compile('|'.join(f'(?:{p})' for p in _SECTION_B_FALLBACK_HEADER_PATTERNS)), "fallback"),
+    (re.compile('|'.join(f'(?:{p})' for p in _SECTION_B_JUMBLED_HEADER_PATTERNS)), "jumbled"),
+)
+_SECTION_B_END_MARKER_RE = re.compile(
+    '|'.join(f'(?:{p})' for p in _SECTION_B_END_MARKER_PATTERNS))
+
+# Surplus statement that marks the end of Section B content
+_SECTION_B_SURPLUS_RE = re.compile(
+    r'[i1]f\s+the\s+company\s+makes\s+any\s+surplus'
+    r'|any\s+surplus\s+(?:gained|from\s+trading|will\s+be)'
+    r'|surplus\s+(?:it\s+)?will\s+be\s+(?:used|reinvested)',
+)
+
+_SECTION_C_RE = re.compile(r'sect[i1]on\s*c\b')
+
+
+@lru_cache(maxsize=256)
+def _section_b_markers(text: str) -> tuple:
+    """
+    Scan a page once for every marker _find_section_b_pages uses.
+
+    Cached on the page text, so the repeated Section B checks made while
+    pages are still being OCR'd don't rescan pages already seen.
+
+    Args:
+        text: Lowercased page text
+
+    Returns:
+        Tuple of (header_tier, has_surplus, has_section_c, has_end_marker),
+        where header_tier indexes the first matching entry of
+        _SECTION_B_HEADER_TIERS, or is None
+    """
+    header_tier = next((tier for tier, (header_re, _) in enumerate(_SECTION_B_HEADER_TIERS)
+                        if header_re.search(text)), None)
+    return (
+        header_tier,
+        _SECTION_B_SURPLUS_RE.search(text) is not None,
+        _SECTION_C_RE.search(text) is not None,
+        _SECTION_B_END_MARKER_RE.search(text) is not None,
+    )
+
+
 def _find_section_b_pages(all_text: dict, cic36_start_page: int = None) -> list:
     """
     Identify which pages contain Section B content.
@@ -1205,94 +2241,41 @@ def _find_section_b_pages(all_text: dict, cic36_start_page: int = None) -> list:
     section_b_pages = []
     header_page = None
 
-    # HIGH CONFIDENCE: Exact CIC 36 Section B header boilerplate
-    # Modern forms: "SECTION B: Community Interest Statement - Activities & Related Benefit"
-    # Some documents use "SCHEDULE 2" instead of "SECTION B"
-    # Legacy forms (circa 2006): "SECTION B: COMPANY ACTIVITIES" at beginning of document
-    # Allow for OCR variations in spacing, punctuation (including periods), and & vs "and"
-    # Also handle common OCR errors: I→1, B→8
-    primary_patterns = [
-        # Modern form pattern
-        (
-            r'(?:SECT[I1]ON\s*[B8]|SCHEDULE\s*2)\s*[:\-\.]?\s*'
-            r'Community\s+Interest\s+Statement\s*'
-            r'[-–—]?\s*'
-            r'(?:Activities\s*(?:&|and)\s*Related\s*Benefit)?'
-        ),
-        # Legacy form pattern (circa 2006)
-        r'SECT[I1]ON\s*[B8]\s*[:\-\.]?\s*COMPANY\s+ACTIVITIES',
-        r'Sect[i1]on\s*[B8][:\s\-\.]+Company\s+Activities',
-        # OCR-friendly patterns for "SECTION B"
-        r'SECT[I1]ON\s*[B8]\s*[:\-\.]',
-    ]
-
-    # MEDIUM CONFIDENCE: Fallback patterns if exact header not found
-    fallback_markers = [
-        # Section B with "Community Interest Statement" nearby
-        r'Section\s*[B8][:\s\-]+\s*Community\s+Interest',
-        # The specific table column headers from Section B
-        r'Activities\s+How\s+will\s+the\s+activity\s+benefit',
-        # Table instruction text unique to Section B
-        r'Tell\s+us\s+here\s+what\s+the\s+company.*is\s+being\s+set\s+up\s+to\s+do',
-        r'\(The\s+community\s+will\s+benefit\s+by',
-        # Alternative: Just look for "Community Interest Statement"
-        r'Community\s+Interest\s+Statement\s*[-–—]?\s*Activities',
-    ]
-
-    # LOW CONFIDENCE: Jumbled patterns for cross-column OCR reading
-    jumbled_markers = [
-        r'SECTION.*Community\s+Interest.*B',
-        r'Community\s+Interest.*SECTION.*B',
-        r'activity\s+benefit.*community',
-        r'benefit.*community.*activity',
-        r'company.*set\s+up\s+to\s+do',
-        r'set\s+up\s+to\s+do.*company',
-    ]
-
-    # End markers that indicate Section B has ended
-    end_markers = [
-        r'SECT[I1]ON\s*C\b',
-        r'Section\s*C\b',
-        r'SIGNATORIES',
-        r'Signatories',
-        r'Declaration\s+of\s+compliance',
-        r'CHECKLIST',
-    ]
+    # Normalize once to a page-ordered list of (page_num, text), dropping
+    # non-text entries, so the loops below need no lookups or type checks
+    pages = sorted((page_num, text) for page_num, text in all_text.items()
+                   if isinstance(text, str))
 
     # Determine which pages to search
-    sorted_pages = sorted(all_text.keys())
-
     if cic36_start_page is not None:
         # Section B is typically 2-5 pages after CIC 36 marker
         # Search from cic36_start_page+1 to cic36_start_page+6
         min_page = cic36_start_page + 1
         max_page = cic36_start_page + 6
-        pages_to_search = [p for p in sorted_pages if min_page <= p <= max_page]
-        logger.debug(f"Searching for Section B on pages {pages_to_search} (after CIC 36 on page {cic36_start_page})")
+        # Continuation pages follow the header, so earlier pages are never needed
+        pages = [(p, text) for p, text in pages if p >= min_page]
+        search_count = sum(1 for p, _ in pages if p <= max_page)
+        logger.debug(f"Searching for Section B on pages {[p for p, _ in pages[:search_count]]} (after CIC 36 on page {cic36_start_page})")
     else:
-        pages_to_search = sorted_pages
+        search_count = len(pages)
 
-    # Search for Section B header with priority: primary > fallback > jumbled
-    all_patterns = [
-        (primary_patterns, "primary"),
-        (fallback_markers, "fallback"),
-        (jumbled_markers, "jumbled"),
-    ]
+    # Lowercase, then scan for markers, once per page
+    pages = [(p, _section_b_markers(_lower_for_match(text)))
+             for p, text in pages]
 
-    for patterns, confidence in all_patterns:
+    # Search for Section B header with priority: primary > fallback > jumbled
+    header_index = None
+    for tier, (_, confidence) in enumerate(_SECTION_B_HEADER_TIERS):
+        for i in range(search_count):
+            page_num, markers = pages[i]
+            if markers[0] == tier:
+                header_index = i
+                header_page = page_num
+                section_b_pages.append(page_num)
+                logger.debug(f"Section B header found on page {page_num} ({confidence} confidence)")
+                break
         if header_page:
             break
-        for page_num in pages_to_search:
-            text = all_text.get(page_num, "")
-            if isinstance(text, str):
-                for pattern in patterns:
-                    if re.search(pattern, text, re.IGNORECASE):
-                        header_page = page_num
-                        section_b_pages.append(page_num)
-                        logger.debug(f"Section B header found on page {page_num} ({confidence} confidence)")
-                        break
-                if header_page:
-                    break
 
     # If we found a header page, include continuation pages
     # IMPORTANT: Section B ends with the surplus statement, not necessarily Section C
@@ -1300,66 +2283,120 @@ def _find_section_b_pages(all_text: dict, cic36_start_page: int = None) -> list:
     if header_page:
         found_surplus = False
 
-        # Surplus patterns that mark the end of Section B content
-        surplus_patterns = [
-            r'[I1]f\s+the\s+company\s+makes\s+any\s+surplus',
-            r'Any\s+surplus\s+(?:gained|from\s+trading|will\s+be)',
-            r'surplus\s+(?:it\s+)?will\s+be\s+(?:used|reinvested)',
-        ]
-
         # First check if surplus is on the header page itself
-        header_text = all_text.get(header_page, "")
-        for pattern in surplus_patterns:
-            if re.search(pattern, header_text, re.IGNORECASE):
-                found_surplus = True
-                logger.debug(f"Surplus marker found on header page {header_page}")
-                break
+        if pages[header_index][1][1]:
+            found_surplus = True
+            logger.debug(f"Surplus marker found on header page {header_page}")
 
         # If surplus not on header page, look at subsequent pages
         if not found_surplus:
-            for page_num in sorted_pages:
-                if page_num <= header_page:
-                    continue
-
-                text = all_text.get(page_num, "")
-                if not isinstance(text, str):
-                    continue
-
+            for page_num, (_, has_surplus, has_section_c, has_end_marker) in pages[header_index + 1:]:
                 # Include this page
                 section_b_pages.append(page_num)
 
                 # Check for surplus marker (primary end indicator)
-                for pattern in surplus_patterns:
-                    if re.search(pattern, text, re.IGNORECASE):
-                        found_surplus = True
-                        logger.debug(f"Surplus marker found on page {page_num}, stopping")
-                        break
-
-                if found_surplus:
+                if has_surplus:
+                    found_surplus = True
+                    logger.debug(f"Surplus marker found on page {page_num}, stopping")
                     break
 
                 # Check for Section C (secondary end marker)
-                section_c_match = re.search(r'SECT[I1]ON\s*C\b', text, re.IGNORECASE)
-                if section_c_match:
+                if has_section_c:
                     logger.debug(f"Section C found on page {page_num}, stopping")
                     break
 
                 # Check for other end markers
-                for end_pattern in end_markers[2:]:  # Skip Section C patterns
-                    if re.search(end_pattern, text, re.IGNORECASE):
-                        logger.debug(f"End marker found on page {page_num}, stopping")
-                        break
-                else:
-                    # Safety limit: don't go more than 4 pages beyond header
-                    if page_num > header_page + 4:
-                        logger.debug(f"Reached 4 pages after header, stopping")
-                        break
-                    continue
-                break
+                if has_end_marker:
+                    logger.debug(f"End marker found on page {page_num}, stopping")
+                    break
+
+                # Safety limit: don't go more than 4 pages beyond header
+                if page_num > header_page + 4:
+                    logger.debug(f"Reached 4 pages after header, stopping")
+                    break
 
     return sorted(set(section_b_pages))
 
 
+# End of the Section B column headers - the closing parenthesis of each
+# header's instruction text. Every pattern is tried; content starts after
+# the furthest match.
+_HEADER_END_RES = tuple(re.compile(p, re.IGNORECASE) for p in [
+    r'is\s+being\s+set\s+up\s+to\s+do\s*\)',  # End of left column header
+    r'\(The\s+community\s+will\s+benefit\s+by[^)]*\)',  # End of right column header
+    r'The\s+community\s+will\s+benefit\s+by\s*\.{0,3}\s*\)',
+])
+
+# Fallback table starts when no column header end is found, tried in order
+_TABLE_START_RES = tuple(re.compile(p, re.IGNORECASE) for p in [
+    r'Activities\s+How\s+will',
+    r'\(Tell\s+us\s+here\s+what\s+the\s+company',
+    # Legacy form patterns (circa 2006)
+    r'SECTION\s*B\s*[:\-\.]?\s*COMPANY\s+ACTIVITIES',
+    r'Section\s*B[:\s\-\.]+Company\s+Activities',
+])
+
+# End of Section B content when _SECTION_C_RE finds no Section C marker in
+# the lowercased text: fallbacks for malformed documents, tried in order;
+# the first that matches wins
+_TABLE_END_RES = tuple(re.compile(p, re.IGNORECASE) for p in [
+    r'SIGNATORIES',
+    r'Declaration\s+of\s+compliance',
+    r'CHECKLIST',
+])
+
+# Filter out form instruction text
+# These are the boilerplate instructions that appear in CIC36 forms
+# NOT actual activity content - must be removed before parsing.
+# Removed one after another, in order. Written lowercase and matched against
+# _lower_for_match(text), like the Section B boilerplate patterns.
+_FORM_INSTRUCTION_RES = tuple(re.compile(p) for p in [
+    # Main instruction paragraph patterns
+    r'please\s+indicate\s+how\s+it\s+is\s+proposed\s+that\s+the\s+activities.*?community[,.]?\s*',
+    r'please\s+indicate\s+how\s+it\s+is\s+proposed',
+    r'please\s+provide\s+as\s+much\s+detail\s+as\s+possible',
+    r'to\s+enable\s+the\s+(?:cic\s+)?regulator\s+to\s+make\s+an?\s*(?:properly\s+)?informed\s+decision',
+    r'to\s+enable\s+the\s+(?:cic\s+)?regulator',
+    r'make\s+(?:a\s+properly\s+)?informed\s+decision\s+(?:about\s+)?(?:whether\s+)?',
+    r'whether\s+your\s+(?:proposed\s+)?company\s+is\s+eligible',
+    r'eligible\s+to\s+(?:be(?:come)?|become)\s+a\s+community\s+interest',
+    r'would\s+(?:be\s+)?useful\s+if\s+you\s+were\s+to\s+explain',
+    r'it\s+would\s+(?:be\s+)?useful\s+if\s+you',
+    r'different\s+from\s+a\s+commercial\s+company',
+    r'providing\s+similar\s+services\s+or\s+products',
+    r'individual\s*,?\s*(?:or\s+)?personal\s+gain',
+    r'think\s+your\s+company\s+will\s+be\s+for\s+individual\s+or\s+personal\s+gain',
+    # Form header text that gets mixed in
+    r'company\s+name\b',
+    r"that\s+the\s+company['']?s\s+activities\s+will\s+benefit\s+the\s+community[,.]?\s*(?:or\s+a\s+section\s+of\s+the\s+community)?",
+    r'or\s+a\s+section\s+of\s+the\s+community',
+    # Column header instruction text
+    r'activities\s+how\s+will\s+the\s+activity\s+benefit\s+the\s+community\??\s*',
+    r'how\s+will\s+the\s+activity\s+benefit\s+the\s+community\??\s*',
+    # Parenthetical instructions from column headers
+    r'\(tell\s+us\s+here\s+what\s+the\s+company[^)]*\)',
+    r'\(the\s+community\s+will\s+benefit\s+by[^)]*\)',
+    r'\(please\s+continue\s+on[^)]*\)',
+    # Version footer text
+    r'version\s+\d+\s*[-–—]\s*last\s+updated\s+on\s+\d{2}/\d{2}/\d{4}',
+    r'version\s+\d+\s*[-–—]?\s*last\s+updated',
+    # Legacy form (2006) boilerplate - extracted separately
+])
+
+# Standalone instruction fragments - partial phrases left on a line of
+# their own after the above removals. Each match is a whole line with its
+# newline; [^\S\n] keeps every match within one line.
+_INSTRUCTION_FRAGMENT_LINE_RE = re.compile(
+    r'^(?:[^\S\n]|[,\.])*(?:'
+    r'that[^\S\n]+the[^\S\n]+company(?:[^\S\n]|[,\.])*'
+    r'|a[^\S\n]+section[^\S\n]+of[^\S\n]+the[^\S\n]+community(?:[^\S\n]|[,\.])*'
+    r'|SECTION[^\S\n]+B(?:[^\S\n]|[:,\.])*'
+    r'|Community[^\S\n]+Interest[^\S\n]+Statement(?:[^\S\n]|[,\.—\-])*'
+    r')\n',
+    re.IGNORECASE | re.MULTILINE,
+)
+
+
 def _parse_ocr_text_for_activities(text: str) -> list:
     """
     Parse OCR text to extract activities and benefits from Section B.
@@ -1387,118 +2424,54 @@ def _parse_ocr_text_for_activities(text: str) -> list:
     # CIC 36 form typically has: "Activities | How will the activity benefit..."
     # We need to skip past all the column header text
 
-    # Find the end of column headers - look for the closing parenthesis pattern
-    header_end_patterns = [
-        r'is\s+being\s+set\s+up\s+to\s+do\s*\)',  # End of left column header
-        r'\(The\s+community\s+will\s+benefit\s+by[^)]*\)',  # End of right column header
-        r'The\s+community\s+will\s+benefit\s+by\s*\.{0,3}\s*\)',
-    ]
-
     # Find where the actual table content starts (after column headers)
     table_content_start = 0
-    for pattern in header_end_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+    for header_end_re in _HEADER_END_RES:
+        match = header_end_re.search(text)
         if match:
             table_content_start = max(table_content_start, match.end())
 
     # If no header found, try simpler patterns
     if table_content_start == 0:
-        simple_patterns = [
-            r'Activities\s+How\s+will',
-            r'\(Tell\s+us\s+here\s+what\s+the\s+company',
-            # Legacy form patterns (circa 2006)
-            r'SECTION\s*B\s*[:\-\.]?\s*COMPANY\s+ACTIVITIES',
-            r'Section\s*B[:\s\-\.]+Company\s+Activities',
-        ]
-        for pattern in simple_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for table_start_re in _TABLE_START_RES:
+            match = table_start_re.search(text)
             if match:
                 table_content_start = match.end()
                 break
 
     # PRIMARY BOUNDARY: All Section B content is between "SECTION B" and "SECTION C"
     # This is the most reliable rule for CIC 36 forms
-    section_end_patterns = [
-        # Primary: Section C marker (with OCR error handling)
-        r'SECT[I1]ON\s*C\b',
-        r'Section\s*C\b',
-        # Secondary fallbacks (for malformed documents)
-        r'SIGNATORIES',
-        r'Signatories',
-        r'Declaration\s+of\s+compliance',
-        r'CHECKLIST',
-    ]
-
-    section_content = text[table_content_start:]
-    end_pos = len(section_content)
-    for pattern in section_end_patterns:
-        match = re.search(pattern, section_content, re.IGNORECASE)
-        if match:
-            end_pos = min(end_pos, match.start())
-            break  # Stop at first match - Section C is definitive
-    section_content = section_content[:end_pos]
-
-    # Filter out form instruction text
-    # These are the boilerplate instructions that appear in CIC36 forms
-    # NOT actual activity content - must be removed before parsing
-    form_instructions = [
-        # Main instruction paragraph patterns
-        r'Please\s+indicate\s+how\s+it\s+is\s+proposed\s+that\s+the\s+activities.*?community[,.]?\s*',
-        r'Please\s+indicate\s+how\s+it\s+is\s+proposed',
-        r'Please\s+provide\s+as\s+much\s+detail\s+as\s+possible',
-        r'to\s+enable\s+the\s+(?:CIC\s+)?Regulator\s+to\s+make\s+an?\s*(?:properly\s+)?informed\s+decision',
-        r'to\s+enable\s+the\s+(?:CIC\s+)?Regulator',
-        r'make\s+(?:a\s+properly\s+)?informed\s+decision\s+(?:about\s+)?(?:whether\s+)?',
-        r'whether\s+your\s+(?:proposed\s+)?company\s+is\s+eligible',
-        r'eligible\s+to\s+(?:be(?:come)?|become)\s+a\s+community\s+interest',
-        r'would\s+(?:be\s+)?useful\s+if\s+you\s+were\s+to\s+explain',
-        r'[Ii]t\s+would\s+(?:be\s+)?useful\s+if\s+you',
-        r'different\s+from\s+a\s+commercial\s+company',
-        r'providing\s+similar\s+services\s+or\s+products',
-        r'individual\s*,?\s*(?:or\s+)?personal\s+gain',
-        r'think\s+your\s+company\s+will\s+be\s+for\s+individual\s+or\s+personal\s+gain',
-        # Form header text that gets mixed in
-        r'COMPANY\s+NAME\b',
-        r"that\s+the\s+company['']?s\s+activities\s+will\s+benefit\s+the\s+community[,.]?\s*(?:or\s+a\s+section\s+of\s+the\s+community)?",
-        r'or\s+a\s+section\s+of\s+the\s+community',
-        # Column header instruction text
-        r'Activities\s+How\s+will\s+the\s+activity\s+benefit\s+the\s+community\??\s*',
-        r'How\s+will\s+the\s+activity\s+benefit\s+the\s+community\??\s*',
-        # Parenthetical instructions from column headers
-        r'\(Tell\s+us\s+here\s+what\s+the\s+company[^)]*\)',
-        r'\(The\s+community\s+will\s+benefit\s+by[^)]*\)',
-        r'\(Please\s+continue\s+on[^)]*\)',
-        # Version footer text
-        r'Version\s+\d+\s*[-–—]\s*Last\s+Updated\s+on\s+\d{2}/\d{2}/\d{4}',
-        r'Version\s+\d+\s*[-–—]?\s*Last\s+Updated',
-        # Legacy form (2006) boilerplate - extracted separately
-    ]
-
-    # Remove form instructions
-    cleaned_content = section_content
-    for pattern in form_instructions:
-        cleaned_content = re.sub(pattern, '', cleaned_content, flags=re.IGNORECASE)
-
-    # Also remove any standalone instruction fragments
-    # These are partial phrases that remain after the above removals
-    instruction_fragments = [
-        r'^[\s,\.]*that\s+the\s+company[\s,\.]*$',
-        r'^[\s,\.]*a\s+section\s+of\s+the\s+community[\s,\.]*$',
-        r'^[\s,\.]*SECTION\s+B[\s:,\.]*$',
-        r'^[\s,\.]*Community\s+Interest\s+Statement[\s,\.—\-]*$',
-    ]
-    lines = cleaned_content.split('\n')
-    cleaned_lines = []
-    for line in lines:
-        stripped = line.strip()
-        is_fragment = False
-        for frag_pattern in instruction_fragments:
-            if re.match(frag_pattern, stripped, re.IGNORECASE):
-                is_fragment = True
-                break
-        if not is_fragment:
-            cleaned_lines.append(line)
-    cleaned_content = '\n'.join(cleaned_lines)
+    # Searched from table_content_start in place, so only the final
+    # section is copied out of text
+    # Lowercasing keeps the text length, so match positions index into text
+    match = _SECTION_C_RE.search(_lower_for_match(text), table_content_start)
+    if not match:
+        for table_end_re in _TABLE_END_RES:
+            match = table_end_re.search(text, table_content_start)
+            if match:
+                break  # Stop at first match
+    end_pos = match.start() if match else len(text)
+    section_content = text[table_content_start:end_pos]
+
+    # A blank section (header-only or empty pages) can't yield activities -
+    # skip the instruction passes; the parsers return at once on empty text
+    if not section_content.strip():
+        cleaned_content = ""
+    else:
+        # Remove form instructions, cutting the spans found in the
+        # lowercased copy from both strings to keep them aligned
+        cleaned_content = section_content
+        lowered = _lower_for_match(section_content)
+        for form_instruction_re in _FORM_INSTRUCTION_RES:
+            spans = [m.span() for m in form_instruction_re.finditer(lowered)]
+            if spans:
+                cleaned_content = _remove_spans(cleaned_content, spans)
+                lowered = _remove_spans(lowered, spans)
+
+        # Also remove any standalone instruction fragments. With a newline
+        # appended every line ends in one, so each fragment line is removed
+        # whole; the appended newline is dropped again afterwards.
+        cleaned_content = _INSTRUCTION_FRAGMENT_LINE_RE.sub('', cleaned_content + '\n')[:-1]
 
     # First, try the two-column table parser for legacy forms
     # This handles OCR that reads across columns (activity | benefit on same line)
@@ -1540,6 +2513,16 @@ def _parse_ocr_text_for_activities(text: str) -> list:
     return activities
 
 
+# Final cleanup - remove any leading boilerplate that slipped through
+# This catches OCR-jumbled text that starts with boilerplate fragments
+_LEADING_BOILERPLATE_RES = tuple(re.compile(p, re.IGNORECASE | re.MULTILINE) for p in [
+    r'^\s*\.\s*[Ii][tf]\s+would\s+[^\n]*?\n*',
+    r'^\s*[Ii][tf]\s+would\s+think\s+[^\n]*?\n*',
+    r'^[^a-zA-Z]*[Ii][tf]\s+would\s+[^\n]*?\n*',
+    r'^\s*\.\s+',  # Leading period and space
+])
+
+
 def _parse_ocr_with_layout(layout_data: dict, linear_text: str, raw_text: str = None) -> list:
     """
     Parse OCR results using layout-aware column separation.
@@ -1595,17 +2578,9 @@ def _parse_ocr_with_layout(layout_data: dict, linear_text: str, raw_text: str =
     activity_text = "\n".join(all_left_text).strip()
     benefit_text = "\n".join(all_right_text).strip()
 
-    # Final cleanup - remove any leading boilerplate that slipped through
-    # This catches OCR-jumbled text that starts with boilerplate fragments
-    leading_boilerplate_patterns = [
-        r'^\s*\.\s*[Ii][tf]\s+would\s+[^\n]*?\n*',
-        r'^\s*[Ii][tf]\s+would\s+think\s+[^\n]*?\n*',
-        r'^[^a-zA-Z]*[Ii][tf]\s+would\s+[^\n]*?\n*',
-        r'^\s*\.\s+',  # Leading period and space
-    ]
-    for pattern in leading_boilerplate_patterns:
-        activity_text = re.sub(pattern, '', activity_text, flags=re.IGNORECASE | re.MULTILINE)
-        benefit_text = re.sub(pattern, '', benefit_text, flags=re.IGNORECASE | re.MULTILINE)
+    for leading_boilerplate_re in _LEADING_BOILERPLATE_RES:
+        activity_text = leading_boilerplate_re.sub('', activity_text)
+        benefit_text = leading_boilerplate_re.sub('', benefit_text)
 
     activity_text = activity_text.strip()
     benefit_text = benefit_text.strip()
@@ -1622,32 +2597,83 @@ def _parse_ocr_with_layout(layout_data: dict, linear_text: str, raw_text: str =
             "extraction_note": "layout_aware_ocr"
         })
 
-    # If layout parsing didn't produce good results, fall back to linear parsing
-    # But preserve surplus_use from raw_text extraction (it's more accurate)
-    if not activities or (not activity_text and not benefit_text):
+    # If layout parsing didn't produce good results, fall back to linear parsing.
+    # Layout results that look like mostly boilerplate or garbage fall back too:
+    # - very short activity text - probably failed extraction
+    # - very short benefit text - layout probably failed, benefit is garbage
+    # The linear parser extracts company_differs from the stripped linear text
+    # itself, but surplus_use from raw_text is kept (it's more accurate)
+    if (not activities
+            or (activity_text and len(activity_text) < 50)
+            or (benefit_text and len(benefit_text) < 20)):
         fallback = _parse_ocr_text_for_activities(linear_text)
         if fallback and surplus_use:
             fallback[0]["surplus_use"] = surplus_use
         return fallback
 
-    # Validate layout results - if they look like mostly boilerplate or garbage, fall back
-    # Check if activity text is too short (likely just fragments) or benefit is empty/minimal
-    if activity_text and len(activity_text) < 50:
-        # Very short activity - probably failed extraction
-        fallback = _parse_ocr_text_for_activities(linear_text)
-        if fallback and surplus_use:
-            fallback[0]["surplus_use"] = surplus_use
-        return fallback
+    return activities
 
-    if benefit_text and len(benefit_text) < 20:
-        # Very short benefit - layout probably failed, benefit is garbage
-        # Fall back to linear parsing
-        fallback = _parse_ocr_text_for_activities(linear_text)
-        if fallback and surplus_use:
-            fallback[0]["surplus_use"] = surplus_use
-        return fallback
 
-    return activities
+# Common patterns to remove from both columns
+_LAYOUT_COMMON_RES = tuple(re.compile(p, re.IGNORECASE) for p in [
+    r'SECTION\s*B\s*[:\-]?\s*',
+    r'Community\s+Interest\s+Statement\s*[-–—]?\s*',
+    r'Activities\s*(?:&|and)\s*Related\s*Benefit\s*',
+    r'COMPANY\s+NAME\s*',
+    r'Version\s+\d+\s*[-–—]?\s*Last\s+Updated[^\\n]*',
+    r'\(Please\s+continue\s+on[^)]*\)',
+    # Additional boilerplate fragments that may remain after stripping
+    r'a\s+section\s+of\s+the\s+community[.,]?\s*',
+    r'to\s+enable\s+the\s+CIC\s+Regulator[^.]*\.?\s*',
+    r'informed\s+decision\s+about[^.]*\.?\s*',
+    r'eligible\s+to\s+become[^.]*\.?\s*',
+    r'would\s+be\s+useful\s+if\s+you[^.]*\.?\s*',
+    r'different\s+from\s+a\s+commercial[^.]*\.?\s*',
+    r'for\s+individual[,]?\s*(?:or\s+)?personal\s+gain\.?\s*',
+    # OCR-mangled boilerplate fragments (jumbled from layout OCR)
+    r'\.?\s*[Ii][tf]\s+would\s+(?:be\s+)?(?:useful|think)[^.]*\.?\s*',
+    r'your\s+company\s+will\s+be\s+different[^.]*\.?\s*',
+    r'think\s+your\s+company[^.]*\.?\s*',
+    r'company\s+providing\s+similar\s+services[^.]*\.?\s*',
+    r'products?\s+for\s+individual[^.]*\.?\s*',
+    # Leading boilerplate fragments
+    r'^\s*\.\s*[Ii][tf]\s+would\s+',
+    r'^\s*[Ii][tf]\s+would\s+think\s+',
+])
+
+# Activity column (left) specific patterns
+_LAYOUT_ACTIVITY_RES = tuple(re.compile(p, re.IGNORECASE) for p in [
+    r'Activities\s*$',
+    r'^\s*Activities\s*',
+    r'\(Tell\s+us\s+here\s+what\s+the\s+company[^)]*\)',
+    r'Tell\s+us\s+here\s+what\s+the\s+company[^.]*\.?\s*',
+    r'is\s+being\s+set\s+up\s+to\s+do\.?\s*\)?\s*',
+    r'\(Please\s+provide\s+the\s+day\s+to\s+day[^)]*\)',
+    r'Please\s+provide\s+the\s+day\s+to\s+day[^.]*\.?\s*',
+    # Split boilerplate instruction fragments (from layout OCR splitting)
+    r'Please\s+indicate\s+how\s+i[tf]\s+[i1]s\s+proposed[^.]*\.?\s*',
+    r'Regulator\s+to\s+make\s+an\s+informed\s+decision[^.]*\.?\s*',
+    r'become\s+a\s+community\s+interest\s+company[^.]*\.?\s*',
+    r'Activities\s+How\s+will\s*',
+    r'COMPANY\s+NAME\s+[A-Z][a-z]+\s*',
+])
+
+# Benefit column (right) specific patterns
+_LAYOUT_BENEFIT_RES = tuple(re.compile(p, re.IGNORECASE) for p in [
+    r'How\s+will\s+the\s+activity\s+benefit\s+the\s+community\??\s*',
+    r'\(The\s+community\s+will\s+benefit\s+by[^)]*\)',
+    r'The\s+community\s+will\s+benefit\s+by[^)]*\)?\s*',
+    # Split boilerplate instruction fragments (from layout OCR splitting)
+    r'company.?s?\s+activities\s+will\s+benefit\s+the\s+community[^.]*\.?\s*',
+    r'much\s+detail\s+as\s+possible\s+to\s+enable[^.]*\.?\s*',
+    r'whether\s+your\s+(?:proposed\s+)?company\s+[it]s\s+eligible[^.]*\.?\s*',
+    r'be\s+useful\s+if\s+you\s+were\s+to\s+explain[^.]*\.?\s*',
+    r'commercial\s+company\s+providing\s+similar[^.]*\.?\s*',
+    r'the\s+activity\s+benefit\s+the\s+community\??\s*',
+    # Company name fragments
+    r'Healthy\s+Choices\s+CIC\s*[�\-]?\s*',
+    r'[A-Z][a-z]+\s+[A-Z][a-z]+\s+CIC\s*[�\-]?\s*',
+])
 
 
 def _clean_layout_column(text: str, is_activity: bool = True) -> str:
@@ -1670,83 +2696,45 @@ def _clean_layout_column(text: str, is_activity: bool = True) -> str:
     # First apply the comprehensive boilerplate stripping
     cleaned = _strip_section_b_boilerplate(text)
 
-    # Common patterns to remove from both columns
-    common_patterns = [
-        r'SECTION\s*B\s*[:\-]?\s*',
-        r'Community\s+Interest\s+Statement\s*[-–—]?\s*',
-        r'Activities\s*(?:&|and)\s*Related\s*Benefit\s*',
-        r'COMPANY\s+NAME\s*',
-        r'Version\s+\d+\s*[-–—]?\s*Last\s+Updated[^\\n]*',
-        r'\(Please\s+continue\s+on[^)]*\)',
-        # Additional boilerplate fragments that may remain after stripping
-        r'a\s+section\s+of\s+the\s+community[.,]?\s*',
-        r'to\s+enable\s+the\s+CIC\s+Regulator[^.]*\.?\s*',
-        r'informed\s+decision\s+about[^.]*\.?\s*',
-        r'eligible\s+to\s+become[^.]*\.?\s*',
-        r'would\s+be\s+useful\s+if\s+you[^.]*\.?\s*',
-        r'different\s+from\s+a\s+commercial[^.]*\.?\s*',
-        r'for\s+individual[,]?\s*(?:or\s+)?personal\s+gain\.?\s*',
-        # OCR-mangled boilerplate fragments (jumbled from layout OCR)
-        r'\.?\s*[Ii][tf]\s+would\s+(?:be\s+)?(?:useful|think)[^.]*\.?\s*',
-        r'your\s+company\s+will\s+be\s+different[^.]*\.?\s*',
-        r'think\s+your\s+company[^.]*\.?\s*',
-        r'company\s+providing\s+similar\s+services[^.]*\.?\s*',
-        r'products?\s+for\s+individual[^.]*\.?\s*',
-        # Leading boilerplate fragments
-        r'^\s*\.\s*[Ii][tf]\s+would\s+',
-        r'^\s*[Ii][tf]\s+would\s+think\s+',
-    ]
-
-    # Activity column (left) specific patterns
-    activity_patterns = [
-        r'Activities\s*$',
-        r'^\s*Activities\s*',
-        r'\(Tell\s+us\s+here\s+what\s+the\s+company[^)]*\)',
-        r'Tell\s+us\s+here\s+what\s+the\s+company[^.]*\.?\s*',
-        r'is\s+being\s+set\s+up\s+to\s+do\.?\s*\)?\s*',
-        r'\(Please\s+provide\s+the\s+day\s+to\s+day[^)]*\)',
-        r'Please\s+provide\s+the\s+day\s+to\s+day[^.]*\.?\s*',
-        # Split boilerplate instruction fragments (from layout OCR splitting)
-        r'Please\s+indicate\s+how\s+i[tf]\s+[i1]s\s+proposed[^.]*\.?\s*',
-        r'Regulator\s+to\s+make\s+an\s+informed\s+decision[^.]*\.?\s*',
-        r'become\s+a\s+community\s+interest\s+company[^.]*\.?\s*',
-        r'Activities\s+How\s+will\s*',
-        r'COMPANY\s+NAME\s+[A-Z][a-z]+\s*',
-    ]
-
-    # Benefit column (right) specific patterns
-    benefit_patterns = [
-        r'How\s+will\s+the\s+activity\s+benefit\s+the\s+community\??\s*',
-        r'\(The\s+community\s+will\s+benefit\s+by[^)]*\)',
-        r'The\s+community\s+will\s+benefit\s+by[^)]*\)?\s*',
-        # Split boilerplate instruction fragments (from layout OCR splitting)
-        r'company.?s?\s+activities\s+will\s+benefit\s+the\s+community[^.]*\.?\s*',
-        r'much\s+detail\s+as\s+possible\s+to\s+enable[^.]*\.?\s*',
-        r'whether\s+your\s+(?:proposed\s+)?company\s+[it]s\s+eligible[^.]*\.?\s*',
-        r'be\s+useful\s+if\s+you\s+were\s+to\s+explain[^.]*\.?\s*',
-        r'commercial\s+company\s+providing\s+similar[^.]*\.?\s*',
-        r'the\s+activity\s+benefit\s+the\s+community\??\s*',
-        # Company name fragments
-        r'Healthy\s+Choices\s+CIC\s*[�\-]?\s*',
-        r'[A-Z][a-z]+\s+[A-Z][a-z]+\s+CIC\s*[�\-]?\s*',
-    ]
-
     # Apply common patterns
-    for pattern in common_patterns:
-        cleaned = re.sub(pattern, '', cleaned, flags=re.IGNORECASE)
+    for common_re in _LAYOUT_COMMON_RES:
+        cleaned = common_re.sub('', cleaned)
 
     # Apply column-specific patterns
-    patterns = activity_patterns if is_activity else benefit_patterns
-    for pattern in patterns:
-        cleaned = re.sub(pattern, '', cleaned, flags=re.IGNORECASE)
+    for column_re in (_LAYOUT_ACTIVITY_RES if is_activity else _LAYOUT_BENEFIT_RES):
+        cleaned = column_re.sub('', cleaned)
 
     # Normalize whitespace
-    cleaned = re.sub(r'\s+', ' ', cleaned)
-    cleaned = cleaned.strip()
+    cleaned = ' '.join(cleaned.split())
 
     return cleaned
 
 
+# Explicit "The community will benefit" markers that split columns
+_BENEFIT_MARKER_RE = re.compile(
+    r'The\s+community\s+will\s+benefit\s+(?:by\s+)?'
+    r'|community\s+will\s+benefit\s+significantly'
+    r'|\|\s*(?:The\s+)?community',  # Pipe separator from OCR
+    re.IGNORECASE,
+)
+_BENEFIT_SPLIT_RE = re.compile(
+    r'(The\s+community\s+will\s+benefit\s+(?:by\s+)?(?:significantly\s+)?(?:as\s+)?)', re.IGNORECASE)
+_BENEFIT_LEAD_RE = re.compile(r'The\s+community\s+will\s+benefit', re.IGNORECASE)
+
+
+def _benefit_split_parts(text: str):
+    """
+    Yield text split at benefit markers, markers included, like
+    _BENEFIT_SPLIT_RE.split(text) but without building the list.
+    """
+    prev_end = 0
+    for match in _BENEFIT_SPLIT_RE.finditer(text):
+        yield text[prev_end:match.start()]
+        yield match.group()
+        prev_end = match.end()
+    yield text[prev_end:]
+
+
 def _parse_two_column_table(text: str, full_text: str = None) -> list:
     """
     Parse OCR text from a two-column table where columns are read side-by-side.
@@ -1774,60 +2762,44 @@ def _parse_two_column_table(text: str, full_text: str = None) -> list:
         return line_based_result
 
     # Fall back to benefit marker splitting
-    # Look for explicit "The community will benefit" markers that split columns
-    benefit_markers = [
-        r'The\s+community\s+will\s+benefit\s+(?:by\s+)?',
-        r'community\s+will\s+benefit\s+significantly',
-        r'\|\s*(?:The\s+)?community',  # Pipe separator from OCR
-    ]
-
-    # Check if text has clear benefit markers
-    has_benefit_marker = False
-    for marker in benefit_markers:
-        if re.search(marker, text, re.IGNORECASE):
-            has_benefit_marker = True
-            break
-
-    if not has_benefit_marker:
+    # Check if text has clear benefit markers. Every marker contains
+    # "community", and a substring test rules most text out far faster
+    # than the regex.
+    if 'community' not in _lower_for_match(text) or not _BENEFIT_MARKER_RE.search(text):
         return activities  # Let other parsers handle it
 
-    # Split by "The community will benefit" pattern
-    # This should give us [activity, benefit, activity, benefit, ...]
-    split_pattern = r'(The\s+community\s+will\s+benefit\s+(?:by\s+)?(?:significantly\s+)?(?:as\s+)?)'
-    parts = re.split(split_pattern, text, flags=re.IGNORECASE)
-
-    # Process pairs: each activity followed by benefit marker + benefit text
-    current_activity = ""
-    i = 0
-    while i < len(parts):
-        part = parts[i].strip()
-
-        # Check if this is a benefit marker
-        if re.match(r'The\s+community\s+will\s+benefit', part, re.IGNORECASE):
-            # Next part is the benefit text
-            if i + 1 < len(parts):
-                benefit_text = parts[i + 1].strip()
-
-                if current_activity:
-                    # Clean up activity - remove trailing fragments
-                    activity_clean = _clean_activity_text(current_activity)
-                    benefit_clean = _clean_benefit_text(benefit_text)
-
-                    if activity_clean or benefit_clean:
-                        activities.append({
-                            "activity": activity_clean,
-                            "benefit": benefit_clean,
-                            "source_page": 0,
-                            "ocr_confidence": "medium"
-                        })
-                    current_activity = ""
-                i += 2
-            else:
-                i += 1
-        else:
-            # This is activity text (or mixed content)
-            current_activity += " " + part if current_activity else part
-            i += 1
+    # Walk the text split at "The community will benefit" markers
+    # This gives us activity, marker, benefit, marker, benefit, ...
+    # Each marker's following part is its benefit text; anything else is
+    # activity text, collected until the next benefit
+    activity_parts = []
+    expect_benefit = False
+    for part in _benefit_split_parts(text):
+        part = part.strip()
+
+        if expect_benefit:
+            expect_benefit = False
+            if activity_parts:
+                # Clean up activity - remove trailing fragments
+                activity_clean = _clean_activity_text(" ".join(activity_parts))
+                benefit_clean = _clean_benefit_text(part)
+
+                if activity_clean or benefit_clean:
+                    activities.append({
+                        "activity": activity_clean,
+                        "benefit": benefit_clean,
+                        "source_page": 0,
+                        "ocr_confidence": "medium"
+                    })
+                activity_parts = []
+        elif _BENEFIT_LEAD_RE.match(part):
+            # Check if this is a benefit marker - the next part is the benefit text
+            expect_benefit = True
+        elif part or activity_parts:
+            # This is activity text (or mixed content); leading empty
+            # parts add nothing
+            activity_parts.append(part)
+    current_activity = " ".join(activity_parts)
 
     # Handle any remaining activity without a benefit
     if current_activity.strip():
@@ -1850,6 +2822,39 @@ def _parse_two_column_table(text: str, full_text: str = None) -> list:
     return activities
 
 
+# Look for table start - after column headers
+_INTERLEAVED_START_RES = tuple(re.compile(p, re.IGNORECASE) for p in [
+    r'\(The\s+community\s+will\s+benefit\s+by[^)]*\)',
+    r'is\s+being\s+set\s+up\s+to\s+do\s*\)',
+])
+
+# Look for table end - these patterns indicate end of table content
+# Be more aggressive about detecting post-table content. The table ends at
+# the earliest of them, so they are one alternation.
+_INTERLEAVED_END_RE = re.compile(
+    r'(?:Our\s+)?company\s+differs\s+from\s+a?\s*general'  # "Our company differs..." or "company differs..."
+    r'|differs\s+from\s+a\s+general\s+commercial'
+    r'|If\s+the\s+company\s+makes\s+any\s+surplus'
+    r'|company\s+makes\s+any\s+surplus'
+    r'|its\s+primary\s+aim\s+is\s+to'  # Common start of "differs" explanation
+    r'|Section\s*C'
+    r'|SIGNATORIES'
+    r'|\(Please\s+continue\s+on',
+    re.IGNORECASE,
+)
+
+# Line-level column split points: "The community will benefit" partway
+# through a line, then other phrases that usually open the benefit column
+_BENEFIT_IN_LINE_RE = re.compile(r'^(.+?)\s+(The\s+community\s+will\s+benefit.*)$', re.IGNORECASE)
+_BENEFIT_INDICATOR_IN_LINE_RE = re.compile(
+    r'^(.{20,}?)\s+(having\s+access|young\s+people\s+will|significantly|towards\s+the)', re.IGNORECASE)
+# Lowercase literals each split pattern needs, checked before running it
+_BENEFIT_INDICATOR_WORDS = ('having', 'young', 'significantly', 'towards')
+# Words that put an unsplit line in the benefit column
+_BENEFIT_WORDS = ('community', 'benefit', 'impact', 'improve', 'regeneration')
+_BENEFIT_PREFIX_RE = re.compile(r'^The\s+community\s+will\s+benefit\s+(by\s+)?', re.IGNORECASE)
+
+
 def _parse_interleaved_columns(text: str, full_text: str = None) -> list:
     """
     Parse OCR text where two table columns are interleaved line-by-line.
@@ -1873,39 +2878,14 @@ def _parse_interleaved_columns(text: str, full_text: str = None) -> list:
     # Use full_text for extracting additional fields if available, otherwise use text
     extraction_text = full_text if full_text else text
 
-    # Look for table start - after column headers
-    table_start_patterns = [
-        r'\(The\s+community\s+will\s+benefit\s+by[^)]*\)',
-        r'is\s+being\s+set\s+up\s+to\s+do\s*\)',
-    ]
-
     start_pos = 0
-    for pattern in table_start_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+    for table_start_re in _INTERLEAVED_START_RES:
+        match = table_start_re.search(text)
         if match:
             start_pos = max(start_pos, match.end())
 
-    # Look for table end - these patterns indicate end of table content
-    # Be more aggressive about detecting post-table content
-    end_patterns = [
-        r'(?:Our\s+)?company\s+differs\s+from\s+a?\s*general',  # "Our company differs..." or "company differs..."
-        r'differs\s+from\s+a\s+general\s+commercial',
-        r'If\s+the\s+company\s+makes\s+any\s+surplus',
-        r'company\s+makes\s+any\s+surplus',
-        r'its\s+primary\s+aim\s+is\s+to',  # Common start of "differs" explanation
-        r'Section\s*C',
-        r'SIGNATORIES',
-        r'\(Please\s+continue\s+on',
-    ]
-
-    table_text = text[start_pos:]
-    end_pos = len(table_text)
-    for pattern in end_patterns:
-        match = re.search(pattern, table_text, re.IGNORECASE)
-        if match:
-            end_pos = min(end_pos, match.start())
-
-    table_text = table_text[:end_pos]
+    match = _INTERLEAVED_END_RE.search(text, start_pos)
+    table_text = text[start_pos:match.start() if match else len(text)]
 
     # Extract "company differs" and "surplus" sections from full text
     company_differs = _extract_company_differs(extraction_text)
@@ -1943,12 +2923,11 @@ def _parse_interleaved_columns(text: str, full_text: str = None) -> list:
                 right_column.append('|'.join(parts[1:]).strip())
                 continue
 
+        # The split patterns only run on lines holding their literals
+        lowered = _lower_for_match(line)
+
         # Check for "The community will benefit" in the middle of line
-        benefit_match = re.search(
-            r'^(.+?)\s+(The\s+community\s+will\s+benefit.*)$',
-            line,
-            re.IGNORECASE
-        )
+        benefit_match = 'community' in lowered and _BENEFIT_IN_LINE_RE.search(line)
         if benefit_match:
             left_part = benefit_match.group(1).strip()
             right_part = benefit_match.group(2).strip()
@@ -1959,11 +2938,8 @@ def _parse_interleaved_columns(text: str, full_text: str = None) -> list:
             continue
 
         # Check for other benefit indicators
-        benefit_mid_match = re.search(
-            r'^(.{20,}?)\s+(having\s+access|young\s+people\s+will|significantly|towards\s+the)',
-            line,
-            re.IGNORECASE
-        )
+        benefit_mid_match = (any(word in lowered for word in _BENEFIT_INDICATOR_WORDS)
+                             and _BENEFIT_INDICATOR_IN_LINE_RE.search(line))
         if benefit_mid_match:
             left_part = benefit_mid_match.group(1).strip()
             right_part = line[benefit_mid_match.start(2):].strip()
@@ -1974,7 +2950,7 @@ def _parse_interleaved_columns(text: str, full_text: str = None) -> list:
         # Can't determine column - try heuristics based on content
         # Activity text often describes what the company does
         # Benefit text often describes community impact
-        if re.search(r'(community|benefit|impact|improve|regeneration)', line, re.IGNORECASE):
+        if any(word in lowered for word in _BENEFIT_WORDS):
             right_column.append(line)
         else:
             left_column.append(line)
@@ -1988,12 +2964,7 @@ def _parse_interleaved_columns(text: str, full_text: str = None) -> list:
     benefit_text = _clean_benefit_text(benefit_text)
 
     # Remove redundant "The community will benefit by" prefixes from benefit
-    benefit_text = re.sub(
-        r'^The\s+community\s+will\s+benefit\s+(by\s+)?',
-        '',
-        benefit_text,
-        flags=re.IGNORECASE
-    ).strip()
+    benefit_text = _BENEFIT_PREFIX_RE.sub('', benefit_text).strip()
 
     if activity_text or benefit_text or company_differs or surplus_use:
         activities.append({
@@ -2008,6 +2979,86 @@ def _parse_interleaved_columns(text: str, full_text: str = None) -> list:
     return activities
 
 
+# Patterns to find the END of the boilerplate instruction (beneficiaries follow after)
+# The boilerplate instruction ends with phrases like "...below" or "...below ]"
+# The actual beneficiary content starts AFTER this
+_BENEFICIARIES_START_RES = tuple(re.compile(p, re.IGNORECASE) for p in [
+    # Modern form: "...which it is intended that the company will benefit below"
+    r"which\s+i[tf]\s+[i1]s\s+intended\s+that\s+the\s+company\s+will\s+benefit\s+below\s*\]?\s*",
+    r"the\s+company\s+will\s+benefit\s+below\s*\]?\s*",
+    r"will\s+benefit\s+below\s*\]?\s*[E\s]*",  # OCR may add stray 'E'
+    # Legacy form variations
+    r"benefit\s+below\s*\]?\s*",
+    # Alternate form: declaration ending with "...or a section of the community" (doc 14891915)
+    # Must have the declaration prefix to avoid matching mid-text
+    r"declare\s+that\s+the\s+company\s+will\s+carry\s+on\s+its\s+activities\s+for\s+the\s+benefit\s+of\s+the\s+community,?\s+or\s+a\s+section\s+of\s+the\s+community\s*[.,\d]*\s*",
+    r"activities\s+for\s+the\s+benefit\s+of\s+the\s+community,?\s+or\s+a\s+section\s+of\s+the\s+community\s*[.,\d]*\s*",
+    # Shorter form: "...activities for the benefit of the community." (doc 13034936)
+    r"declare\s+that\s+the\s+company\s+will\s+carry\s+on\s+its\s+activities\s+for\s+the\s+benefit\s+of\s+the\s+community\s*\.\s*",
+    r"activities\s+for\s+the\s+benefit\s+of\s+the\s+community\s*\.\s*",
+])
+
+# Fallback patterns - only match the boilerplate prefix WITH trailing dots
+# (meaning it's an unfilled form field, not actual content)
+_BENEFICIARIES_FALLBACK_START_RES = tuple(re.compile(p, re.IGNORECASE) for p in [
+    # Only match if there are trailing dots (unfilled field marker)
+    r"The\s+company'?s?\s+activities\s+will\s+provide\s+benefit\s+to\s*\.{3,}\s*",
+    r"activities\s+will\s+provide\s+benefit\s+to\s*\.{3,}\s*",
+])
+
+# End patterns - Section B header marks the end of Section A (at the
+# earliest match of any of them). The [I1] class also covers plain "Section B".
+_BENEFICIARIES_END_RE = re.compile(
+    r'SECT[I1]ON\s*B\b'  # With OCR error handling (I/1 confusion)
+    r'|Community\s+Interest\s+Statement\s*[-–—]?\s*Activities'
+    r'|COMPANY\s+ACTIVITIES',
+    re.IGNORECASE,
+)
+
+# A trailing company name. Tried from every word in the text, this pattern
+# backtracks to the end each time, so it only runs once the text is known
+# to end in "CIC".
+_TRAILING_CIC_NAME_RE = re.compile(r'\s*\[?[A-Z][a-z]+.*?CIC\s*$', re.IGNORECASE)
+_ENDS_WITH_CIC_RE = re.compile(r'CIC\s*$', re.IGNORECASE)
+
+# Remove any trailing form boilerplate that might have been captured
+# e.g., page numbers, form instructions, Companies House headers
+_BENEFICIARIES_TRAILING_RES = tuple(re.compile(p, re.IGNORECASE) for p in [
+    r'\s*Page\s+\d+\s*(?:of\s+\d+)?.*$',
+    r'\s*Please\s+continue\s+on\s+separate\s+sheet.*$',
+    r'\s*CIC\s*36.*$',
+    # Companies House headers/footers that OCR may pick up
+    r'\s*COMPANIES\s+HOUSE.*$',
+    r'\s*Declarations?\s+on\s+Formation\s+of\s+a.*$',
+    r'\s*Community\s+[Ii]nterest\s+Company\s*$',
+    # Form field labels that appear after beneficiaries content
+    r'\s*COMPANY\s+NAME\s+.*$',  # "COMPANY NAME [company name here]"
+    r'\s*COMPANY\s+NAME\s*$',    # Just "COMPANY NAME"
+    _TRAILING_CIC_NAME_RE.pattern,  # "[Something CIC" or "Something CIC"
+    # OCR noise patterns
+    r'\s*[A-Z]{2,}\s*\?\s*[A-Z]+\s*$',  # Random uppercase letters
+    r'\s*ct\s+Wo\s*$',  # Common OCR artifact
+    r'\s*E\s+MET\?DIGOI\s*$',  # OCR artifact
+    r'\s+[A-Z]\s*$',  # Trailing single uppercase letter
+    r'\s+[A-Z]{1,2}\s*$',  # Trailing 1-2 uppercase letters (OCR artifacts)
+])
+
+# Strip the standard prefix boilerplate (per user requirement)
+# "The company's activities will provide benefit to..." should be removed
+# Note: Handle OCR variations like fancy apostrophe and trailing "..." or ". . ."
+_BENEFICIARIES_PREFIX_RES = tuple(re.compile(p, re.IGNORECASE) for p in [
+    r"^(?:Pr\s+)?The\s+company[’']?s?\s+activities\s+will\s+provide\s+benefit\s+to\s*\.{0,5}\s*",
+    r"^activities\s+will\s+provide\s+benefit\s+to\s*\.{0,5}\s*",
+    r"^provide\s+benefit\s+to\s*\.{0,5}\s*",
+])
+
+
+# Leading OCR artifacts: a stray letter before "The company" (common: r, E,
+# etc.), then any non-letter characters
+_LEADING_LETTER_ARTIFACT_RE = re.compile(r'^[A-Za-z]\s+(?=The\s+company)')
+_LEADING_NON_LETTERS_RE = re.compile(r'^[^a-zA-Z]+')
+
+
 def _extract_beneficiaries(text: str) -> str:
     """
     Extract beneficiaries statement from Section A of CIC 36 form.
@@ -2024,176 +3075,195 @@ def _extract_beneficiaries(text: str) -> str:
     if not text:
         return ""
 
-    # Patterns to find the END of the boilerplate instruction (beneficiaries follow after)
-    # The boilerplate instruction ends with phrases like "...below" or "...below ]"
-    # The actual beneficiary content starts AFTER this
-    boilerplate_end_patterns = [
-        # Modern form: "...which it is intended that the company will benefit below"
-        r"which\s+i[tf]\s+[i1]s\s+intended\s+that\s+the\s+company\s+will\s+benefit\s+below\s*\]?\s*",
-        r"the\s+company\s+will\s+benefit\s+below\s*\]?\s*",
-        r"will\s+benefit\s+below\s*\]?\s*[E\s]*",  # OCR may add stray 'E'
-        # Legacy form variations
-        r"benefit\s+below\s*\]?\s*",
-        # Alternate form: declaration ending with "...or a section of the community" (doc 14891915)
-        # Must have the declaration prefix to avoid matching mid-text
-        r"declare\s+that\s+the\s+company\s+will\s+carry\s+on\s+its\s+activities\s+for\s+the\s+benefit\s+of\s+the\s+community,?\s+or\s+a\s+section\s+of\s+the\s+community\s*[.,\d]*\s*",
-        r"activities\s+for\s+the\s+benefit\s+of\s+the\s+community,?\s+or\s+a\s+section\s+of\s+the\s+community\s*[.,\d]*\s*",
-        # Shorter form: "...activities for the benefit of the community." (doc 13034936)
-        r"declare\s+that\s+the\s+company\s+will\s+carry\s+on\s+its\s+activities\s+for\s+the\s+benefit\s+of\s+the\s+community\s*\.\s*",
-        r"activities\s+for\s+the\s+benefit\s+of\s+the\s+community\s*\.\s*",
-    ]
-
-    # Fallback patterns - only match the boilerplate prefix WITH trailing dots
-    # (meaning it's an unfilled form field, not actual content)
-    fallback_start_patterns = [
-        # Only match if there are trailing dots (unfilled field marker)
-        r"The\s+company'?s?\s+activities\s+will\s+provide\s+benefit\s+to\s*\.{3,}\s*",
-        r"activities\s+will\s+provide\s+benefit\s+to\s*\.{3,}\s*",
-    ]
-
-    # End patterns - Section B header marks the end of Section A
-    end_patterns = [
-        r'SECT[I1]ON\s*B\b',  # With OCR error handling (I/1 confusion)
-        r'Section\s*B\b',
-        r'Community\s+Interest\s+Statement\s*[-–—]?\s*Activities',
-        r'COMPANY\s+ACTIVITIES',
-    ]
-
     content = ""
 
     # First, try to find the end of the boilerplate instruction
     # The actual beneficiary content starts AFTER this
-    for end_pattern in boilerplate_end_patterns:
-        match = re.search(end_pattern, text, re.IGNORECASE)
+    for start_re in _BENEFICIARIES_START_RES:
+        match = start_re.search(text)
         if match:
-            remaining = text[match.end():]
-
             # Find end - look for Section B header
-            end_pos = len(remaining)
-            for section_end_pattern in end_patterns:
-                end_match = re.search(section_end_pattern, remaining, re.IGNORECASE)
-                if end_match:
-                    end_pos = min(end_pos, end_match.start())
+            end_match = _BENEFICIARIES_END_RE.search(text, match.end())
+            end_pos = end_match.start() if end_match else len(text)
 
-            content = remaining[:end_pos].strip()
+            content = text[match.end():end_pos].strip()
             break
 
     # If no boilerplate end found, try fallback patterns (only match unfilled form fields)
     if not content:
-        for fallback_pattern in fallback_start_patterns:
-            match = re.search(fallback_pattern, text, re.IGNORECASE)
+        for fallback_start_re in _BENEFICIARIES_FALLBACK_START_RES:
+            match = fallback_start_re.search(text)
             if match:
-                remaining = text[match.end():]
-
                 # Find end - look for Section B header
-                end_pos = len(remaining)
-                for section_end_pattern in end_patterns:
-                    end_match = re.search(section_end_pattern, remaining, re.IGNORECASE)
-                    if end_match:
-                        end_pos = min(end_pos, end_match.start())
+                end_match = _BENEFICIARIES_END_RE.search(text, match.end())
+                end_pos = end_match.start() if end_match else len(text)
 
-                content = remaining[:end_pos].strip()
+                content = text[match.end():end_pos].strip()
                 break
 
     # Clean up the content
-    content = re.sub(r'\s+', ' ', content)
-    content = re.sub(r'^\s*\.{1,3}\s*', '', content)  # Remove leading dots
+    content = _WHITESPACE_RUN_RE.sub(' ', content)
+    content = _LEADING_DOTS_RE.sub('', content)  # Remove leading dots
     # Remove leading single-letter OCR artifacts (common: r, E, etc.) before "The company"
-    content = re.sub(r'^[A-Za-z]\s+(?=The\s+company)', '', content)
-    content = re.sub(r'^[^a-zA-Z]+', '', content)  # Remove any leading non-letter characters
+    content = _LEADING_LETTER_ARTIFACT_RE.sub('', content)
+    content = _LEADING_NON_LETTERS_RE.sub('', content)  # Remove any leading non-letter characters
     content = content.strip()
 
-    # Remove any trailing form boilerplate that might have been captured
-    # e.g., page numbers, form instructions, Companies House headers
-    boilerplate_end_patterns = [
-        r'\s*Page\s+\d+\s*(?:of\s+\d+)?.*$',
-        r'\s*Please\s+continue\s+on\s+separate\s+sheet.*$',
-        r'\s*CIC\s*36.*$',
-        # Companies House headers/footers that OCR may pick up
-        r'\s*COMPANIES\s+HOUSE.*$',
-        r'\s*Declarations?\s+on\s+Formation\s+of\s+a.*$',
-        r'\s*Community\s+[Ii]nterest\s+Company\s*$',
-        # Form field labels that appear after beneficiaries content
-        r'\s*COMPANY\s+NAME\s+.*$',  # "COMPANY NAME [company name here]"
-        r'\s*COMPANY\s+NAME\s*$',    # Just "COMPANY NAME"
-        r'\s*\[?[A-Z][a-z]+.*?CIC\s*$',  # "[Something CIC" or "Something CIC"
-        # OCR noise patterns
-        r'\s*[A-Z]{2,}\s*\?\s*[A-Z]+\s*$',  # Random uppercase letters
-        r'\s*ct\s+Wo\s*$',  # Common OCR artifact
-        r'\s*E\s+MET\?DIGOI\s*$',  # OCR artifact
-        r'\s+[A-Z]\s*$',  # Trailing single uppercase letter
-        r'\s+[A-Z]{1,2}\s*$',  # Trailing 1-2 uppercase letters (OCR artifacts)
-    ]
-    for pattern in boilerplate_end_patterns:
-        content = re.sub(pattern, '', content, flags=re.IGNORECASE)
+    for trailing_re in _BENEFICIARIES_TRAILING_RES:
+        if trailing_re.pattern == _TRAILING_CIC_NAME_RE.pattern and not _ENDS_WITH_CIC_RE.search(content):
+            continue
+        content = trailing_re.sub('', content)
 
     # Final cleanup - remove any trailing punctuation or whitespace
-    content = re.sub(r'[\s.,:;]+$', '', content)
-
-    # Strip the standard prefix boilerplate (per user requirement)
-    # "The company's activities will provide benefit to..." should be removed
-    # Note: Handle OCR variations like fancy apostrophe and trailing "..." or ". . ."
-    prefix_patterns = [
-        r"^(?:Pr\s+)?The\s+company[’']?s?\s+activities\s+will\s+provide\s+benefit\s+to\s*\.{0,5}\s*",
-        r"^activities\s+will\s+provide\s+benefit\s+to\s*\.{0,5}\s*",
-        r"^provide\s+benefit\s+to\s*\.{0,5}\s*",
-    ]
-    for pattern in prefix_patterns:
-        content = re.sub(pattern, '', content, flags=re.IGNORECASE)
+    content = _TRAILING_PUNCT_RE.sub('', content)
+
+    for prefix_re in _BENEFICIARIES_PREFIX_RES:
+        content = prefix_re.sub('', content)
     content = content.strip()
 
     return content.strip()
 
 
+# Start of the "company differs" section (lowercase, matched against
+# _lower_for_match(text))
+_COMPANY_DIFFERS_START_RES = tuple(re.compile(p) for p in [
+    r'(?:our\s+)?company\s+differs\s+from\s+a\s+general\s+commercial\s+company\s+because\s*\.{0,3}\s*',
+    r'differs\s+from\s+a\s+general\s+commercial\s+company\s+because\s*\.{0,3}\s*',
+])
+
+# End of the "company differs" section: it ends at the surplus statement or
+# Section C, whichever comes first
+_COMPANY_DIFFERS_END_RE = re.compile('|'.join(f'(?:{p})' for p in [
+    r'if\s+the\s+company\s+makes\s+any\s+surplus',
+    r'company\s+makes\s+any\s+surplus',
+    r'sect[i1]on\s*c\b',  # With OCR error handling
+    r'signatories',
+]))
+
+
+@lru_cache(maxsize=64)
 def _extract_company_differs(text: str) -> str:
     """
     Extract the "Our company differs from a general commercial company because..."
     section from the OCR text.
+
+    Cached: the activity parsers pass the same text here more than once.
     """
+    # Every start pattern needs "differs" - most pages don't have it
     if not text:
         return ""
-
-    # Pattern to find the start of this section
-    start_patterns = [
-        r'(?:Our\s+)?company\s+differs\s+from\s+a\s+general\s+commercial\s+company\s+because\s*\.{0,3}\s*',
-        r'differs\s+from\s+a\s+general\s+commercial\s+company\s+because\s*\.{0,3}\s*',
-    ]
-
-    # Pattern to find the end of this section
-    # The "company differs" section ends at the surplus statement or Section C
-    end_patterns = [
-        r'If\s+the\s+company\s+makes\s+any\s+surplus',
-        r'company\s+makes\s+any\s+surplus',
-        r'SECT[I1]ON\s*C\b',  # With OCR error handling
-        r'Section\s*C\b',
-        r'SIGNATORIES',
-    ]
+    lowered = _lower_for_match(text)
+    if 'differs' not in lowered:
+        return ""
 
     content = ""
-    for start_pattern in start_patterns:
-        match = re.search(start_pattern, text, re.IGNORECASE)
+    for start_re in _COMPANY_DIFFERS_START_RES:
+        match = start_re.search(lowered)
         if match:
-            remaining = text[match.end():]
-
             # Find end
-            end_pos = len(remaining)
-            for end_pattern in end_patterns:
-                end_match = re.search(end_pattern, remaining, re.IGNORECASE)
-                if end_match:
-                    end_pos = min(end_pos, end_match.start())
-                    break  # Stop at first match
-
-            content = remaining[:end_pos].strip()
+            end_match = _COMPANY_DIFFERS_END_RE.search(lowered, match.end())
+            end_pos = end_match.start() if end_match else len(text)
+
+            content = text[match.end():end_pos].strip()
             break
 
     # Clean up the content
-    content = re.sub(r'\s+', ' ', content)
-    content = re.sub(r'^\s*\.{1,3}\s*', '', content)  # Remove leading dots
+    content = _WHITESPACE_RUN_RE.sub(' ', content)
+    content = _LEADING_DOTS_RE.sub('', content)  # Remove leading dots
     content = content.strip()
 
     return content
 
 
+# Start of the "surplus use" section (lowercase, matched against
+# _lower_for_match(text))
+# Note: OCR sometimes reads "it" as "if", so allow both
+# Extended patterns based on manual evaluation feedback
+_SURPLUS_USE_START_RES = tuple(re.compile(p) for p in [
+    # Standard boilerplate patterns
+    r'if\s+the\s+company\s+makes\s+any\s+surplus\s+i[tf]\s+will\s+be\s+used\s+for\s*\.{0,3}\s*',
+    r'company\s+makes\s+any\s+surplus\s+i[tf]\s+will\s+be\s+used\s+for\s*\.{0,3}\s*',
+    r'surplus\s+i[tf]\s+will\s+be\s+used\s+for\s*\.{0,3}\s*',
+    r'any\s+surplus\s+(?:it\s+)?will\s+be\s+used\s+for\s*\.{0,3}\s*',
+    # "reinvested" variations (common in manual evaluation failures)
+    r'if\s+the\s+company\s+makes\s+any\s+surplus\s+i[tf]\s+will\s+be\s+reinvested\s*\.{0,3}\s*',
+    r'any\s+surplus\s+(?:it\s+)?will\s+be\s+reinvested\s*\.{0,3}\s*',
+    r'surplus\s+(?:it\s+)?will\s+be\s+reinvested\s*\.{0,3}\s*',
+    r'any\s+surplus\s+(?:gained|from\s+trading)\s+will\s+be\s+reinvested\s*\.{0,3}\s*',
+    r'surplus\s+(?:gained|from\s+trading)\s+will\s+be\s*\.{0,3}\s*',
+    # "invest in" variations
+    r'any\s+surplus\s+(?:it\s+)?will\s+be\s+used\s+to\s+invest\s*\.{0,3}\s*',
+    r'surplus\s+will\s+be\s+used\s+to\s+invest\s*\.{0,3}\s*',
+    # More flexible patterns to catch edge cases
+    # Match just the header text, content follows
+    r'if\s+the\s+company\s+makes\s+any\s+surplus[,:]?\s*',
+    r'surplus\s+(?:income|profits?)\s+will\s+be\s*\.{0,3}\s*',
+    # Catch "Any surplus" at start of sentence
+    r'any\s+surplus\s+(?:will\s+be|is)\s+(?:used|reinvested|invested)\s*',
+])
+
+# End of the "surplus use" section, at the earliest of these boundaries.
+# Section C is the definitive boundary; the activity indicators stop content
+# that bled in before it
+_SURPLUS_USE_END_RE = re.compile('|'.join(f'(?:{p})' for p in [
+    r'sect[i1]on\s*c\b',  # With OCR error handling
+    r'signatories',
+    r'checklist',
+    r'\(please\s+continue\s+on',
+    # Activity content indicators - surplus shouldn't contain these
+    r'\s+gives\s+(?:schools|communities|people)\s+',
+    r'\s+(?:schools|communities)\s+(?:and|or)\s+(?:other|community)\s+',
+    r'the\s+internet\s+tells\s+',
+    r'young\s+people\s+(?:around|with)\s+the\s+',
+    r'training\s+establishments\s+',
+]))
+
+
+# Remove form boilerplate that may have leaked through
+_SURPLUS_BOILERPLATE_RES = tuple(re.compile(p, re.IGNORECASE) for p in [
+    r"\(if donating or fundraising[^)]*\)",  # Charity donation instruction
+    r"\(Please continue on separate[^)]*\)",  # Continuation instruction
+    r"COMPANY NAME\s*$",  # Form field label at end
+    r"^\s*Il\.{0,3}\s*",  # OCR artifact "Il..."
+    r"with the consent of the CIC Regulator['\"]?\)?",  # Partial boilerplate
+    # Asset Locked Body form boilerplate (doc 16727702)
+    r"\(?[Ii]f\s+donating\s+to\s+a\s+non[^}]*\}?",
+    r"Asset\s+Locked\s+Body[^.]*(?:rejected|wording)[^.]*\.?",
+    r"otherwise\s+your\s+application\s+will\s+be\s+rejected[^.]*",
+    r"you\s+will\s+need\s+to\s+include\s+the\s+wording[^.]*",
+    # Footer text patterns (doc 16727702, 13034936, 12716495)
+    r"\(Please\s+continue\s+(?:on\s+)?separate\s+sheet[^)]*\)\.?",
+    r"Version\s+\d+[^.]*(?:Last\s+Updated[^.]*)?",
+    r"Last\s+Updated\s+(?:on\s+)?\d{2}/\d{2}/\d{4}",
+    # Activity content that leaked into surplus (doc 11701303)
+    r"Peer\s+supporters?\s+will\s+support[^.]*",
+    r"support\s+will\s+be\s+both\s+practical\s+and\s+emotional[^.]*",
+    r"will\s+benefit\s+the\s+community\s+by\s+promoting[^.]*",
+])
+
+# Remove trailing artifacts like "(.", "()", "(.)", etc.
+_SURPLUS_TRAILING_RES = tuple(re.compile(p, re.IGNORECASE) for p in [
+    r'\s*\(\s*\.\s*\)\s*$',  # "(.) " at end
+    r'\s*\(\s*\)\s*$',       # "( )" at end
+    r'\s*\.\s*\(\s*\.\s*\)\s*$',  # ". (.)" at end
+    r'\s*\(\s*\.\s*$',       # "(." at end
+    r'\s*[(\[\])\s]+$',      # Orphaned brackets at end
+    # OCR artifacts from page decorations/footers (doc 14891915, 12716495)
+    r'\s*[—_\-]{3,}[\s\w]*$',  # "———_—_— ee" type artifacts
+    r'\s*[-—_]{2,}\s*[a-z]{1,3}\s*$',  # "—— ee" or "——— nn"
+    r'\s*[nNeE]{2,}\s*$',  # "nn", "ee" artifacts
+    r'\s*_\s*[a-z]\s*\|?\s*$',  # "_ a |" type artifacts
+    # Random OCR garbage at end (doc 11701303) - specific patterns only
+    r'\s*Vseewtan.*$',  # Specific OCR artifact
+    r'\s*Nfeeete\s+ee.*$',  # Specific OCR artifact
+])
+
+# Uppercase-only garbage: multiple uppercase-only words at end. Intentionally
+# case-SENSITIVE (no IGNORECASE) to only match actual uppercase
+_SURPLUS_UPPERCASE_GARBAGE_RE = re.compile(r'\s*[A-Z]{3,}\s+[A-Z]{3,}\s*$')
+
+
+@lru_cache(maxsize=64)
 def _extract_surplus_use(text: str) -> str:
     """
     Extract the "If the company makes any surplus it will be used for..."
@@ -2205,123 +3275,42 @@ def _extract_surplus_use(text: str) -> str:
     - "Any surplus from trading will be reinvested..."
     - "If the company makes any surplus it will be reinvested..."
     - Bullet point lists following the surplus header
+
+    Cached like _extract_company_differs.
     """
+    # Every start pattern needs "surplus" - most pages don't have it
     if not text:
         return ""
-
-    # Pattern to find the start of this section
-    # Note: OCR sometimes reads "it" as "if", so allow both
-    # Extended patterns based on manual evaluation feedback
-    start_patterns = [
-        # Standard boilerplate patterns
-        r'If\s+the\s+company\s+makes\s+any\s+surplus\s+i[tf]\s+will\s+be\s+used\s+for\s*\.{0,3}\s*',
-        r'company\s+makes\s+any\s+surplus\s+i[tf]\s+will\s+be\s+used\s+for\s*\.{0,3}\s*',
-        r'surplus\s+i[tf]\s+will\s+be\s+used\s+for\s*\.{0,3}\s*',
-        r'any\s+surplus\s+(?:it\s+)?will\s+be\s+used\s+for\s*\.{0,3}\s*',
-        # "reinvested" variations (common in manual evaluation failures)
-        r'If\s+the\s+company\s+makes\s+any\s+surplus\s+i[tf]\s+will\s+be\s+reinvested\s*\.{0,3}\s*',
-        r'any\s+surplus\s+(?:it\s+)?will\s+be\s+reinvested\s*\.{0,3}\s*',
-        r'surplus\s+(?:it\s+)?will\s+be\s+reinvested\s*\.{0,3}\s*',
-        r'Any\s+surplus\s+(?:gained|from\s+trading)\s+will\s+be\s+reinvested\s*\.{0,3}\s*',
-        r'surplus\s+(?:gained|from\s+trading)\s+will\s+be\s*\.{0,3}\s*',
-        # "invest in" variations
-        r'any\s+surplus\s+(?:it\s+)?will\s+be\s+used\s+to\s+invest\s*\.{0,3}\s*',
-        r'surplus\s+will\s+be\s+used\s+to\s+invest\s*\.{0,3}\s*',
-        # More flexible patterns to catch edge cases
-        # Match just the header text, content follows
-        r'If\s+the\s+company\s+makes\s+any\s+surplus[,:]?\s*',
-        r'surplus\s+(?:income|profits?)\s+will\s+be\s*\.{0,3}\s*',
-        # Catch "Any surplus" at start of sentence
-        r'Any\s+surplus\s+(?:will\s+be|is)\s+(?:used|reinvested|invested)\s*',
-    ]
-
-    # Pattern to find the end of this section
-    # PRIMARY RULE: Section C is the definitive boundary
-    end_patterns = [
-        r'SECT[I1]ON\s*C\b',  # With OCR error handling
-        r'Section\s*C\b',
-        r'SIGNATORIES',
-        r'CHECKLIST',
-        r'\(Please\s+continue\s+on',
-        # Activity content indicators - surplus shouldn't contain these
-        r'\s+gives\s+(?:schools|communities|people)\s+',
-        r'\s+(?:schools|communities)\s+(?:and|or)\s+(?:other|community)\s+',
-        r'The\s+internet\s+tells\s+',
-        r'young\s+people\s+(?:around|with)\s+the\s+',
-        r'training\s+establishments\s+',
-    ]
+    lowered = _lower_for_match(text)
+    if 'surplus' not in lowered:
+        return ""
 
     content = ""
-    for start_pattern in start_patterns:
-        match = re.search(start_pattern, text, re.IGNORECASE)
+    for start_re in _SURPLUS_USE_START_RES:
+        match = start_re.search(lowered)
         if match:
-            remaining = text[match.end():]
-
-            # Find end - Section C is the definitive boundary
-            end_pos = len(remaining)
-            for end_pattern in end_patterns:
-                end_match = re.search(end_pattern, remaining, re.IGNORECASE)
-                if end_match:
-                    end_pos = min(end_pos, end_match.start())
-                    break  # Stop at first match
+            # Find end - the first boundary after the start
+            end_match = _SURPLUS_USE_END_RE.search(lowered, match.end())
+            end_pos = end_match.start() if end_match else len(text)
 
-            content = remaining[:end_pos].strip()
+            content = text[match.end():end_pos].strip()
             break
 
     # Clean up the content
-    content = re.sub(r'\s+', ' ', content)
-    content = re.sub(r'^\s*\.{1,3}\s*', '', content)  # Remove leading dots
+    content = _WHITESPACE_RUN_RE.sub(' ', content)
+    content = _LEADING_DOTS_RE.sub('', content)  # Remove leading dots
 
     # Remove form boilerplate that may have leaked through
-    boilerplate_patterns = [
-        r"\(if donating or fundraising[^)]*\)",  # Charity donation instruction
-        r"\(Please continue on separate[^)]*\)",  # Continuation instruction
-        r"COMPANY NAME\s*$",  # Form field label at end
-        r"^\s*Il\.{0,3}\s*",  # OCR artifact "Il..."
-        r"with the consent of the CIC Regulator['\"]?\)?",  # Partial boilerplate
-        # Asset Locked Body form boilerplate (doc 16727702)
-        r"\(?[Ii]f\s+donating\s+to\s+a\s+non[^}]*\}?",
-        r"Asset\s+Locked\s+Body[^.]*(?:rejected|wording)[^.]*\.?",
-        r"otherwise\s+your\s+application\s+will\s+be\s+rejected[^.]*",
-        r"you\s+will\s+need\s+to\s+include\s+the\s+wording[^.]*",
-        # Footer text patterns (doc 16727702, 13034936, 12716495)
-        r"\(Please\s+continue\s+(?:on\s+)?separate\s+sheet[^)]*\)\.?",
-        r"Version\s+\d+[^.]*(?:Last\s+Updated[^.]*)?",
-        r"Last\s+Updated\s+(?:on\s+)?\d{2}/\d{2}/\d{4}",
-        # Activity content that leaked into surplus (doc 11701303)
-        r"Peer\s+supporters?\s+will\s+support[^.]*",
-        r"support\s+will\s+be\s+both\s+practical\s+and\s+emotional[^.]*",
-        r"will\s+benefit\s+the\s+community\s+by\s+promoting[^.]*",
-    ]
-    for pattern in boilerplate_patterns:
-        content = re.sub(pattern, '', content, flags=re.IGNORECASE)
+    for boilerplate_re in _SURPLUS_BOILERPLATE_RES:
+        content = boilerplate_re.sub('', content)
 
     # Remove trailing artifacts like "(.", "()", "(.)", etc.
-    trailing_cleanup = [
-        r'\s*\(\s*\.\s*\)\s*$',  # "(.) " at end
-        r'\s*\(\s*\)\s*$',       # "( )" at end
-        r'\s*\.\s*\(\s*\.\s*\)\s*$',  # ". (.)" at end
-        r'\s*\(\s*\.\s*$',       # "(." at end
-        r'\s*[(\[\])\s]+$',      # Orphaned brackets at end
-        # OCR artifacts from page decorations/footers (doc 14891915, 12716495)
-        r'\s*[—_\-]{3,}[\s\w]*$',  # "———_—_— ee" type artifacts
-        r'\s*[-—_]{2,}\s*[a-z]{1,3}\s*$',  # "—— ee" or "——— nn"
-        r'\s*[nNeE]{2,}\s*$',  # "nn", "ee" artifacts
-        r'\s*_\s*[a-z]\s*\|?\s*$',  # "_ a |" type artifacts
-        # Random OCR garbage at end (doc 11701303) - specific patterns only
-        r'\s*Vseewtan.*$',  # Specific OCR artifact
-        r'\s*Nfeeete\s+ee.*$',  # Specific OCR artifact
-    ]
-    for pattern in trailing_cleanup:
-        content = re.sub(pattern, '', content, flags=re.IGNORECASE)
+    for trailing_re in _SURPLUS_TRAILING_RES:
+        content = trailing_re.sub('', content)
 
     # Additional cleanup for uppercase-only garbage (case-SENSITIVE)
     # These patterns intentionally don't use IGNORECASE to only match actual uppercase
-    uppercase_garbage_patterns = [
-        r'\s*[A-Z]{3,}\s+[A-Z]{3,}\s*$',  # Multiple uppercase-only words at end
-    ]
-    for pattern in uppercase_garbage_patterns:
-        content = re.sub(pattern, '', content)  # Note: no IGNORECASE flag
+    content = _SURPLUS_UPPERCASE_GARBAGE_RE.sub('', content)  # Note: no IGNORECASE flag
 
     content = content.strip()
 
@@ -2340,53 +3329,81 @@ def _extract_surplus_use(text: str) -> str:
     return content
 
 
+# OCR artifacts shared by the activity, benefit and extracted-text cleaners.
+# Table cell separators are single characters, so str.translate replaces
+# (or drops) them without the regex engine.
+_CELL_SEPARATOR_TO_SPACE = str.maketrans('|¦', '  ')
+_CELL_SEPARATOR_DELETE = str.maketrans('', '', '|¦')
+_LEADING_DASH_RE = re.compile(r'^\s*[-–—]\s*')
+_TRAILING_DASH_RE = re.compile(r'\s*[-–—]\s*$')
+
+# Form instructions that may leak into activity text
+_TELL_US_HERE_RE = re.compile(r'\(Tell\s+us\s+here[^)]*\)', re.IGNORECASE)
+_BENEFIT_PARENTHETICAL_RE = re.compile(r'\(The\s+community\s+will\s+benefit[^)]*\)', re.IGNORECASE)
+_ACTIVITY_COLUMN_HEADER_RE = re.compile(r'Activities?\s+How\s+will.*?community\s*\?', re.IGNORECASE | re.DOTALL)
+# Benefit-column text that leaks onto the end of an activity
+_BENEFIT_COLUMN_TAIL_RE = re.compile(r'having\s+access\s+to\s+flexible.*$', re.IGNORECASE)
+# Very short trailing fragments (often OCR errors)
+_SHORT_TRAILING_FRAGMENT_RE = re.compile(r'\s+\w{1,3}\s*$')
+_PLEASE_CONTINUE_RE = re.compile(r'\(Please\s+continue[^)]*\)', re.IGNORECASE)
+
+
+@lru_cache(maxsize=1024)
 def _clean_activity_text(text: str) -> str:
-    """Clean up extracted activity text."""
+    """
+    Clean up extracted activity text.
+
+    This and the other short-text cleaners below are cached: the row,
+    paragraph and fallback parsers clean the same fragments repeatedly.
+    """
     if not text:
         return ""
 
     # Remove common OCR artifacts
-    text = re.sub(r'[|¦]', ' ', text)  # Table cell separators
-    text = re.sub(r'\s+', ' ', text)  # Normalize whitespace
-    text = re.sub(r'^\s*[-–—]\s*', '', text)  # Leading dashes
-    text = re.sub(r'\s*[-–—]\s*$', '', text)  # Trailing dashes
-
-    # Remove form instructions that may have leaked through
-    text = re.sub(r'\(Tell\s+us\s+here[^)]*\)', '', text, flags=re.IGNORECASE)
-    text = re.sub(r'\(The\s+community\s+will\s+benefit[^)]*\)', '', text, flags=re.IGNORECASE)
-    text = re.sub(r'Activities?\s+How\s+will.*?community\s*\?', '', text, flags=re.IGNORECASE | re.DOTALL)
+    text = text.translate(_CELL_SEPARATOR_TO_SPACE)  # Table cell separators
+    text = _WHITESPACE_RUN_RE.sub(' ', text)  # Normalize whitespace
+    text = _LEADING_DASH_RE.sub('', text)  # Leading dashes
+    text = _TRAILING_DASH_RE.sub('', text)  # Trailing dashes
+
+    # Remove form instructions that may have leaked through. The
+    # parenthetical ones need a "(" and the column header ends in "?", so
+    # skip the searches on text without them
+    if '(' in text:
+        text = _TELL_US_HERE_RE.sub('', text)
+        text = _BENEFIT_PARENTHETICAL_RE.sub('', text)
+    if '?' in text:
+        text = _ACTIVITY_COLUMN_HEADER_RE.sub('', text)
 
     # Remove fragments that are clearly from the benefit column
-    text = re.sub(r'having\s+access\s+to\s+flexible.*$', '', text, flags=re.IGNORECASE)
+    text = _BENEFIT_COLUMN_TAIL_RE.sub('', text)
 
     # Remove very short trailing fragments (often OCR errors)
-    text = re.sub(r'\s+\w{1,3}\s*$', '', text)
+    text = _SHORT_TRAILING_FRAGMENT_RE.sub('', text)
 
     return text.strip()
 
 
+@lru_cache(maxsize=1024)
 def _clean_benefit_text(text: str) -> str:
     """Clean up extracted benefit text."""
     if not text:
         return ""
 
     # Remove common OCR artifacts
-    text = re.sub(r'[|¦]', ' ', text)  # Table cell separators
-    text = re.sub(r'\s+', ' ', text)  # Normalize whitespace
-
-    # Remove trailing activity text that leaked in
-    # Look for patterns that indicate start of next activity
-    next_activity_patterns = [
-        r'(?:By\s+improving|work\s+closely|will\s+also|will\s+benefit)',
-        r'\.\s*[A-Z][a-z]+\s+(?:to|for|the)\s+',
-    ]
+    text = text.translate(_CELL_SEPARATOR_TO_SPACE)  # Table cell separators
+    text = _WHITESPACE_RUN_RE.sub(' ', text)  # Normalize whitespace
 
     # Remove form instructions
-    text = re.sub(r'\(Please\s+continue[^)]*\)', '', text, flags=re.IGNORECASE)
+    if '(' in text:
+        text = _PLEASE_CONTINUE_RE.sub('', text)
 
     return text.strip()
 
 
+# Sentence boundary: end punctuation, then whitespace before a capital
+_SENTENCE_BREAK_RE = re.compile(r'(?<=[.!?])\s+(?=[A-Z])')
+
+
 def _try_split_single_activity(activity: dict) -> list:
     """
     Try to split a single activity entry that may contain multiple activities.
@@ -2398,7 +3415,7 @@ def _try_split_single_activity(activity: dict) -> list:
 
     # Look for sentence boundaries that might indicate multiple activities
     # e.g., "Activity 1. Activity 2."
-    sentences = re.split(r'(?<=[.!?])\s+(?=[A-Z])', act_text)
+    sentences = _SENTENCE_BREAK_RE.split(act_text)
 
     if len(sentences) <= 1:
         return []
@@ -2418,6 +3435,29 @@ def _try_split_single_activity(activity: dict) -> list:
     return activities if len(activities) > 1 else []
 
 
+# Patterns that indicate start of a new activity row
+_ROW_DELIMITER_PATTERNS = (
+    # Numbered activities: "1.", "2)", "1:"
+    r'\n\s*(\d+[\.\)\:])\s+',
+    # Lettered activities: "a.", "A)", "a:"
+    r'\n\s*([a-zA-Z][\.\)\:])\s+',
+    # Bullet points
+    r'\n\s*[•●○◦▪▸►]\s+',
+    r'\n\s*[\-\*]\s+(?=[A-Z])',
+    # Category labels like "General:", "Specific:", "Primary:"
+    r'\n\s*((?:General|Specific|Primary|Secondary|Main|Additional|Other)\s*:)',
+    # Roman numerals: "i.", "ii.", "iii."
+    r'\n\s*((?:i{1,3}|iv|vi{0,3}|ix|x)[\.\)])\s+',
+)
+# Compiled forms: any delimiter in the text, each delimiter to split on
+# (kept, in order), and any delimiter at the start of a stripped part
+_ROW_DELIMITER_RE = re.compile('|'.join(f'(?:{p})' for p in _ROW_DELIMITER_PATTERNS), re.IGNORECASE)
+_ROW_DELIMITER_SPLIT_RES = tuple(re.compile(f'({p})', re.IGNORECASE) for p in _ROW_DELIMITER_PATTERNS)
+_ROW_DELIMITER_START_PATTERNS = [p.replace(r'\n\s*', '') for p in _ROW_DELIMITER_PATTERNS]
+_ROW_DELIMITER_START_RE = re.compile(
+    '|'.join(f'(?:{p})' for p in _ROW_DELIMITER_START_PATTERNS if p), re.IGNORECASE)
+
+
 def _split_into_activity_rows(text: str) -> list:
     """
     Attempt to split OCR text into multiple activity rows.
@@ -2433,54 +3473,37 @@ def _split_into_activity_rows(text: str) -> list:
     if not text:
         return activities
 
-    # Patterns that indicate start of a new activity row
-    row_delimiter_patterns = [
-        # Numbered activities: "1.", "2)", "1:"
-        r'\n\s*(\d+[\.\)\:])\s+',
-        # Lettered activities: "a.", "A)", "a:"
-        r'\n\s*([a-zA-Z][\.\)\:])\s+',
-        # Bullet points
-        r'\n\s*[•●○◦▪▸►]\s+',
-        r'\n\s*[\-\*]\s+(?=[A-Z])',
-        # Category labels like "General:", "Specific:", "Primary:"
-        r'\n\s*((?:General|Specific|Primary|Secondary|Main|Additional|Other)\s*:)',
-        # Roman numerals: "i.", "ii.", "iii."
-        r'\n\s*((?:i{1,3}|iv|vi{0,3}|ix|x)[\.\)])\s+',
-    ]
-
     # First, check if any delimiter pattern exists
-    has_delimiters = False
-    for pattern in row_delimiter_patterns:
-        if re.search(pattern, '\n' + text, re.IGNORECASE):
-            has_delimiters = True
-            break
-
-    if not has_delimiters:
+    if not _ROW_DELIMITER_RE.search('\n' + text):
         # No clear row delimiters found - try paragraph-based splitting
         return _split_by_paragraphs(text)
 
     # Split by the detected delimiters
     segments = ['\n' + text]  # Add newline prefix for pattern matching
-    for pattern in row_delimiter_patterns:
+    for delimiter_split_re in _ROW_DELIMITER_SPLIT_RES:
         new_segments = []
         for segment in segments:
             # Split this segment and keep the delimiter with the following text
-            parts = re.split(f'({pattern})', segment, flags=re.IGNORECASE)
+            parts = delimiter_split_re.split(segment)
 
-            current = ""
-            for i, part in enumerate(parts):
+            # Accumulate the current segment as a list of parts, tracking
+            # whether any of them holds non-whitespace text
+            current_parts = []
+            has_text = False
+            for part in parts:
                 if part is None:
                     continue
                 # Check if this part matches a delimiter pattern
-                is_delimiter = any(re.match(p.replace(r'\n\s*', ''), part.strip(), re.IGNORECASE)
-                                   for p in row_delimiter_patterns if p.replace(r'\n\s*', ''))
-                if is_delimiter and current.strip():
-                    new_segments.append(current.strip())
-                    current = part
+                is_delimiter = _ROW_DELIMITER_START_RE.match(part.strip())
+                if is_delimiter and has_text:
+                    new_segments.append(''.join(current_parts).strip())
+                    current_parts = [part]
+                    has_text = not part.isspace()
                 else:
-                    current += part
-            if current.strip():
-                new_segments.append(current.strip())
+                    current_parts.append(part)
+                    has_text = has_text or (bool(part) and not part.isspace())
+            if has_text:
+                new_segments.append(''.join(current_parts).strip())
         segments = new_segments if new_segments else segments
 
     # Process each segment into an activity entry
@@ -2505,6 +3528,10 @@ def _split_into_activity_rows(text: str) -> list:
     return activities
 
 
+# Double newlines or significant breaks between paragraphs
+_PARAGRAPH_BREAK_RE = re.compile(r'\n\s*\n+')
+
+
 def _split_by_paragraphs(text: str) -> list:
     """
     Split text into activities based on paragraph breaks.
@@ -2513,7 +3540,7 @@ def _split_by_paragraphs(text: str) -> list:
     activities = []
 
     # Look for double newlines or significant breaks
-    paragraphs = re.split(r'\n\s*\n+', text)
+    paragraphs = _PARAGRAPH_BREAK_RE.split(text)
 
     if len(paragraphs) <= 1:
         # No paragraph breaks - return empty to trigger fallback
@@ -2539,6 +3566,16 @@ def _split_by_paragraphs(text: str) -> list:
     return activities
 
 
+# Look for benefit/description markers
+_DESCRIPTION_BENEFIT_MARKER_RES = tuple(re.compile(p, re.IGNORECASE) for p in [
+    r'The\s+community\s+will\s+benefit\s+by',
+    r'community\s+will\s+benefit',
+    r'will\s+benefit\s+the\s+community',
+    r'This\s+will\s+(?:help|benefit|support|enable)',
+    r'Benefits?\s*:',
+])
+
+
 def _extract_activity_description(text: str) -> tuple:
     """
     Extract activity and description/benefit from a text segment.
@@ -2547,22 +3584,14 @@ def _extract_activity_description(text: str) -> tuple:
         Tuple of (activity_text, benefit_text)
     """
     # Clean up whitespace but preserve some structure
-    text = re.sub(r'\s+', ' ', text).strip()
-
-    # Look for benefit/description markers
-    benefit_markers = [
-        r'The\s+community\s+will\s+benefit\s+by',
-        r'community\s+will\s+benefit',
-        r'will\s+benefit\s+the\s+community',
-        r'This\s+will\s+(?:help|benefit|support|enable)',
-        r'Benefits?\s*:',
-    ]
+    text = ' '.join(text.split())
 
     activity_text = text
     benefit_text = ""
 
-    for marker in benefit_markers:
-        match = re.search(marker, text, re.IGNORECASE)
+    # Look for benefit/description markers
+    for marker_re in _DESCRIPTION_BENEFIT_MARKER_RES:
+        match = marker_re.search(text)
         if match:
             activity_text = text[:match.start()].strip()
             benefit_text = text[match.end():].strip()
@@ -2590,7 +3619,7 @@ def _parse_single_activity_entry(text: str) -> list:
     activities = []
 
     # Clean up extra whitespace
-    cleaned_content = re.sub(r'\s+', ' ', text).strip()
+    cleaned_content = ' '.join(text.split())
 
     if not cleaned_content or len(cleaned_content) < 20:
         return activities
@@ -2618,68 +3647,83 @@ def _parse_single_activity_entry(text: str) -> list:
     return activities
 
 
+# Parentheticals anywhere in extracted text that look like form instructions
+_TELL_US_PARENTHETICAL_RE = re.compile(r'\([^)]*tell\s+us[^)]*\)', re.IGNORECASE)
+_BENEFIT_BY_PARENTHETICAL_RE = re.compile(r'\([^)]*community\s+will\s+benefit\s+by[^)]*\)', re.IGNORECASE)
+
+
+@lru_cache(maxsize=1024)
 def _clean_extracted_text(text: str) -> str:
     """Clean up extracted text by removing artifacts and normalizing whitespace."""
     if not text:
         return ""
 
     # Remove common OCR artifacts
-    text = re.sub(r'[|¦]', '', text)  # Table cell separators
-    text = re.sub(r'\s+', ' ', text)  # Normalize whitespace
-    text = re.sub(r'^\s*[-–—]\s*', '', text)  # Leading dashes
-    text = re.sub(r'\s*[-–—]\s*$', '', text)  # Trailing dashes
+    text = text.translate(_CELL_SEPARATOR_DELETE)  # Table cell separators
+    text = _WHITESPACE_RUN_RE.sub(' ', text)  # Normalize whitespace
+    text = _LEADING_DASH_RE.sub('', text)  # Leading dashes
+    text = _TRAILING_DASH_RE.sub('', text)  # Trailing dashes
 
     # Remove stray parentheses content that looks like form instructions
-    text = re.sub(r'\([^)]*tell\s+us[^)]*\)', '', text, flags=re.IGNORECASE)
-    text = re.sub(r'\([^)]*community\s+will\s+benefit\s+by[^)]*\)', '', text, flags=re.IGNORECASE)
+    text = _TELL_US_PARENTHETICAL_RE.sub('', text)
+    text = _BENEFIT_BY_PARENTHETICAL_RE.sub('', text)
 
     return text.strip()
 
 
+# Patterns that indicate form instructions (match at start of the lowercased
+# text). Only whether any matches is used, so they are one alternation.
+_INSTRUCTION_START_RE = re.compile('|'.join(f'(?:{p})' for p in [
+    r'^please\s+indicate',
+    r'^please\s+provide',
+    r'^a\s+section\s+of\s+the\s+community',
+    r'^to\s+enable\s+the\s+(?:cic\s+)?regulator',
+    r'^how\s+will\s+the\s+activity',
+    r'^tell\s+us\s+here',
+    r'^the\s+community\s+will\s+benefit\s+by\s*\.{0,3}\s*$',
+    r'^it\s+would\s+(?:be\s+)?useful\s+if\s+you',
+    r'^eligible\s+to\s+be(?:come)?\s+a\s+community',
+    r"^that\s+the\s+company['']?s\s+activities",
+    r'^section\s*b\s*[:\-]?\s*community\s+interest',
+]))
+
+# Patterns that indicate text is MOSTLY form boilerplate (search anywhere)
+_INSTRUCTION_INDICATOR_RES = tuple(re.compile(p) for p in [
+    r'enable\s+the\s+(?:cic\s+)?regulator\s+to\s+make',
+    r'informed\s+decision\s+about\s+whether',
+    r'would\s+(?:be\s+)?useful\s+if\s+you\s+were\s+to\s+explain',
+    r'think\s+your\s+company\s+will\s+be\s+for\s+individual',
+    r'individual\s+or\s+personal\s+gain',
+    r'different\s+from\s+a\s+commercial\s+company',
+    r'company\s+name\s+section\s+b',
+])
+# A word each indicator above needs; text with none of them has no indicators
+_INSTRUCTION_INDICATOR_WORDS = ('regulator', 'informed', 'useful', 'individual', 'commercial', 'section')
+
+
+@lru_cache(maxsize=1024)
 def _is_form_instruction_only(text: str) -> bool:
     """Check if text contains only form instructions without actual content."""
     if not text or len(text) < 20:
         return True
 
-    # Patterns that indicate form instructions (match at start)
-    start_instruction_patterns = [
-        r'^please\s+indicate',
-        r'^please\s+provide',
-        r'^a\s+section\s+of\s+the\s+community',
-        r'^to\s+enable\s+the\s+(?:cic\s+)?regulator',
-        r'^how\s+will\s+the\s+activity',
-        r'^tell\s+us\s+here',
-        r'^the\s+community\s+will\s+benefit\s+by\s*\.{0,3}\s*$',
-        r'^it\s+would\s+(?:be\s+)?useful\s+if\s+you',
-        r'^eligible\s+to\s+be(?:come)?\s+a\s+community',
-        r"^that\s+the\s+company['']?s\s+activities",
-        r'^section\s*b\s*[:\-]?\s*community\s+interest',
-    ]
-
-    # Patterns that indicate text is MOSTLY form boilerplate (search anywhere)
-    boilerplate_indicators = [
-        r'enable\s+the\s+(?:cic\s+)?regulator\s+to\s+make',
-        r'informed\s+decision\s+about\s+whether',
-        r'would\s+(?:be\s+)?useful\s+if\s+you\s+were\s+to\s+explain',
-        r'think\s+your\s+company\s+will\s+be\s+for\s+individual',
-        r'individual\s+or\s+personal\s+gain',
-        r'different\s+from\s+a\s+commercial\s+company',
-        r'company\s+name\s+section\s+b',
-    ]
-
     text_lower = text.lower().strip()
 
     # Check start patterns
-    for pattern in start_instruction_patterns:
-        if re.match(pattern, text_lower):
-            return True
+    if _INSTRUCTION_START_RE.match(text_lower):
+        return True
+
+    # Too long to be predominantly boilerplate, whatever indicators it has
+    if len(text_lower) >= 500:
+        return False
 
     # Check if text is predominantly boilerplate
     # Count how many boilerplate indicators are found
     boilerplate_count = 0
-    for pattern in boilerplate_indicators:
-        if re.search(pattern, text_lower):
-            boilerplate_count += 1
+    if any(word in text_lower for word in _INSTRUCTION_INDICATOR_WORDS):
+        for indicator_re in _INSTRUCTION_INDICATOR_RES:
+            if indicator_re.search(text_lower):
+                boilerplate_count += 1
 
     # If more than one boilerplate indicator and text is short, it's likely instructions
     if boilerplate_count >= 2 and len(text_lower) < 500:
@@ -2692,6 +3736,10 @@ def _is_form_instruction_only(text: str) -> bool:
     return False
 
 
+# A non-empty line of OCR text
+_TEXT_LINE_RE = re.compile(r'[^\n]+')
+
+
 def _parse_ocr_text_alternative(text: str) -> list:
     """
     Alternative parsing strategy for difficult OCR text.
@@ -2702,13 +3750,13 @@ def _parse_ocr_text_alternative(text: str) -> list:
     if not text:
         return activities
 
-    # Clean up the text
-    lines = text.split('\n')
+    # Clean up the text, streaming the non-empty lines and testing them
+    # against the header alternation directly
     meaningful_lines = []
 
-    for line in lines:
-        line = line.strip()
-        if len(line) > 10 and not _is_header_line(line):
+    for match in _TEXT_LINE_RE.finditer(text):
+        line = match.group().strip()
+        if len(line) > 10 and not _HEADER_LINE_RE.match(line.lower()):
             meaningful_lines.append(line)
 
     if meaningful_lines:
@@ -2724,34 +3772,86 @@ def _parse_ocr_text_alternative(text: str) -> list:
     return activities
 
 
+# Header and form-instruction lines, matched against the lowercased line as
+# one alternation
+_HEADER_LINE_RE = re.compile('|'.join(f'(?:{p})' for p in [
+    r'^activities?\s*$',
+    r'^benefits?\s*$',
+    r'^section\s*[a-z]',
+    r'^cic\s*\d+',
+    r'^form\s+',
+    r'^page\s+\d+',
+    r'^companies\s+house',
+    r'^how\s+will\s+the\s+activity',
+    r'^\d+\s*$',
+    r'^[\-_=]+$',
+]))
+
+
 def _is_header_line(line: str) -> bool:
     """
     Check if a line appears to be a header or form instruction.
     """
-    header_patterns = [
-        r'^activities?\s*$',
-        r'^benefits?\s*$',
-        r'^section\s*[a-z]',
-        r'^cic\s*\d+',
-        r'^form\s+',
-        r'^page\s+\d+',
-        r'^companies\s+house',
-        r'^how\s+will\s+the\s+activity',
-        r'^\d+\s*$',
-        r'^[\-_=]+$',
-    ]
-
     line_lower = line.lower().strip()
 
-    for pattern in header_patterns:
-        if re.match(pattern, line_lower):
-            return True
+    return bool(_HEADER_LINE_RE.match(line_lower))
 
-    return False
+
+def _enhanced_ocr_page(pdf_path: str, page_num: int, preprocess: bool, tess_api=None):
+    """
+    OCR one page for extract_with_enhanced_ocr.
+
+    Args:
+        pdf_path: Path to the PDF file
+        page_num: 1-indexed page number
+        preprocess: Whether to apply image preprocessing
+        tess_api: Open tesserocr API, or None to use pytesseract
+
+    Returns:
+        The page text, or None if the page could not be rendered
+    """
+    from PIL import ImageEnhance, ImageFilter
+
+    images = convert_from_path(
+        pdf_path,
+        first_page=page_num,
+        last_page=page_num,
+        dpi=400  # Higher DPI for scanned docs
+    )
+    if not images:
+        return None
+
+    img = images[0]
+
+    if preprocess:
+        # Convert to grayscale
+        img = img.convert('L')
+
+        # Enhance contrast
+        enhancer = ImageEnhance.Contrast(img)
+        img = enhancer.enhance(2.0)
+
+        # Sharpen
+        img = img.filter(ImageFilter.SHARPEN)
+
+    # OCR as a single uniform block of text (--psm 6), which suits handwriting
+    if tess_api is not None:
+        tess_api.SetPageSegMode(PSM.SINGLE_BLOCK)
+        _set_api_image(tess_api, img)
+        return tess_api.GetUTF8Text()
+
+    # The preprocessed page goes to tesseract uncompressed rather than PNG-encoded
+    custom_config = r'--oem 3 --psm 6'
+    return pytesseract.image_to_string(_tesseract_input(img), config=custom_config)
+
+
+def _enhanced_ocr_page_worker(pdf_path: str, page_num: int, preprocess: bool):
+    """Process pool entry point for _enhanced_ocr_page."""
+    return _enhanced_ocr_page(pdf_path, page_num, preprocess, _WORKER_TESS_API)
 
 
 def extract_with_enhanced_ocr(pdf_path: str | Path, page_numbers: list,
-                               preprocess: bool = True) -> dict:
+                               preprocess: bool = True, max_workers: int = 1) -> dict:
     """
     Enhanced OCR extraction with image preprocessing for better results.
 
@@ -2759,6 +3859,8 @@ def extract_with_enhanced_ocr(pdf_path: str | Path, page_numbers: list,
         pdf_path: Path to the PDF file
         page_numbers: List of 1-indexed page numbers to process
         preprocess: Whether to apply image preprocessing
+        max_workers: Processes to OCR pages on (default 1, as for
+            extract_section_b_ocr)
 
     Returns:
         Same structure as extract_section_b_ocr
@@ -2780,41 +3882,46 @@ def extract_with_enhanced_ocr(pdf_path: str | Path, page_numbers: list,
     try:
         from PIL import Image, ImageEnhance, ImageFilter
 
-        for page_num in page_numbers:
-            try:
-                images = convert_from_path(
-                    str(pdf_path),
-                    first_page=page_num,
-                    last_page=page_num,
-                    dpi=400  # Higher DPI for scanned docs
-                )
-
-                if images:
-                    img = images[0]
-
-                    if preprocess:
-                        # Convert to grayscale
-                        img = img.convert('L')
-
-                        # Enhance contrast
-                        enhancer = ImageEnhance.Contrast(img)
-                        img = enhancer.enhance(2.0)
-
-                        # Sharpen
-                        img = img.filter(ImageFilter.SHARPEN)
-
-                    # OCR with custom config for handwriting
-                    custom_config = r'--oem 3 --psm 6'
-                    text = pytesseract.image_to_string(img, config=custom_config)
-
-                    result["raw_text"][page_num] = text
-                    result["pages_processed"].append(page_num)
-
-            except Exception as e:
-                result["raw_text"][f"page_{page_num}_error"] = str(e)
+        # Pages are independent - with max_workers > 1 they are OCR'd on
+        # separate processes; results are still recorded in page order
+        workers = min(max_workers, len(page_numbers))
+        tess_api = None
+        if workers > 1:
+            # Each worker loads Tesseract once, in _init_ocr_worker
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_ocr_worker,
+                                     initargs=(str(pdf_path),)) as executor:
+                futures = [executor.submit(_enhanced_ocr_page_worker, str(pdf_path), page_num, preprocess)
+                           for page_num in page_numbers]
+            page_results = [future.result for future in futures]
+        else:
+            # One Tesseract instance for every page, instead of a tesseract
+            # process per pytesseract call
+            if TESSEROCR_AVAILABLE:
+                try:
+                    tess_api = PyTessBaseAPI()
+                except Exception as e:
+                    logger.debug(f"tesserocr unavailable, using pytesseract: {e}")
+            page_results = [partial(_enhanced_ocr_page, str(pdf_path), page_num, preprocess, tess_api)
+                            for page_num in page_numbers]
 
-        # Parse combined text
-        combined_text = "\n".join(str(v) for v in result["raw_text"].values() if not str(v).startswith("page_"))
+        try:
+            for page_num, page_result in zip(page_numbers, page_results):
+                try:
+                    text = page_result()
+                    if text is not None:
+                        result["raw_text"][page_num] = text
+                        result["pages_processed"].append(page_num)
+
+                except Exception as e:
+                    result["raw_text"][f"page_{page_num}_error"] = str(e)
+        finally:
+            if tess_api is not None:
+                tess_api.End()
+
+        # Parse combined text - OCR'd pages are keyed by page number, errors
+        # by "page_<n>_error"
+        combined_text = "\n".join(text for key, text in result["raw_text"].items()
+                                  if isinstance(key, int))
         activities = _parse_ocr_text_for_activities(combined_text)
 
         if activities:
@@ -2854,7 +3961,8 @@ if __name__ == "__main__":
     print(f"\nExtracting from: {pdf_path}")
     print(f"Pages: {page_numbers}")
 
-    result = extract_section_b_ocr(pdf_path, page_numbers)
+    # Single document - spread its pages over all cores
+    result = extract_section_b_ocr(pdf_path, page_numbers, max_workers=os.cpu_count() or 1)
 
     print(f"\nResults:")
     print(f"  Success: {result['success']}")
@@ -6,7 +6,11 @@ within CIC incorporation documents, specifically finding Section B which contain
 the Activities and Benefits table.
 """
 
+import copy
 import pdfplumber
+from collections import OrderedDict
+from contextlib import nullcontext
+from itertools import chain
 from pathlib import Path
 from typing import Optional
 import re
@@ -75,14 +79,46 @@ EXCLUDE_PATTERNS = [
     r"Statement\s+of\s+Compliance",
 ]
 
-
-def find_cic36_pages(pdf_path: str | Path, document_type: str = "electronic") -> dict:
+# The pattern lists above, compiled once at import. Only whether any pattern
+# in a list matches is used, so each list is one alternation and a page costs
+# a single search() per list. The string lists stay public for callers that
+# use them directly.
+_CIC36_RE = re.compile('|'.join(f'(?:{p})' for p in CIC36_PATTERNS), re.IGNORECASE)
+_SECTION_B_PRIMARY_RE = re.compile('|'.join(f'(?:{p})' for p in SECTION_B_PATTERNS_PRIMARY), re.IGNORECASE)
+_SECTION_B_SECONDARY_RE = re.compile('|'.join(f'(?:{p})' for p in SECTION_B_PATTERNS_SECONDARY), re.IGNORECASE)
+_SECTION_B_TABLE_RE = re.compile('|'.join(f'(?:{p})' for p in SECTION_B_TABLE_PATTERNS), re.IGNORECASE)
+_EXCLUDE_RE = re.compile('|'.join(f'(?:{p})' for p in EXCLUDE_PATTERNS), re.IGNORECASE)
+
+# A word every pattern in each list needs (lowercase); a page with none of
+# them cannot match the list
+_CIC36_WORDS = ('cic', 'formation', 'community')
+_SECTION_B_WORDS = ('activit', 'community')
+_EXCLUDE_WORDS = ('section', 'memorandum', 'articles', 'certificate', 'compliance')
+
+# Results of find_cic36_pages, keyed by resolved path, mtime, size and
+# arguments. Process-local: each pipeline worker keeps its own.
+_LOCATION_CACHE: OrderedDict = OrderedDict()
+_LOCATION_CACHE_SIZE = 1024
+
+
+def find_cic36_pages(pdf_path: str | Path, document_type: str = "electronic",
+                     stop_early: bool = True, pdf=None) -> dict:
     """
     Locate CIC 36 form pages within a PDF document.
 
+    Results are cached in memory for as long as the file's size and
+    modification time are unchanged.
+
     Args:
         pdf_path: Path to the PDF file
         document_type: 'electronic' or 'scanned' - affects extraction method
+        stop_early: Stop reading pages one page after a high-confidence
+            Section B page that follows a CIC 36 page. The section_b_page and
+            confidence are the same either way, but cic36_pages and the
+            Section B candidates then only cover the pages read. Pass False
+            to scan the whole document.
+        pdf: Already-open pdfplumber PDF of pdf_path to read instead of
+            opening the file again (left open)
 
     Returns:
         Dictionary with:
@@ -96,6 +132,25 @@ def find_cic36_pages(pdf_path: str | Path, document_type: str = "electronic") ->
     if not pdf_path.exists():
         raise FileNotFoundError(f"PDF not found: {pdf_path}")
 
+    # Reuse the result for an unchanged file (same path, size and mtime)
+    stat = pdf_path.stat()
+    cache_key = (str(pdf_path.resolve()), stat.st_mtime_ns, stat.st_size, document_type, stop_early)
+    if cache_key in _LOCATION_CACHE:
+        _LOCATION_CACHE.move_to_end(cache_key)
+        return copy.deepcopy(_LOCATION_CACHE[cache_key])
+
+    result = _locate_cic36_pages(pdf_path, document_type, stop_early, pdf)
+
+    # Failed scans are not cached, so they are retried next time
+    if "error" not in result["search_details"]:
+        _LOCATION_CACHE[cache_key] = copy.deepcopy(result)
+        while len(_LOCATION_CACHE) > _LOCATION_CACHE_SIZE:
+            _LOCATION_CACHE.popitem(last=False)
+    return result
+
+
+def _locate_cic36_pages(pdf_path: Path, document_type: str, stop_early: bool, pdf=None) -> dict:
+    """Uncached body of find_cic36_pages."""
     result = {
         "cic36_pages": [],
         "section_b_page": None,
@@ -107,56 +162,62 @@ def find_cic36_pages(pdf_path: str | Path, document_type: str = "electronic") ->
         # For scanned documents, we'll need OCR - return placeholder for now
         # The actual OCR is handled in extract_scanned.py
         result["search_details"]["note"] = "Scanned document - requires OCR for accurate detection"
-        result["search_details"]["suggested_pages"] = _guess_cic36_location_scanned(pdf_path)
+        result["search_details"]["suggested_pages"] = _guess_cic36_location_scanned(pdf_path, pdf)
         return result
 
     try:
-        with pdfplumber.open(pdf_path) as pdf:
+        with nullcontext(pdf) if pdf is not None else pdfplumber.open(pdf_path) as pdf:
             page_count = len(pdf.pages)
             result["search_details"]["page_count"] = page_count
 
             cic36_matches = []
             section_b_matches = []
             section_b_confidence = {}  # Track confidence per page
+            first_high_page = None  # First high-confidence Section B page
 
             # Search each page for patterns
             for page_num, page in enumerate(pdf.pages, start=1):
                 text = page.extract_text() or ""
 
-                # Skip pages that match exclusion patterns
-                is_excluded = any(re.search(p, text, re.IGNORECASE) for p in EXCLUDE_PATTERNS)
+                # Lowercased copy for the keyword prefilters. Lowercasing is
+                # only equivalent to IGNORECASE for ASCII text, so pages with
+                # other characters always run the patterns.
+                lowered = text.lower() if text.isascii() else None
 
                 # Check for CIC 36 form markers
-                for pattern in CIC36_PATTERNS:
-                    if re.search(pattern, text, re.IGNORECASE):
-                        cic36_matches.append(page_num)
-                        break
+                is_cic36 = (_may_match(lowered, _CIC36_WORDS)
+                            and _CIC36_RE.search(text) is not None)
+                if is_cic36:
+                    cic36_matches.append(page_num)
 
                 # Check for Section B markers with confidence levels
-                # Skip if page is clearly wrong section
-                if not is_excluded or page_num not in cic36_matches:
-                    # Check high confidence patterns first
-                    for pattern in SECTION_B_PATTERNS_PRIMARY:
-                        if re.search(pattern, text, re.IGNORECASE):
-                            section_b_matches.append(page_num)
-                            section_b_confidence[page_num] = "high"
-                            break
-
-                    # If no high confidence match, try secondary patterns
-                    if page_num not in section_b_matches:
-                        for pattern in SECTION_B_PATTERNS_SECONDARY:
-                            if re.search(pattern, text, re.IGNORECASE):
-                                section_b_matches.append(page_num)
-                                section_b_confidence[page_num] = "medium"
-                                break
-
-                    # Try table patterns last
-                    if page_num not in section_b_matches:
-                        for pattern in SECTION_B_TABLE_PATTERNS:
-                            if re.search(pattern, text, re.IGNORECASE):
-                                section_b_matches.append(page_num)
-                                section_b_confidence[page_num] = "low"
-                                break
+                # Skip if page is clearly wrong section (matches exclusion
+                # patterns; only checked on CIC 36 pages, the only ones it skips)
+                is_excluded = (is_cic36 and _may_match(lowered, _EXCLUDE_WORDS)
+                               and _EXCLUDE_RE.search(text) is not None)
+                if not is_excluded and _may_match(lowered, _SECTION_B_WORDS):
+                    # Check high confidence patterns first, then secondary
+                    # patterns, then table patterns last
+                    confidence = None
+                    if _SECTION_B_PRIMARY_RE.search(text):
+                        confidence = "high"
+                    elif _SECTION_B_SECONDARY_RE.search(text):
+                        confidence = "medium"
+                    elif _SECTION_B_TABLE_RE.search(text):
+                        confidence = "low"
+
+                    if confidence:
+                        section_b_matches.append(page_num)
+                        section_b_confidence[page_num] = confidence
+                        if confidence == "high" and first_high_page is None:
+                            first_high_page = page_num
+
+                # Section B is settled once a high-confidence page follows a
+                # CIC 36 page; read one page past it to take in its continuation
+                if (stop_early and first_high_page is not None
+                        and cic36_matches and cic36_matches[0] <= first_high_page
+                        and page_num > first_high_page):
+                    break
 
             # Remove duplicates and sort
             cic36_pages = sorted(set(cic36_matches))
@@ -191,7 +252,12 @@ def find_cic36_pages(pdf_path: str | Path, document_type: str = "electronic") ->
     return result
 
 
-def _guess_cic36_location_scanned(pdf_path: Path) -> list:
+def _may_match(lowered: Optional[str], words: tuple) -> bool:
+    """Whether lowercased page text has any of the words (True if no copy was made)."""
+    return lowered is None or any(word in lowered for word in words)
+
+
+def _guess_cic36_location_scanned(pdf_path: Path, pdf=None) -> list:
     """
     For scanned documents, guess likely CIC 36 form location.
 
@@ -202,7 +268,7 @@ def _guess_cic36_location_scanned(pdf_path: Path) -> list:
     Returns pages from all likely locations to handle various form versions.
     """
     try:
-        with pdfplumber.open(pdf_path) as pdf:
+        with nullcontext(pdf) if pdf is not None else pdfplumber.open(pdf_path) as pdf:
             page_count = len(pdf.pages)
 
             # Legacy forms (2006): Section B at beginning - first 15 pages
@@ -224,25 +290,20 @@ def _guess_cic36_location_scanned(pdf_path: Path) -> list:
 
             # Combine all ranges, removing duplicates while preserving order
             # Check beginning first (for legacy), then mid, then end (for modern)
-            all_pages = legacy_pages.copy()
-            for p in mid_pages:
-                if p not in all_pages:
-                    all_pages.append(p)
-            for p in modern_pages:
-                if p not in all_pages:
-                    all_pages.append(p)
-            return all_pages
+            return list(dict.fromkeys(chain(legacy_pages, mid_pages, modern_pages)))
     except:
         return []
 
 
-def find_section_b_table_bounds(pdf_path: str | Path, page_number: int) -> Optional[dict]:
+def find_section_b_table_bounds(pdf_path: str | Path, page_number: int, pdf=None) -> Optional[dict]:
     """
     Find the bounds of the Section B table on a specific page.
 
     Args:
         pdf_path: Path to the PDF file
         page_number: 1-indexed page number to search
+        pdf: Already-open pdfplumber PDF of pdf_path to read instead of
+            opening the file again (left open)
 
     Returns:
         Dictionary with table bounds or None if not found
@@ -250,7 +311,7 @@ def find_section_b_table_bounds(pdf_path: str | Path, page_number: int) -> Optio
     pdf_path = Path(pdf_path)
 
     try:
-        with pdfplumber.open(pdf_path) as pdf:
+        with nullcontext(pdf) if pdf is not None else pdfplumber.open(pdf_path) as pdf:
             if page_number < 1 or page_number > len(pdf.pages):
                 return None
 
@@ -8,13 +8,19 @@ large document collections.
 
 import json
 import logging
+import multiprocessing
+import os
+import queue
+import threading
 import time
 from pathlib import Path
 from datetime import datetime
 from concurrent.futures import ProcessPoolExecutor, as_completed
 from typing import Optional
 import traceback
+from contextlib import nullcontext
 
+import pdfplumber
 from tqdm import tqdm
 
 # Import pipeline modules
@@ -22,7 +28,8 @@ from classify_document import classify_document
 from locate_cic36 import find_cic36_pages
 from extract_electronic import extract_section_b_table, extract_text_fallback
 from extract_scanned import extract_section_b_ocr, check_ocr_available
-from structure_data import structure_extraction_result, save_to_json, merge_batch_results, validate_structured_data
+from structure_data import (structure_extraction_result, save_to_json, load_from_json,
+                            merge_batch_results, save_batch_streaming, validate_structured_data)
 
 
 # Configure logging
@@ -45,6 +52,14 @@ def setup_logging(log_dir: Path) -> logging.Logger:
     return logging.getLogger(__name__)
 
 
+def _open_pdf(pdf_path: Path):
+    """Open a PDF with pdfplumber, or return None if it cannot be opened."""
+    try:
+        return pdfplumber.open(pdf_path)
+    except Exception:
+        return None
+
+
 def process_single_document(pdf_path: Path) -> dict:
     """
     Process a single PDF document through the extraction pipeline.
@@ -62,47 +77,52 @@ def process_single_document(pdf_path: Path) -> dict:
     start_time = time.time()
 
     try:
-        # Step 1: Classify document
-        doc_type, classification_meta = classify_document(pdf_path)
-
-        # Step 2: Locate CIC 36 form
-        location_result = find_cic36_pages(pdf_path, doc_type)
-
-        # Step 3: Determine pages to process
-        section_b_page = location_result.get("section_b_page")
-        suggested_pages = location_result.get("search_details", {}).get("suggested_pages", [])
-        image_pages = classification_meta.get("image_pages", [])
-
-        # Build page list based on doc type
-        if doc_type == "electronic":
-            pages_to_extract = [section_b_page] if section_b_page else suggested_pages[:1]
-        elif doc_type == "scanned":
-            if section_b_page:
-                pages_to_extract = [section_b_page, section_b_page + 1]
-            else:
-                pages_to_extract = suggested_pages
-        elif doc_type == "hybrid":
-            pages_to_extract = image_pages[-25:] if len(image_pages) > 25 else image_pages
-        else:
-            pages_to_extract = []
-
-        # Step 4: Extract based on document type
-        if doc_type == "electronic":
-            # Try table extraction first
-            if pages_to_extract:
-                extraction_result = extract_section_b_table(pdf_path, pages_to_extract[0])
+        # Steps 1-4 (electronic) read the PDF through one shared pdfplumber
+        # handle, closed again before any OCR. If it cannot be opened each
+        # stage opens the file itself and reports its own error.
+        with _open_pdf(pdf_path) or nullcontext() as pdf:
+            # Step 1: Classify document
+            doc_type, classification_meta = classify_document(pdf_path, pdf=pdf)
+
+            # Step 2: Locate CIC 36 form
+            location_result = find_cic36_pages(pdf_path, doc_type, pdf=pdf)
+
+            # Step 3: Determine pages to process
+            section_b_page = location_result.get("section_b_page")
+            suggested_pages = location_result.get("search_details", {}).get("suggested_pages", [])
+            image_pages = classification_meta.get("image_pages", [])
+
+            # Build page list based on doc type
+            if doc_type == "electronic":
+                pages_to_extract = [section_b_page] if section_b_page else suggested_pages[:1]
+            elif doc_type == "scanned":
+                if section_b_page:
+                    pages_to_extract = [section_b_page, section_b_page + 1]
+                else:
+                    pages_to_extract = suggested_pages
+            elif doc_type == "hybrid":
+                pages_to_extract = image_pages[-25:] if len(image_pages) > 25 else image_pages
             else:
-                extraction_result = {"success": False, "activities": [], "error": "Could not locate Section B"}
-
-            # If table extraction failed, try text fallback
-            if not extraction_result.get("success"):
-                pages_to_try = extraction_result.get("pages_searched", []) or pages_to_extract
-                if pages_to_try:
-                    fallback_result = extract_text_fallback(pdf_path, pages_to_try)
-                    if fallback_result.get("success"):
-                        extraction_result = fallback_result
-
-        elif doc_type == "scanned":
+                pages_to_extract = []
+
+            # Step 4: Extract based on document type
+            if doc_type == "electronic":
+                # Try table extraction first
+                if pages_to_extract:
+                    extraction_result = extract_section_b_table(pdf_path, pages_to_extract[0], pdf=pdf)
+                else:
+                    extraction_result = {"success": False, "activities": [], "error": "Could not locate Section B"}
+
+                # If table extraction failed, try text fallback
+                if not extraction_result.get("success"):
+                    pages_to_try = extraction_result.get("pages_searched", []) or pages_to_extract
+                    if pages_to_try:
+                        fallback_result = extract_text_fallback(pdf_path, pages_to_try, pdf=pdf)
+                        if fallback_result.get("success"):
+                            extraction_result = fallback_result
+
+        # Scanned and hybrid documents are OCR'd once the handle is closed
+        if doc_type == "scanned":
             if pages_to_extract:
                 extraction_result = extract_section_b_ocr(pdf_path, pages_to_extract)
             else:
@@ -114,7 +134,7 @@ def process_single_document(pdf_path: Path) -> dict:
             else:
                 extraction_result = {"success": False, "activities": [], "error": "Hybrid doc but no image pages found"}
 
-        else:
+        elif doc_type != "electronic":
             extraction_result = {"success": False, "activities": [], "error": f"Unknown document type: {doc_type}"}
 
         # Step 5: Structure the result
@@ -149,13 +169,81 @@ def process_single_document(pdf_path: Path) -> dict:
         }
 
 
+def _find_pdfs(input_dir: Path) -> list[Path]:
+    """Absolute paths of the PDF files directly inside input_dir."""
+    with os.scandir(input_dir.resolve()) as entries:
+        return [Path(entry.path) for entry in entries
+                if entry.name.lower().endswith(".pdf") and entry.is_file()]
+
+
+def _load_current_result(pdf_path: Path, output_dir: Path) -> Optional[dict]:
+    """
+    The result JSON saved for a PDF, if there is one newer than the PDF.
+
+    Results of documents that raised an error are not reused, so those are
+    retried; so is any file that is not a result object with a section_b.
+    """
+    output_file = output_dir / (pdf_path.stem + ".json")
+    try:
+        if output_file.stat().st_mtime < pdf_path.stat().st_mtime:
+            return None
+    except OSError:
+        return None
+    result = load_from_json(output_file)
+    if not isinstance(result, dict) or not isinstance(result.get("section_b"), dict):
+        return None
+    if result.get("extraction_status") == "error":
+        return None
+    return result
+
+
+# Modules a forkserver imports once, before forking workers from it
+_WORKER_PRELOAD = ["pdfplumber", "classify_document", "locate_cic36",
+                   "extract_electronic", "extract_scanned", "structure_data"]
+
+
+def _pool_context():
+    """
+    Multiprocessing context for the document pool.
+
+    Keeps the platform's default start method: fork already shares the
+    parent's imports, and spawn cannot preload. Under forkserver (the Linux
+    default from Python 3.14) the pipeline modules are preloaded in the
+    server, so each worker starts with them imported instead of importing
+    pdfplumber, OpenCV and the rest itself.
+    """
+    ctx = multiprocessing.get_context()
+    if ctx.get_start_method() == "forkserver":
+        ctx.set_forkserver_preload(_WORKER_PRELOAD)
+    return ctx
+
+
+def _intermediate_writer(snapshots: queue.Queue, output_path: Path) -> None:
+    """
+    Background writer for run_pipeline's intermediate batch summaries.
+
+    Takes lists of results off the queue, merges and saves each one, until
+    it gets None. A snapshot that fails is logged and skipped, so the
+    thread keeps draining the queue and run_pipeline never blocks on it.
+    """
+    while True:
+        results = snapshots.get()
+        if results is None:
+            return
+        try:
+            save_batch_streaming(merge_batch_results(results), output_path)
+        except Exception as e:
+            logging.getLogger(__name__).error(f"Could not save intermediate batch summary: {e}")
+
+
 def run_pipeline(
     input_dir: str | Path,
     output_dir: str | Path,
     log_dir: Optional[str | Path] = None,
     max_workers: int = 4,
     batch_size: int = 50,
-    use_dated_folder: bool = True
+    use_dated_folder: bool = True,
+    force: bool = False
 ) -> dict:
     """
     Run the extraction pipeline on all PDFs in a directory.
@@ -167,6 +255,9 @@ def run_pipeline(
         max_workers: Number of parallel workers
         batch_size: Number of documents to process before saving intermediate results
         use_dated_folder: If True, creates a dated subfolder (YYYY-MM-DD_HHMMSS)
+        force: Reprocess every PDF. Otherwise a PDF whose result JSON is
+            already in the output folder and newer than the PDF is skipped and
+            its saved result reused (only possible without a dated folder)
 
     Returns:
         Batch summary with statistics
@@ -203,9 +294,9 @@ def run_pipeline(
         logger.warning(f"OCR not available: {ocr_status['errors']}")
         logger.warning("Scanned documents will not be processed correctly")
 
-    # Find all PDFs (deduplicate for case-insensitive filesystems like Windows)
-    pdf_files = list({p.resolve() for p in input_dir.glob("*.pdf")} |
-                     {p.resolve() for p in input_dir.glob("*.PDF")})
+    # Find all PDFs in one directory pass, matching the extension in any case
+    # (each file is listed once, even on case-insensitive filesystems)
+    pdf_files = _find_pdfs(input_dir)
     logger.info(f"Found {len(pdf_files)} PDF files in {input_dir}")
 
     if not pdf_files:
@@ -216,7 +307,34 @@ def run_pipeline(
     all_results = []
     failed_docs = []
 
-    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+    # Reuse results already saved by an earlier run into the same folder
+    if not force:
+        to_process = []
+        for pdf_path in pdf_files:
+            result = _load_current_result(pdf_path, output_dir)
+            if result is None:
+                to_process.append(pdf_path)
+                continue
+            all_results.append(result)
+            logger.info(f"SKIPPED (cached): {pdf_path.name}")
+            if result.get("extraction_status") != "success":
+                failed_docs.append(str(pdf_path))
+        pdf_files = to_process
+
+    # Largest files first: they take longest to OCR, and starting them early
+    # keeps the pool from ending on a few long documents with workers idle
+    pdf_files.sort(key=lambda p: p.stat().st_size, reverse=True)
+
+    # Intermediate summaries are merged and written on a background thread so
+    # the result loop is not held up. The queue holds one pending snapshot;
+    # a newer one replaces it if the writer is still busy.
+    snapshots = queue.Queue(maxsize=1)
+    writer = threading.Thread(target=_intermediate_writer,
+                              args=(snapshots, output_dir / "batch_summary_intermediate.json"),
+                              daemon=True)
+    writer.start()
+
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=_pool_context()) as executor:
         # Submit all jobs
         future_to_pdf = {executor.submit(process_single_document, pdf): pdf for pdf in pdf_files}
 
@@ -249,12 +367,18 @@ def run_pipeline(
 
                 # Save intermediate batch results
                 if len(all_results) % batch_size == 0:
-                    batch_summary = merge_batch_results(all_results)
-                    save_to_json(batch_summary, output_dir / "batch_summary_intermediate.json")
+                    try:
+                        snapshots.get_nowait()
+                    except queue.Empty:
+                        pass
+                    snapshots.put(list(all_results))
+
+    snapshots.put(None)
+    writer.join()
 
     # Save final batch summary
     batch_summary = merge_batch_results(all_results)
-    save_to_json(batch_summary, output_dir / "batch_summary.json")
+    save_batch_streaming(batch_summary, output_dir / "batch_summary.json")
 
     # Save failed documents list
     if failed_docs:
@@ -325,6 +449,8 @@ Folder Structure:
     parser.add_argument("--single", action="store_true", help="Process single file instead of directory")
     parser.add_argument("--no-dated", action="store_true",
                         help="Don't create dated subfolder for output")
+    parser.add_argument("--force", action="store_true",
+                        help="Reprocess PDFs that already have an up-to-date result in the output folder")
 
     args = parser.parse_args()
 
@@ -363,7 +489,8 @@ Folder Structure:
             input_path,
             output_path,
             max_workers=args.workers,
-            use_dated_folder=not args.no_dated
+            use_dated_folder=not args.no_dated,
+            force=args.force
         )
 
         print(f"\nBatch Summary:")
@@ -6,14 +6,26 @@ for storage and analysis.
 """
 
 import logging
+from collections import Counter
 from pathlib import Path
 from datetime import datetime
-from typing import Optional
+from typing import Iterable, Optional
 import re
 import json
 
 logger = logging.getLogger(__name__)
 
+# Check for optional orjson support (faster JSON encoding and decoding)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Filename formats: {company_number}_newinc_{date}, or a leading company number
+_MODERN_FILENAME_RE = re.compile(r'^(\d+)_newinc_(\d{4}-\d{2}-\d{2})$')
+_COMPANY_NUMBER_RE = re.compile(r'^(\d{6,8})')
+
 
 def parse_filename(filename: str) -> dict:
     """
@@ -35,7 +47,7 @@ def parse_filename(filename: str) -> dict:
     filename = Path(filename).stem  # Remove extension
 
     # Try modern format: {company_number}_newinc_{date}
-    modern_match = re.match(r'^(\d+)_newinc_(\d{4}-\d{2}-\d{2})$', filename)
+    modern_match = _MODERN_FILENAME_RE.match(filename)
     if modern_match:
         result["company_number"] = modern_match.group(1)
         result["incorporation_date"] = modern_match.group(2)
@@ -43,7 +55,7 @@ def parse_filename(filename: str) -> dict:
         return result
 
     # Try format with just company number
-    number_match = re.match(r'^(\d{6,8})', filename)
+    number_match = _COMPANY_NUMBER_RE.match(filename)
     if number_match:
         result["company_number"] = number_match.group(1)
         result["filename_format"] = "partial"
@@ -85,8 +97,6 @@ def structure_extraction_result(
     else:
         status = "no_data"
 
-    # Build activities list
-    activities = []
     company_differs = ""
     surplus_use = ""
     beneficiaries = ""
@@ -99,17 +109,24 @@ def structure_extraction_result(
     if extraction_result.get("beneficiaries"):
         beneficiaries = extraction_result.get("beneficiaries", "")
 
-    for act in extraction_result.get("activities", []):
-        activities.append({
+    # Build activities list
+    raw_activities = extraction_result.get("activities", [])
+    activities = [
+        {
             "activity": act.get("activity", ""),
             "description": act.get("benefit", "") or act.get("description", "")
-        })
-        # Extract company_differs and surplus_use from first activity that has them
-        # (for scanned extraction which stores these in activities)
-        if not company_differs and act.get("company_differs"):
-            company_differs = act.get("company_differs", "")
-        if not surplus_use and act.get("surplus_use"):
-            surplus_use = act.get("surplus_use", "")
+        }
+        for act in raw_activities
+    ]
+
+    # Otherwise take company_differs and surplus_use from the first activity
+    # that has them (for scanned extraction which stores these in activities)
+    if not company_differs:
+        company_differs = next((act["company_differs"] for act in raw_activities
+                                if act.get("company_differs")), "")
+    if not surplus_use:
+        surplus_use = next((act["surplus_use"] for act in raw_activities
+                            if act.get("surplus_use")), "")
 
     # Build the structured output
     output = {
@@ -163,17 +180,17 @@ def validate_structured_data(data: dict) -> dict:
     if not data.get("company_number"):
         issues.append("Missing company_number")
 
-    if not data.get("extraction_status"):
+    status = data.get("extraction_status")
+    if not status:
         issues.append("Missing extraction_status")
 
     # Check activities
-    activities = data.get("section_b", {}).get("activities", [])
-    if data["extraction_status"] == "success" and not activities:
+    activities = (data.get("section_b") or {}).get("activities") or []
+    if status == "success" and not activities:
         issues.append("Status is 'success' but no activities found")
 
-    for i, act in enumerate(activities):
-        if not act.get("activity") and not act.get("description"):
-            issues.append(f"Activity {i+1} has no content")
+    issues.extend(f"Activity {i+1} has no content" for i, act in enumerate(activities)
+                  if not (act.get("activity") or act.get("description")))
 
     # Check metadata
     metadata = data.get("extraction_metadata", {})
@@ -204,6 +221,20 @@ def save_to_json(data: dict, output_path: str | Path, pretty: bool = True) -> bo
     try:
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
+        # orjson writes the same indented UTF-8 layout; anything it cannot
+        # encode (e.g. integers beyond 64 bits) goes through the json module
+        if ORJSON_AVAILABLE:
+            try:
+                options = orjson.OPT_NON_STR_KEYS  # e.g. page-number keys, as json does
+                if pretty:
+                    options |= orjson.OPT_INDENT_2
+                encoded = orjson.dumps(data, option=options)
+            except TypeError:
+                encoded = None
+            if encoded is not None:
+                output_path.write_bytes(encoded)
+                return True
+
         with open(output_path, 'w', encoding='utf-8') as f:
             if pretty:
                 json.dump(data, f, indent=2, ensure_ascii=False)
@@ -217,6 +248,54 @@ def save_to_json(data: dict, output_path: str | Path, pretty: bool = True) -> bo
         return False
 
 
+def save_batch_streaming(summary: dict, output_path: str | Path) -> bool:
+    """
+    Save a batch summary to a JSON file one result at a time.
+
+    Writes the same indented layout as save_to_json, but encodes each
+    document's result separately so the whole batch is never held as a
+    single encoded buffer. Without orjson this is save_to_json.
+
+    Args:
+        summary: Batch summary from merge_batch_results
+        output_path: Path to output JSON file
+
+    Returns:
+        True if successful, False otherwise
+    """
+    if not ORJSON_AVAILABLE:
+        return save_to_json(summary, output_path)
+
+    output_path = Path(output_path)
+    options = orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2
+
+    try:
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # The encoded batch_info object ends with "\n}"; the results array
+        # is written into it before that closing brace
+        head = orjson.dumps({"batch_info": summary["batch_info"]}, option=options)
+        results = summary["results"]
+
+        with open(output_path, 'wb') as f:
+            f.write(head[:-2] + b',\n  "results": [')
+            for i, result in enumerate(results):
+                try:
+                    encoded = orjson.dumps(result, option=options)
+                except TypeError:
+                    encoded = json.dumps(result, indent=2, ensure_ascii=False).encode('utf-8')
+                # Each result sits two levels deep in the file
+                f.write(b'\n    ' if i == 0 else b',\n    ')
+                f.write(encoded.replace(b'\n', b'\n    '))
+            f.write(b'\n  ]\n}' if results else b']\n}')
+
+        return True
+
+    except Exception as e:
+        logger.error(f"Error saving to {output_path}: {e}")
+        return False
+
+
 def load_from_json(json_path: str | Path) -> Optional[dict]:
     """
     Load structured data from a JSON file.
@@ -224,6 +303,15 @@ def load_from_json(json_path: str | Path) -> Optional[dict]:
     json_path = Path(json_path)
 
     try:
+        # orjson is stricter (no NaN, 64-bit integers only); anything it
+        # rejects is parsed again by the json module
+        if ORJSON_AVAILABLE:
+            raw = json_path.read_bytes()
+            try:
+                return orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                pass
+
         with open(json_path, 'r', encoding='utf-8') as f:
             return json.load(f)
     except Exception as e:
@@ -231,50 +319,48 @@ def load_from_json(json_path: str | Path) -> Optional[dict]:
         return None
 
 
-def merge_batch_results(results: list[dict]) -> dict:
+def merge_batch_results(results: Iterable[dict], keep_results: bool = True) -> dict:
     """
     Merge multiple extraction results into a batch summary.
 
     Args:
-        results: List of structured extraction results
+        results: Structured extraction results (any iterable, read once)
+        keep_results: Whether to include the results in the summary; if False
+            only the statistics are kept and "results" is empty
 
     Returns:
         Batch summary with statistics and all results
     """
-    summary = {
+    processed_at = datetime.utcnow().isoformat() + "Z"
+
+    statuses = Counter()
+    doc_types = Counter()
+    total_activities = 0
+    kept = []
+
+    for result in results:
+        statuses[result.get("extraction_status", "unknown")] += 1
+        doc_types[result.get("document_type", "unknown")] += 1
+        total_activities += len(result.get("section_b", {}).get("activities", []))
+        if keep_results:
+            kept.append(result)
+
+    total = sum(statuses.values())
+
+    return {
         "batch_info": {
-            "total_documents": len(results),
-            "successful": 0,
-            "failed": 0,
-            "no_data": 0,
-            "electronic_docs": 0,
-            "scanned_docs": 0,
-            "total_activities": 0,
-            "processed_at": datetime.utcnow().isoformat() + "Z"
+            "total_documents": total,
+            "successful": statuses["success"],
+            "failed": statuses["error"],
+            "no_data": total - statuses["success"] - statuses["error"],
+            "electronic_docs": doc_types["electronic"],
+            "scanned_docs": doc_types["scanned"],
+            "total_activities": total_activities,
+            "processed_at": processed_at
         },
-        "results": results
+        "results": kept
     }
 
-    for result in results:
-        status = result.get("extraction_status", "unknown")
-        if status == "success":
-            summary["batch_info"]["successful"] += 1
-        elif status == "error":
-            summary["batch_info"]["failed"] += 1
-        else:
-            summary["batch_info"]["no_data"] += 1
-
-        doc_type = result.get("document_type", "unknown")
-        if doc_type == "electronic":
-            summary["batch_info"]["electronic_docs"] += 1
-        elif doc_type == "scanned":
-            summary["batch_info"]["scanned_docs"] += 1
-
-        activities = result.get("section_b", {}).get("activities", [])
-        summary["batch_info"]["total_activities"] += len(activities)
-
-    return summary
-
 
 if __name__ == "__main__":
     import sys
@@ -22,6 +22,36 @@ from common import (
     calculate_special_char_ratio,
 )
 
+# The shared pattern lists, compiled once. is_form_instruction matches the
+# instruction patterns case-sensitively against lowercased text.
+_INSTRUCTION_RES = tuple(re.compile(p, re.IGNORECASE) for p in INSTRUCTION_PATTERNS)
+_INSTRUCTION_LOWER_RES = tuple(re.compile(p) for p in INSTRUCTION_PATTERNS)
+_PLACEHOLDER_RES = tuple(re.compile(p, re.IGNORECASE) for p in PLACEHOLDER_PATTERNS)
+
+# Content that is clearly not from the Section B table
+_NON_TABLE_CONTENT_RES = tuple(re.compile(p, re.IGNORECASE | re.MULTILINE) for p in [
+    r'Please\s+(?:describe|explain|provide|enter).*?(?:\.|$)',
+    r'Use\s+continuation\s+sheet\s+if\s+necessary',
+    r'See\s+guidance\s+notes',
+    r'Page\s+\d+\s+of\s+\d+',
+    r'CIC\s*36\s*\([^)]+\)',
+    r'Companies\s+House',
+    r'\d{8}',  # Company numbers
+    r'^[\s\-_=]+$',  # Decorative lines
+])
+
+_WHITESPACE_RUN_RE = re.compile(r'\s+')
+
+# Common OCR misreadings and their corrections, applied in one pass (the
+# misreadings cannot overlap). Group n of the pattern is _OCR_FIXES[n - 1].
+_OCR_FIXES = [
+    ('l1', 'll'),
+    ('0f', 'of'),
+    ('c0mmunity', 'community'),
+    ('act1vit', 'activit'),
+]
+_OCR_FIX_RE = re.compile('|'.join(f'({wrong})' for wrong, _ in _OCR_FIXES), re.IGNORECASE)
+
 
 def validate_activity_benefit_pair(activity: str, benefit: str,
                                     min_length: int = 20) -> dict:
@@ -55,6 +85,18 @@ def validate_activity_benefit_pair(activity: str, benefit: str,
         issues.append(f"Benefit too short ({len(benefit)} chars, min {min_length})")
         suggestions.append("Benefit description should explain community impact")
 
+    # Nothing for the content scans to find in an empty pair
+    if not activity and not benefit:
+        issues.append("Both activity and benefit are empty")
+        return {
+            "is_valid": False,
+            "quality_score": round(_calculate_quality_score(activity, benefit, issues), 2),
+            "issues": issues,
+            "suggestions": suggestions,
+            "activity_length": 0,
+            "benefit_length": 0
+        }
+
     # Check for OCR artifacts
     combined = activity + " " + benefit
     for artifact in OCR_ARTIFACTS:
@@ -63,16 +105,16 @@ def validate_activity_benefit_pair(activity: str, benefit: str,
             suggestions.append("Manual review recommended for OCR quality")
             break
 
-    # Check for instruction text
-    for pattern in INSTRUCTION_PATTERNS:
-        if re.search(pattern, activity, re.IGNORECASE):
+    # Check for instruction text (no pattern matches an empty field)
+    for instruction_re in _INSTRUCTION_RES:
+        if activity and instruction_re.search(activity):
             issues.append("Activity appears to be form instruction text")
-        if re.search(pattern, benefit, re.IGNORECASE):
+        if benefit and instruction_re.search(benefit):
             issues.append("Benefit appears to be form instruction text")
 
     # Check for placeholder text
-    for pattern in PLACEHOLDER_PATTERNS:
-        if re.search(pattern, combined, re.IGNORECASE):
+    for placeholder_re in _PLACEHOLDER_RES:
+        if placeholder_re.search(combined):
             issues.append("Placeholder or example text detected")
             break
 
@@ -83,9 +125,7 @@ def validate_activity_benefit_pair(activity: str, benefit: str,
         suggestions.append("Text may contain OCR noise")
 
     # Check for both fields present
-    if not activity and not benefit:
-        issues.append("Both activity and benefit are empty")
-    elif not activity:
+    if not activity:
         issues.append("Activity is empty")
     elif not benefit:
         issues.append("Benefit is empty")
@@ -140,23 +180,12 @@ def filter_non_table_content(text: str) -> str:
         return ""
 
     # Patterns to remove
-    removal_patterns = [
-        r'Please\s+(?:describe|explain|provide|enter).*?(?:\.|$)',
-        r'Use\s+continuation\s+sheet\s+if\s+necessary',
-        r'See\s+guidance\s+notes',
-        r'Page\s+\d+\s+of\s+\d+',
-        r'CIC\s*36\s*\([^)]+\)',
-        r'Companies\s+House',
-        r'\d{8}',  # Company numbers
-        r'^[\s\-_=]+$',  # Decorative lines
-    ]
-
     filtered = text
-    for pattern in removal_patterns:
-        filtered = re.sub(pattern, '', filtered, flags=re.IGNORECASE | re.MULTILINE)
+    for removal_re in _NON_TABLE_CONTENT_RES:
+        filtered = removal_re.sub('', filtered)
 
     # Clean up extra whitespace
-    filtered = re.sub(r'\s+', ' ', filtered)
+    filtered = _WHITESPACE_RUN_RE.sub(' ', filtered)
     filtered = filtered.strip()
 
     return filtered
@@ -177,8 +206,8 @@ def is_form_instruction(text: str) -> bool:
 
     text_lower = text.lower().strip()
 
-    for pattern in INSTRUCTION_PATTERNS:
-        if re.search(pattern, text_lower):
+    for instruction_re in _INSTRUCTION_LOWER_RES:
+        if instruction_re.search(text_lower):
             return True
 
     # Additional checks
@@ -240,20 +269,12 @@ def clean_extracted_text(text: str) -> str:
         cleaned = cleaned.replace(artifact, '')
 
     # Normalize whitespace
-    cleaned = re.sub(r'\s+', ' ', cleaned)
+    cleaned = _WHITESPACE_RUN_RE.sub(' ', cleaned)
 
     # Remove leading/trailing whitespace
     cleaned = cleaned.strip()
 
     # Fix common OCR errors
-    ocr_fixes = {
-        'l1': 'll',
-        '0f': 'of',
-        'c0mmunity': 'community',
-        'act1vit': 'activit',
-    }
-
-    for wrong, correct in ocr_fixes.items():
-        cleaned = re.sub(wrong, correct, cleaned, flags=re.IGNORECASE)
+    cleaned = _OCR_FIX_RE.sub(lambda m: _OCR_FIXES[m.lastindex - 1][1], cleaned)
 
     return cleaned
@@ -11,6 +11,23 @@ import re
 from typing import Optional
 
 
+# Header-row patterns, matched against lowercased row text (one search each)
+_ACTIVITY_HEADER_RE = re.compile('|'.join(f'(?:{p})' for p in [
+    r'activit',
+    r'what.*will.*company.*do',
+    r'describe.*activit',
+]))
+_BENEFIT_HEADER_RE = re.compile('|'.join(f'(?:{p})' for p in [
+    r'benefit',
+    r'community',
+    r'how.*will.*benefit',
+]))
+
+# Column header keywords for suggest_column_mapping (lowercased header)
+_ACTIVITY_COLUMN_RE = re.compile(r'activit')
+_BENEFIT_COLUMN_RE = re.compile(r'benefit|community')
+
+
 def validate_section_b_table(table_data: list) -> dict:
     """
     Validate that a table has the correct Section B structure.
@@ -92,26 +109,14 @@ def _find_header_row(table_data: list) -> tuple[int, dict]:
     Returns:
         Tuple of (header_row_index, header_info_dict)
     """
-    activity_patterns = [
-        r'activit',
-        r'what.*will.*company.*do',
-        r'describe.*activit',
-    ]
-
-    benefit_patterns = [
-        r'benefit',
-        r'community',
-        r'how.*will.*benefit',
-    ]
-
     for i, row in enumerate(table_data[:5]):  # Check first 5 rows
         if not row:
             continue
 
         row_text = ' '.join(str(cell or '').lower() for cell in row)
 
-        has_activity = any(re.search(p, row_text) for p in activity_patterns)
-        has_benefit = any(re.search(p, row_text) for p in benefit_patterns)
+        has_activity = _ACTIVITY_HEADER_RE.search(row_text) is not None
+        has_benefit = _BENEFIT_HEADER_RE.search(row_text) is not None
 
         if has_activity or has_benefit:
             return i, {"has_activity": has_activity, "has_benefit": has_benefit}
@@ -181,9 +186,9 @@ def suggest_column_mapping(headers: list) -> dict:
     for i, header in enumerate(headers):
         header_lower = header.lower()
 
-        if re.search(r'activit', header_lower):
+        if _ACTIVITY_COLUMN_RE.search(header_lower):
             mapping[i] = "activity"
-        elif re.search(r'benefit|community', header_lower):
+        elif _BENEFIT_COLUMN_RE.search(header_lower):
             mapping[i] = "benefit"
 
     return mapping